@@ -2,18 +2,9 @@ import click
 import json
 from matterflow import Workflow, WorkflowException
 from matterflow import NodeException
-from matterflow.nodes import ReadCsvNode
-from matterflow.nodes import WriteCsvNode
-from matterflow.nodes import ReadJsonNode
-from matterflow.nodes import WriteJsonNode
-from matterflow.nodes import WsConnectionNode
-from matterflow.nodes import WriteJsonToS3Node
-from matterflow.nodes import BatchPutToSitewiseNode
-from matterflow.nodes import MqttConnectionInNode
 
 import asyncio
 import time
-import io
 import os
 
 from matterflow.connection import *
@@ -30,41 +21,28 @@ class Config(object):
 
 pass_config = click.make_pass_decorator(Config, ensure=True)
 
-async def useMqttConnectionForConsuming(filenames, verbose, mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings):
-    mqtt_connection = ConnectionFactory.create_connection("Mqtt", mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings)
+async def useSubscriptionForReading(subscription, filenames, verbose, max_in_flight=1, batch_size=100, batch_mode=False, max_concurrency=None):
+    print("started useSubscriptionForReading")
 
-    print("started useMqttConnectionForConsuming")
-    await mqtt_connection.connect()
+    await consumeMessages(subscription, filenames, verbose, max_in_flight, batch_size, batch_mode, max_concurrency)
 
-async def useMqttConnectionForReading(filenames, verbose, mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings):
-    mqtt_connection = ConnectionFactory.create_connection("Mqtt", mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings)
-    print("started useMqttConnectionForReading")
+async def consumeMessages(subscription, filenames, verbose, max_in_flight, batch_size, batch_mode=False, max_concurrency=None):
+    """Run the flows for each message read from the connection, without delay.
 
-    while True:
-        message = await mqtt_connection.read_input()
-        input = json.dumps(message)
-        in_stream = io.BytesIO(input.encode('utf-8'))
-        sys.stdin = io.TextIOWrapper(in_stream, encoding='utf-8')        
-        await execute_async(filenames, verbose)
-        await asyncio.sleep(0.1)
-
-async def useWsConnectionForConsuming(filenames, verbose, websocket_connection_settings, websocket_input_settings, websocket_output_settings):
-    websocket_connection = ConnectionFactory.create_connection("Websocket", websocket_connection_settings, websocket_input_settings, websocket_output_settings)
-
-    print("started useWsConnectionForConsuming")
-    await websocket_connection.connect()
+    In batch mode, the flows run once over all messages taken from the queue
+    together (up to `batch_size`), rather than once per message.
+    """
+    rate = MessageRate()
 
-async def useWsConnectionForReading(filenames, verbose, websocket_connection_settings, websocket_input_settings, websocket_output_settings):
-    websocket_connection = ConnectionFactory.create_connection("Websocket", websocket_connection_settings, websocket_input_settings, websocket_output_settings)
-    print("started useWsConnectionForReading")
+    async def handle(message):
+        if batch_mode:
+            await execute_batch_async(filenames, verbose, payloads=message)
+        else:
+            await execute_async(filenames, verbose, payload=message, max_concurrency=max_concurrency)
+        if verbose:
+            click.echo(f"Processed message ({rate.per_second:.1f} msgs/sec)")
 
-    while True:
-        message = await websocket_connection.read_input()
-        input = json.dumps(message)
-        in_stream = io.BytesIO(input.encode('utf-8'))
-        sys.stdin = io.TextIOWrapper(in_stream, encoding='utf-8')        
-        await execute_async(filenames, verbose)
-        await asyncio.sleep(0.1)
+    await consume(subscription, handle, max_in_flight=max_in_flight, batch_size=batch_size, rate=rate, batched=batch_mode)
 
 async def usePeriodicTask(filenames, verbose, interval=5):
     """This task runs periodically every `0.1` seconds."""
@@ -91,6 +69,39 @@ async def useFileWatcherTask(file_path, filenames, verbose, interval=0.1):
         # Sleep for the specified interval before running again
         await asyncio.sleep(interval)
 
+async def useTimerTask(workflow_file, node_id, verbose, interval=1.0, max_concurrency=None):
+    """This task runs a timed node (e.g. a TimeBuffer) whenever its timer is due.
+
+    The timer is checked at least every `interval` seconds, so that timers
+    started by newly arrived messages are picked up.
+    """
+    while True:
+        now = time.time()
+        due = None
+
+        try:
+            plan = load_plan(workflow_file)
+            if node_id not in plan.nodes:
+                return
+
+            due = plan.next_timer(node_id, now)
+
+            if due is not None and due <= now:
+                if verbose:
+                    click.echo(f"Running timer of node {node_id}")
+                await plan.execute_timer(node_id, now, max_concurrency)
+                continue
+        except (OSError, ValueError) as e:
+            # e.g. the workflow file is being rewritten; retry after the interval
+            click.echo(f"Issues loading workflow file: {e}", err=True)
+            due = None
+        except WorkflowException as e:
+            click.echo(f"Issues during workflow execution\n{e}", err=True)
+            due = None
+
+        # Sleep until the timer is due, or for the interval before checking again
+        await asyncio.sleep(interval if due is None else min(interval, due - now))
+
 async def run_all_periodic_flows(filenames, verbose, interval=5):
 
     """ Start concurrent tasks and join  together """
@@ -106,13 +117,16 @@ async def run_all_periodic_flows(filenames, verbose, interval=5):
                 return
 
             try:
-                workflow = open_workflow(workflow_file)
-                execution_order = workflow.execution_order()
-                node_to_execute = workflow.get_node(execution_order[0])
+                plan = load_plan(workflow_file)
+                node_to_execute = plan.get_node(plan.execution_order[0])
 
                 ##create the periodic task
                 tasks.create_task(usePeriodicTask(filenames, verbose, interval))  # Runs every 5 seconds
 
+                ##create the timer tasks, e.g. to close time windows between runs
+                for node_id in plan.timed_nodes():
+                    tasks.create_task(useTimerTask(workflow_file, node_id, verbose))
+
             except OSError as e:
                 click.echo(f"Issues loading workflow file: {e}", err=True)
             except WorkflowException as e:
@@ -124,7 +138,7 @@ async def run_all_periodic_flows(filenames, verbose, interval=5):
 
     return results
 
-async def run_all_ws_flows(filenames, verbose):
+async def run_all_ws_flows(filenames, verbose, max_in_flight=1, batch_size=100, batch_mode=False, max_concurrency=None):
 
     """ Start concurrent tasks and join  together """
     print("Begin to start tasks...")
@@ -139,9 +153,12 @@ async def run_all_ws_flows(filenames, verbose):
                 return
 
             try:
-                workflow = open_workflow(workflow_file)
-                execution_order = workflow.execution_order()
-                node_to_execute = workflow.get_node(execution_order[0])
+                plan = load_plan(workflow_file)
+                node_to_execute = plan.get_node(plan.execution_order[0])
+
+                ##create the timer tasks, e.g. to close time windows without new messages
+                for node_id in plan.timed_nodes():
+                    tasks.create_task(useTimerTask(workflow_file, node_id, verbose, max_concurrency=max_concurrency))
 
                 if node_to_execute.name == 'Matter WS Connection (In)':
     #                connection_settings = json.loads(node_to_execute.option_values["connection"])
@@ -182,17 +199,27 @@ async def run_all_ws_flows(filenames, verbose):
                         "AWS IoT Core": False
                     }    
 
+                    ##share one socket per Matter server, with a queue per flow
+                    connection, created = ConnectionFactory.get_connection("Websocket", connection_settings, input_settings, output_settings)
+                    subscription = connection.subscribe()
+
                     ##create the tasks
-                    tasks.create_task(useWsConnectionForConsuming(filenames, verbose, connection_settings, input_settings, output_settings))
-                    tasks.create_task(useWsConnectionForReading(filenames, verbose, connection_settings, input_settings, output_settings))
+                    if created:
+                        tasks.create_task(useConnectionForConsuming(connection))
+                    tasks.create_task(useSubscriptionForReading(subscription, [workflow_file], verbose, max_in_flight, batch_size, batch_mode, max_concurrency))
                 elif node_to_execute.name == 'MQTT Connection (In)':
                     connection_settings = json.loads(node_to_execute.option_values["connection"])
                     input_settings  = json.loads(node_to_execute.option_values["input"])
                     output_settings = {"Topic": "sensors/response","QoS": 1,"Named Root": "sensor_data","Retain": False,"Breakup Arrays": False,"Template": "{temperature}","AWS IoT Core": False}    
 
+                    ##share one client per broker and user, with a queue per flow
+                    connection, created = ConnectionFactory.get_connection("Mqtt", connection_settings, input_settings, output_settings)
+                    subscription = connection.subscribe(input_settings.get("topics"))
+
                     ##create the tasks
-                    tasks.create_task(useMqttConnectionForConsuming(filenames, verbose, connection_settings, input_settings, output_settings))
-                    tasks.create_task(useMqttConnectionForReading(filenames, verbose, connection_settings, input_settings, output_settings))
+                    if created:
+                        tasks.create_task(useConnectionForConsuming(connection))
+                    tasks.create_task(useSubscriptionForReading(subscription, [workflow_file], verbose, max_in_flight, batch_size, batch_mode, max_concurrency))
 
                 elif node_to_execute.name == 'Read Json':
                     interval = node_to_execute.option_values["pollingTime"]
@@ -236,15 +263,26 @@ def event():
 @click.argument('filenames', type=click.Path(exists=True), nargs=-1)
 @click.option('--verbose', is_flag=True, help='Enables verbose mode.')
 @click.option('--interval', default=0)
-def execute(filenames, verbose, interval):
+@click.option('--max-in-flight', default=1, help='Maximum number of messages processed concurrently per flow. Runs of one flow are serialized, so values above 1 only help for flows run together.')
+@click.option('--batch-size', default=100, help='Maximum number of queued messages read at once.')
+@click.option('--batch-mode', is_flag=True, help='Run flows once per batch of queued messages instead of once per message.')
+@click.option('--max-concurrency', default=4, help='Maximum number of nodes executed at once per workflow.')
+def execute(filenames, verbose, interval, max_in_flight, batch_size, batch_mode, max_concurrency):
     if (interval > 0):
         asyncio.run(run_all_periodic_flows(filenames, verbose, interval=5))
     else:
-        asyncio.run(run_all_ws_flows(filenames, verbose))
+        asyncio.run(run_all_ws_flows(filenames, verbose, max_in_flight, batch_size, batch_mode, max_concurrency))
 
 
-async def execute_async(filenames, verbose):
-    """Execute Workflow file(s)."""
+async def execute_async(filenames, verbose, payload=None, max_concurrency=None):
+    """Execute Workflow file(s).
+
+    Args:
+        filenames - Workflow files to execute
+        verbose - True, for outputting debug information; False otherwise
+        payload - Decoded message to inject into the source node(s), if any
+        max_concurrency - Maximum number of nodes executed at once per workflow
+    """
     # Check whether to log to terminal, or redirect output
     log = click.get_text_stream('stdout').isatty()
 
@@ -259,80 +297,139 @@ async def execute_async(filenames, verbose):
             click.echo('Loading workflow file from %s' % workflow_file)
 
         try:
-            workflow = open_workflow(workflow_file)
-            execute_workflow(workflow, log, verbose)
+            plan = load_plan(workflow_file)
+            await execute_workflow(plan, log, verbose, payload, max_concurrency)
         except OSError as e:
             click.echo(f"Issues loading workflow file: {e}", err=True)
         except WorkflowException as e:
             click.echo(f"Issues during workflow execution\n{e}", err=True)
 
-def execute_workflow(workflow, log, verbose):
-    """Execute a workflow file, node-by-node.
-
-    Retrieves the execution order from the Workflow and iterates through nodes.
-    If any I/O nodes are present AND stdin/stdout redirection is provided in the
-    command-line, overwrite the stored options and then replace before saving.
+async def execute_batch_async(filenames, verbose, payloads):
+    """Execute Workflow file(s) over a batch of messages.
 
     Args:
-        workflow - Workflow object loaded from file
-        log - True, for outputting to terminal; False for stdout redirection
+        filenames - Workflow files to execute
         verbose - True, for outputting debug information; False otherwise
+        payloads - Decoded messages to inject into the source node(s)
     """
-    execution_order = workflow.execution_order()
+    # Check whether to log to terminal, or redirect output
+    log = click.get_text_stream('stdout').isatty()
+
+    # Execute each workflow in the args
+    for workflow_file in filenames:
+
+        if workflow_file is None:
+            click.echo('Please specify a workflow to run', err=True)
+            return
+
+        if log:
+            click.echo('Loading workflow file from %s' % workflow_file)
 
-    # Execute each node in the order returned by the Workflow
-    for node in execution_order:
         try:
-            node_to_execute = workflow.get_node(node)
-            original_file_option = pre_execute(workflow, node_to_execute, log)
+            plan = load_plan(workflow_file)
+            await execute_workflow_batch(plan, log, verbose, payloads)
+        except OSError as e:
+            click.echo(f"Issues loading workflow file: {e}", err=True)
+        except WorkflowException as e:
+            click.echo(f"Issues during workflow execution\n{e}", err=True)
 
-            if verbose:
-                print('Executing node of type ' + str(type(node_to_execute)))
+async def execute_workflow_batch(plan, log, verbose, payloads):
+    """Execute a compiled workflow once over a batch of messages.
 
-            # perform execution
-            executed_node = workflow.execute(node)
+    Like `execute_workflow()`, but each node runs once for all `payloads`,
+    see `WorkflowPlan.execute_batch()`. The batch runs in a thread pool, so
+    its I/O does not hold up the event loop.
 
-            # If file was replaced with stdin/stdout, restore original option
+    Args:
+        plan - WorkflowPlan compiled from the workflow file
+        log - True, for outputting to terminal; False for stdout redirection
+        verbose - True, for outputting debug information; False otherwise
+        payloads - Decoded messages to inject into the source node(s)
+    """
+    original_file_options = dict()
+    for node in plan.execution_order:
+        original_file_options[node] = pre_execute(plan, plan.get_node(node), log)
+
+    try:
+        if verbose:
+            print(f'Executing workflow over {len(payloads)} messages')
+
+        await plan.execute_batch_async(payloads)
+    except NodeException as e:
+        click.echo(f"Issues during node execution\n{e}", err=True)
+    finally:
+        # If file was replaced with stdin/stdout, restore original option
+        for node, original_file_option in original_file_options.items():
             if original_file_option is not None:
-                executed_node.option_values["file"] = original_file_option
+                plan.set_option(node, "file", original_file_option)
+
+    if verbose:
+        click.echo('Completed workflow execution!')
+
+async def execute_workflow(plan, log, verbose, payload=None, max_concurrency=None):
+    """Execute a compiled workflow, running independent branches concurrently.
+
+    Nodes start as soon as their predecessors have executed, see
+    `WorkflowPlan.execute_async()`. If any I/O nodes are present AND
+    stdin/stdout redirection is provided in the command-line, overwrite the
+    stored options and then restore them after execution. A `payload` (e.g.
+    an MQTT or Matter WebSocket message) is handed directly to the
+    connection node that starts the flow.
 
-            # Update Node in Workflow with changes (saved data file)
-            workflow.update_or_add_node(executed_node)
-        except NodeException as e:
-            click.echo(f"Issues during node execution\n{e}", err=True)
+    Args:
+        plan - WorkflowPlan compiled from the workflow file
+        log - True, for outputting to terminal; False for stdout redirection
+        verbose - True, for outputting debug information; False otherwise
+        payload - Decoded message to inject into the source node(s), if any
+        max_concurrency - Maximum number of nodes executed at once
+    """
+    original_file_options = dict()
+    for node in plan.execution_order:
+        node_to_execute = plan.get_node(node)
+        original_file_options[node] = pre_execute(plan, node_to_execute, log)
+
+        if verbose:
+            print('Executing node of type ' + str(type(node_to_execute)))
+
+    try:
+        # perform execution
+        await plan.execute_async(payload, max_concurrency)
+    except NodeException as e:
+        click.echo(f"Issues during node execution\n{e}", err=True)
+    finally:
+        # If file was replaced with stdin/stdout, restore original option
+        for node, original_file_option in original_file_options.items():
+            if original_file_option is not None:
+                plan.set_option(node, "file", original_file_option)
 
     if verbose:
         click.echo('Completed workflow execution!')
 
 
-def pre_execute(workflow, node_to_execute, log):
+def pre_execute(plan, node_to_execute, log):
     """Pre-execution steps, to overwrite file options with stdin/stdout.
 
     If stdin is not a tty, and the Node is ReadCsv, replace file with buffer.
     If stdout is not a tty, and the Node is WriteCsv, replace file with buffer.
 
     Args:
-        workflow - Workflow object loaded from file
+        plan - WorkflowPlan compiled from the workflow file
         node_to_execute - The Node to execute
         log - True, for outputting to terminal; False for stdout redirection
     """
     stdin = click.get_text_stream('stdin')
 
 
-    if type(node_to_execute) is ReadCsvNode and not stdin.isatty():
+    if node_to_execute.node_key == 'ReadCsvNode' and not stdin.isatty():
         new_file_location = stdin
-    elif type(node_to_execute) is WriteCsvNode and not log:
+    elif node_to_execute.node_key == 'WriteCsvNode' and not log:
         new_file_location = click.get_text_stream('stdout')
-    elif type(node_to_execute) is ReadJsonNode and not stdin.isatty():
+    elif node_to_execute.node_key == 'ReadJsonNode' and not stdin.isatty():
         new_file_location = stdin
         return None
-    elif type(node_to_execute) is WriteJsonNode and not log:
+    elif node_to_execute.node_key == 'WriteJsonNode' and not log:
         #this is important as we dont want to use stdin for files that are writing out to the file system
         return None
-    elif type(node_to_execute) is WsConnectionNode and not stdin.isatty():
-        new_file_location = stdin
-    elif type(node_to_execute) is MqttConnectionInNode and not stdin.isatty():
-        new_file_location = stdin
     else:
         # No file redirection needed
         return None
@@ -341,12 +438,36 @@ def pre_execute(workflow, node_to_execute, log):
     original_file_option = node_to_execute.option_values["file"]
 
     # replace with value from stdin and save
-    node_to_execute.option_values["file"] = new_file_location
-    workflow.update_or_add_node(node_to_execute)
+    plan.set_option(node_to_execute.node_id, "file", new_file_location)
 
     return original_file_option
 
 
+# Compiled workflows, indexed by file name. Each entry is (mtime, plan)
+_plans = dict()
+
+
+def load_plan(workflow_file):
+    """Compile a workflow file, reusing the plan until the file changes.
+
+    Args:
+        workflow_file - Path to the workflow JSON file
+
+    Returns:
+        WorkflowPlan for the current contents of the file
+    """
+    mtime = os.path.getmtime(workflow_file)
+    cached = _plans.get(workflow_file)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    plan = open_workflow(workflow_file).compile()
+    _plans[workflow_file] = (mtime, plan)
+
+    return plan
+
+
 def open_workflow(workflow_file):
     with open(workflow_file) as f:
         json_content = json.load(f)
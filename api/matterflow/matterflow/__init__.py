@@ -1,4 +1,7 @@
 from .workflow import Workflow, WorkflowException
 from .node import *
 from .node_factory import node_factory
+from .store import ResultStore, MemoryResultStore, FileResultStore
 from .connection import ConnectionFactory
+from .buffer import MessageBuffer
+from .expression import compile_expression, search_expression, expression_cache_info
@@ -0,0 +1,229 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class MessageBuffer:
+    """In-process, append-only buffer of messages.
+
+    Keeps buffered messages in memory and tracks their size and age as they
+    are appended, so adding a message costs the same however full the
+    buffer is. Optionally, every message is also appended to a write-ahead
+    log (JSONL, one `[timestamp, message]` per line) from which the buffer
+    is restored after a restart. Evictions are appended to the log as
+    `{"evict": before}` markers; the log is only rewritten once it holds
+    more evicted lines than live ones (and at least `compact_lines`).
+
+    Buffers live for the whole process, see `get`, so they survive the Node
+    objects that fill them.
+
+    Attributes:
+        size: Size in bytes of the buffered messages as a JSON array
+        flush_at: Time the owner of the buffer next wants to flush it, or
+            None; not interpreted by the buffer itself
+    """
+
+    _buffers = dict()
+    _buffers_lock = threading.Lock()
+
+    # Minimum number of dead lines in the log before it is compacted
+    compact_lines = 1000
+
+    def __init__(self, wal_path=None):
+        self.wal_path = wal_path
+        self.size = 0
+        self.flush_at = None
+
+        # (timestamp, size, message) of each buffered message
+        self._entries = deque()
+        self._lock = threading.RLock()
+        self._wal = None
+        # Lines of the log which no longer hold a buffered message
+        self._dead_lines = 0
+
+        if wal_path is not None:
+            self._recover()
+
+    @classmethod
+    def get(cls, name, wal_path=None):
+        """Return the process-wide buffer called `name`, creating it if needed.
+
+        Args:
+            name: Unique name of the buffer, e.g. based on the Node id
+            wal_path: Write-ahead log to use; None keeps the buffer in memory
+                only. An existing buffer switches logs, see `set_wal_path`.
+        """
+        with cls._buffers_lock:
+            buffer = cls._buffers.get(name)
+            if buffer is None:
+                buffer = cls(wal_path)
+                cls._buffers[name] = buffer
+                return buffer
+
+        if buffer.wal_path != wal_path:
+            buffer.set_wal_path(wal_path)
+        return buffer
+
+    def set_wal_path(self, wal_path):
+        """Start, stop or move the write-ahead log of a live buffer.
+
+        The previous log is removed, as it is no longer kept up to date.
+        Messages found in the new log (e.g. left by an earlier run) are
+        restored alongside the buffered ones, and all are written to it.
+        """
+        with self._lock:
+            if wal_path == self.wal_path:
+                return
+
+            self._close_wal()
+            self._dead_lines = 0
+            if self.wal_path is not None and os.path.exists(self.wal_path):
+                os.remove(self.wal_path)
+
+            self.wal_path = wal_path
+            if wal_path is None:
+                return
+
+            buffered = list(self._entries)
+            self._entries.clear()
+            self.size = 0
+            self._recover()
+
+            if buffered:
+                entries = sorted(list(self._entries) + buffered, key=lambda entry: entry[0])
+                self._entries = deque(entries)
+                self.size = sum(size for timestamp, size, message in entries)
+                self._rewrite_wal()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def created(self):
+        """Time the oldest buffered message was appended, or None."""
+        if not self._entries:
+            return None
+        return self._entries[0][0]
+
+    def messages(self):
+        """All buffered messages, without removing them."""
+        with self._lock:
+            return [message for timestamp, size, message in self._entries]
+
+    def age(self, now=None):
+        """Seconds since the first buffered message was appended."""
+        if self.created is None:
+            return 0
+        return (now or time.time()) - self.created
+
+    def append(self, message, timestamp=None):
+        """Add a message to the buffer (and write-ahead log).
+
+        Returns:
+            Size in bytes of the buffer after appending
+        """
+        timestamp = timestamp or time.time()
+        encoded = json.dumps(message)
+
+        with self._lock:
+            self._log([timestamp, message])
+            self._add(message, encoded, timestamp)
+            return self.size
+
+    def drain(self):
+        """Remove and return all buffered messages."""
+        with self._lock:
+            messages = [message for timestamp, size, message in self._entries]
+            self._entries.clear()
+            self.size = 0
+
+            self._close_wal()
+            self._dead_lines = 0
+            if self.wal_path is not None and os.path.exists(self.wal_path):
+                os.remove(self.wal_path)
+
+            return messages
+
+    def evict(self, before):
+        """Remove messages appended before time `before`.
+
+        Returns:
+            Number of messages removed
+        """
+        with self._lock:
+            removed = 0
+            while self._entries and self._entries[0][0] < before:
+                timestamp, size, message = self._entries.popleft()
+                self.size -= size
+                removed += 1
+
+            if removed and self.wal_path is not None:
+                self._log({"evict": before})
+                self._dead_lines += removed + 1
+                if self._dead_lines > max(len(self._entries), self.compact_lines):
+                    self._rewrite_wal()
+
+            return removed
+
+    def _add(self, message, encoded, timestamp):
+        # Same size as json.dump() of the list: the brackets for the first
+        # message, then a ", " separator for each further message
+        size = len(encoded) + 2
+        self.size += size
+        self._entries.append((timestamp, size, message))
+
+    def _log(self, entry):
+        if self.wal_path is None:
+            return
+        if self._wal is None:
+            self._wal = open(self.wal_path, 'a')
+        self._wal.write(json.dumps(entry) + '\n')
+        self._wal.flush()
+
+    def _close_wal(self):
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+
+    def _rewrite_wal(self):
+        self._close_wal()
+
+        # Replace the log in one step, so a crash leaves the old or new one
+        rewritten_path = self.wal_path + '.tmp'
+        with open(rewritten_path, 'w') as f:
+            for timestamp, size, message in self._entries:
+                f.write(json.dumps([timestamp, message]) + '\n')
+        os.replace(rewritten_path, self.wal_path)
+        self._dead_lines = 0
+
+    def _recover(self):
+        damaged = False
+
+        try:
+            with open(self.wal_path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Partially written line, e.g. from a crash
+                        damaged = True
+                        continue
+
+                    if isinstance(entry, dict):
+                        # Replay the eviction, as done by evict()
+                        self._dead_lines += 1
+                        while self._entries and self._entries[0][0] < entry["evict"]:
+                            timestamp, size, message = self._entries.popleft()
+                            self.size -= size
+                            self._dead_lines += 1
+                    else:
+                        timestamp, message = entry
+                        self._add(message, json.dumps(message), timestamp)
+        except FileNotFoundError:
+            return
+
+        if damaged:
+            # Rewrite the log so new entries start on a clean line
+            self._rewrite_wal()
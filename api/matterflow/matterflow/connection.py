@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from queue import Queue, Empty
+from collections import deque
 import json
 import pickle
 import time 
@@ -9,6 +10,10 @@ import aiomqtt
 import sys
 import random
 import os
+import threading
+import uuid
+import traceback
+import concurrent.futures
 
 class InputQueue(asyncio.PriorityQueue):
     def _put(self, item):
@@ -20,37 +25,420 @@ class InputQueue(asyncio.PriorityQueue):
     def _get(self):
         return super()._get()[1]
 
+def deep_sizeof(obj, seen=None):
+    """Approximate memory used by `obj`, including everything it contains."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_sizeof(key, seen) + deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_sizeof(item, seen)
+    return size
+
 class MemQueue(asyncio.Queue):
-    def __init__(self, maxsize=0, maxmemsize=0,refresh_interval=1.0, refresh_timeout=60):
+    """Queue bounded by number of items and by memory used by the items.
+
+    Items are stored as (size, item) tuples, where size is the deep size of
+    the item in bytes. When an item does not fit, the `overflow` policy
+    decides what happens:
+
+        - block: `put` waits until enough items are taken off the queue
+        - drop-oldest: the oldest items are discarded to make room
+        - drop-newest: the new item is discarded
+        - spill-to-disk: items are appended to a JSONL file and moved back
+          into the queue, in order, as space becomes available
+
+    An item larger than `maxmemsize` is still accepted by an empty queue.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop-oldest"
+    DROP_NEWEST = "drop-newest"
+    SPILL_TO_DISK = "spill-to-disk"
+
+    def __init__(self, maxsize=0, maxmemsize=0,refresh_interval=1.0, refresh_timeout=60, overflow=BLOCK, spill_path=None):
         super().__init__(maxsize)
         self.maxmemsize = maxmemsize
         self.refresh_interval = refresh_interval
         self.refresh_timeout = refresh_timeout
+        self.overflow = overflow
+
+        if spill_path is None:
+            DIR_PATH = os.getenv('DIR_PATH') or '/tmp'
+            spill_path = f"{DIR_PATH}/matterflow-queue-{os.getpid()}-{id(self)}.jsonl"
+        self.spill_path = spill_path
+
+        # Metrics
+        self.bytes = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.wait_time = 0.0
+
+        self._space_available = asyncio.Event()
+        self._spill_count = 0
+        self._spill_offset = 0
+
+    def _put(self, item):
+        self.bytes += item[0]
+        super()._put(item)
+
+    def _get(self):
+        item = super()._get()
+        self.bytes -= item[0]
+        return item
+
+    def _fits(self, item_size):
+        if self.maxsize > 0 and self.qsize() >= self.maxsize:
+            return False
+        if self.maxmemsize > 0 and not self.empty():
+            return self.bytes + item_size <= self.maxmemsize
+        return True
 
     async def put(self, item):
-        item_size = sys.getsizeof(item)
+        if self.overflow != MemQueue.BLOCK:
+            return self.put_nowait(item)
+
+        item_size = deep_sizeof(item)
+
+        if not self._fits(item_size):
+            started = time.monotonic()
+            while not self._fits(item_size):
+                self._space_available.clear()
+                await self._space_available.wait()
+            self.wait_time += time.monotonic() - started
 
-    	# specific locking code (see original class in GitHub)
         super().put_nowait((item_size, item))
 
     def put_nowait(self, item):
-        item_size = sys.getsizeof(item)
-        
-        if self.full(item_size):
+        item_size = deep_sizeof(item)
+
+        # Once spilling, keep spilling so items stay in order
+        if self._spill_count == 0 and self._fits(item_size):
+            super().put_nowait((item_size, item))
+        elif self.overflow == MemQueue.BLOCK:
             raise asyncio.QueueFull
-        super().put_nowait((item_size, item))
+        elif self.overflow == MemQueue.DROP_NEWEST:
+            self.dropped += 1
+        elif self.overflow == MemQueue.DROP_OLDEST:
+            while not self._fits(item_size):
+                super().get_nowait()
+                self.task_done()
+                self.dropped += 1
+            super().put_nowait((item_size, item))
+        elif self.overflow == MemQueue.SPILL_TO_DISK:
+            self._spill(item)
+        else:
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+
+    def get_nowait(self):
+        item = super().get_nowait()
+        self._unspill()
+        self._space_available.set()
+        return item
+
+    def _spill(self, item):
+        with open(self.spill_path, 'a') as f:
+            f.write(json.dumps(item) + '\n')
+        self._spill_count += 1
+        self.spilled += 1
+
+    def _unspill(self):
+        """Move spilled items back into the queue while they fit."""
+        if self._spill_count == 0:
+            return
+
+        with open(self.spill_path) as f:
+            f.seek(self._spill_offset)
+            while self._spill_count > 0:
+                position = f.tell()
+                item = json.loads(f.readline())
+                item_size = deep_sizeof(item)
+                if not self._fits(item_size):
+                    f.seek(position)
+                    break
+                super().put_nowait((item_size, item))
+                self._spill_count -= 1
+            self._spill_offset = f.tell()
+
+        if self._spill_count == 0:
+            os.remove(self.spill_path)
+            self._spill_offset = 0
+
+    def stats(self):
+        """Current queue metrics."""
+        return {
+            "depth": self.qsize() + self._spill_count,
+            "bytes": self.bytes,
+            "spilled_items": self._spill_count,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "wait_time": self.wait_time,
+        }
+
+    async def get_many(self, max_items):
+        """Wait for an item, then take up to `max_items` without waiting."""
+        items = [await self.get()]
+        while len(items) < max_items and not self.empty():
+            items.append(self.get_nowait())
+        return items
+
+
+class MessageRate:
+    """Measures message throughput over a sliding time window."""
+
+    def __init__(self, window=10.0):
+        self.window = window
+        self.total = 0
+        self._started = time.monotonic()
+        self._marks = deque()
+        self._count = 0
+
+    def mark(self, count=1):
+        now = time.monotonic()
+        self.total += count
+        self._count += count
+        self._marks.append((now, count))
+        self._expire(now)
+
+    def _expire(self, now):
+        while self._marks and now - self._marks[0][0] > self.window:
+            self._count -= self._marks.popleft()[1]
+
+    @property
+    def per_second(self):
+        now = time.monotonic()
+        self._expire(now)
+        elapsed = min(self.window, now - self._started)
+        if elapsed <= 0:
+            return 0.0
+        return self._count / elapsed
+
+class Subscription:
+    """A single flow's view of a connection.
+
+    Every subscription has its own queue, so each flow reading from a shared
+    connection sees every message (optionally restricted to `topics`), and
+    a message is queued for every flow with room without waiting for the
+    slower ones. Only a full queue with the blocking overflow policy holds
+    back the connection, see `BaseConnection.subscribe`.
+    """
+
+    def __init__(self, topics=None, **queue_settings):
+        self.topics = list(topics) if topics else None
+        # queue of 5 MiB max, and 1000 items max, unless configured otherwise
+        queue_settings.setdefault("maxsize", 1000)
+        queue_settings.setdefault("maxmemsize", 5*1024*1024)
+        self.queue = MemQueue(**queue_settings)
+
+    def accepts(self, topic):
+        """Whether a message received on `topic` is for this subscription."""
+        if self.topics is None or topic is None:
+            return True
+        topic = aiomqtt.Topic(str(topic))
+        return any(topic.matches(pattern) for pattern in self.topics)
 
-class BaseConnection(ABC):
+    async def read_input(self):
+        """Retrieve the next queued message."""
+        item_size, item = await self.queue.get()
+        # Notify the queue that the "work item" has been processed.
+        self.queue.task_done()
+        return item
+
+    async def read_many(self, max_items):
+        """Retrieve up to `max_items` queued messages, waiting for at least one.
+
+        A `None` message marks the end of the input and is passed through.
+        """
+        messages = []
+        for item_size, item in await self.queue.get_many(max_items):
+            # Notify the queue that the "work item" has been processed.
+            self.queue.task_done()
+            messages.append(item)
+        return messages
 
-    # create the shared queue for sharing inbound messages between webserver and websocket queues
-    # queue of 5 MiB max, and 1000 items max
-    _queue = MemQueue(maxsize=1000, maxmemsize=5*1024*1024)
+
+class MqttPublisher:
+    """Persistent MQTT client used to publish messages to one broker.
+
+    Publishers are pooled per (host, port, username), see `get`, and all run
+    on one background event loop, so both synchronous Nodes and async
+    connections can publish without opening a client per message. The client
+    connects on the first publish and reconnects after errors. Publishes are
+    pipelined: up to `max_in_flight` messages may await acknowledgement from
+    the broker at once.
+    """
+
+    _pool = dict()
+    _pool_lock = threading.Lock()
+    _loop = None
+    _loop_lock = threading.Lock()
+
+    def __init__(self, connection_settings, max_in_flight=100, reconnect_interval=1.0):
+        self.connection_settings = connection_settings
+        self.max_in_flight = max_in_flight
+        self.reconnect_interval = reconnect_interval
+
+        # Metrics
+        self.published = 0
+        self.failed = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+        self._messages = None
+        self._worker = None
+        self._connected = False
+        self._tasks = set()
+
+    @staticmethod
+    def pool_key(connection_settings):
+        return (connection_settings.get("host"), connection_settings.get("port"), connection_settings.get("username"))
+
+    @classmethod
+    def get(cls, connection_settings):
+        """Return the pooled publisher for a broker, creating it if needed."""
+        key = cls.pool_key(connection_settings)
+        with cls._pool_lock:
+            publisher = cls._pool.get(key)
+            if publisher is None:
+                publisher = cls(connection_settings)
+                cls._pool[key] = publisher
+        return publisher
+
+    @classmethod
+    def pool_stats(cls):
+        """Metrics of every pooled publisher, keyed by (host, port, username)."""
+        with cls._pool_lock:
+            return {key: publisher.stats() for key, publisher in cls._pool.items()}
+
+    @classmethod
+    def _get_loop(cls):
+        with cls._loop_lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                threading.Thread(target=cls._loop.run_forever, name="mqtt-publisher", daemon=True).start()
+        return cls._loop
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        """Queue a message for publishing, without waiting for the broker.
+
+        Can be called from any thread. Async callers can await the result
+        using `asyncio.wrap_future`.
+
+        Returns:
+            concurrent.futures.Future, resolving to the publish latency in
+            seconds, or raising the error (e.g. MqttError) which made the
+            publish fail
+        """
+        done = concurrent.futures.Future()
+        message = (time.monotonic(), topic, payload, qos, retain, done)
+        self._get_loop().call_soon_threadsafe(self._enqueue, message)
+        return done
+
+    def stats(self):
+        """Current publisher metrics."""
+        return {
+            "published": self.published,
+            "failed": self.failed,
+            "pending": (self._messages.qsize() if self._messages else 0) + len(self._tasks),
+            "latency": self.latency,
+            "avg_latency": self._total_latency / self.published if self.published else 0.0,
+            "max_latency": self.max_latency,
+        }
+
+    def _enqueue(self, message):
+        if self._worker is None:
+            self._messages = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+            self._worker.add_done_callback(self._stopped)
+        self._messages.put_nowait(message)
+
+    def _stopped(self, worker):
+        # Fail what is still queued; the next publish starts a new worker
+        if self._worker is worker:
+            self._worker = None
+        while not self._messages.empty():
+            self._fail(self._messages.get_nowait(), ConnectionError("MQTT publisher stopped"))
+
+    async def _run(self):
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        message = None
+
+        while True:
+            if message is None:
+                # Connect lazily, once there is something to publish
+                message = await self._messages.get()
+
+            session_started = False
+            try:
+                async with aiomqtt.Client(hostname=self.connection_settings["host"], port=self.connection_settings["port"], username=self.connection_settings.get("username"), password=self.connection_settings.get("password")) as client:
+                    session_started = True
+                    self._connected = True
+                    while self._connected:
+                        await in_flight.acquire()
+                        task = asyncio.create_task(self._send(client, message, in_flight))
+                        self._tasks.add(task)
+                        task.add_done_callback(self._tasks.discard)
+                        message = None
+                        message = await self._messages.get()
+            except Exception as e:
+                print(f"MQTT publisher connection error: {str(e)}")
+                if message is not None and (not session_started or not isinstance(e, aiomqtt.MqttError)):
+                    # The broker is unreachable, or the settings are wrong:
+                    # let the caller know instead of retrying this message.
+                    # Without its traceback, which holds this running frame
+                    # and would close it if the caller clears the frames.
+                    self._fail(message, e.with_traceback(None))
+                    message = None
+                await asyncio.sleep(self.reconnect_interval)
+
+    async def _send(self, client, message, in_flight):
+        started, topic, payload, qos, retain, done = message
+        try:
+            if not done.set_running_or_notify_cancel():
+                return
+            await client.publish(topic, payload=payload, qos=qos, retain=retain)
+        except Exception as e:
+            if isinstance(e, aiomqtt.MqttError):
+                # Reconnect before publishing the next message
+                self._connected = False
+            self._fail(message, e)
+        else:
+            latency = time.monotonic() - started
+            self.published += 1
+            self.latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self._total_latency += latency
+            done.set_result(latency)
+        finally:
+            in_flight.release()
+
+    def _fail(self, message, error):
+        done = message[-1]
+        self.failed += 1
+        print(f"Error in MQTT publish: {str(error)}")
+        if done.running() or done.set_running_or_notify_cancel():
+            done.set_exception(error)
+
+
+class BaseConnection(ABC):
 
     def __init__(self, connection_settings, input_settings, output_settings):
         self.connection_settings = connection_settings
         self.input_settings = input_settings
         self.output_settings = output_settings
 
+        # inbound messages are fanned out to one queue per subscribed flow
+        self.subscriptions = []
+        self._default_subscription = None
+
     @abstractmethod
     def connect(self):
         pass
@@ -69,6 +457,56 @@ class BaseConnection(ABC):
         """Sends data to the connection."""
         pass
 
+    def subscribe(self, topics=None, **queue_settings):
+        """Create a queue that receives a copy of every inbound message.
+
+        Args:
+            topics: Optional topic filters (MQTT wildcards allowed); messages
+                without a topic are always delivered
+            queue_settings: Passed to MemQueue, e.g. `overflow`. With the
+                default blocking policy a full queue holds back the shared
+                connection, so use `drop-oldest` or `spill-to-disk` for flows
+                that may fall behind.
+
+        Returns:
+            The new Subscription
+        """
+        subscription = Subscription(topics, **queue_settings)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.subscriptions.remove(subscription)
+
+    async def publish(self, message, topic=None):
+        """Hand an inbound message to every subscription that accepts it.
+
+        The message is queued at once wherever it fits, or handled by the
+        queue's overflow policy. Only then does this wait, concurrently,
+        for room in full queues with the blocking policy.
+        """
+        full = []
+        for subscription in list(self.subscriptions):
+            if subscription.accepts(topic):
+                try:
+                    subscription.queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    full.append(subscription.queue)
+
+        if full:
+            await asyncio.gather(*(queue.put(message) for queue in full))
+
+    @property
+    def default_subscription(self):
+        """Subscription used by `read_input` and `read_many`."""
+        if self._default_subscription is None:
+            self._default_subscription = self.subscribe()
+        return self._default_subscription
+
+    async def read_many(self, max_items):
+        """Retrieve up to `max_items` messages from the default subscription."""
+        return await self.default_subscription.read_many(max_items)
+
     def get_connection_settings(self):
         return self.connection_settings
 
@@ -134,130 +572,212 @@ class MQTTConnection(BaseConnection):
         async with aiomqtt.Client(hostname=self.connection_settings["host"], port=self.connection_settings["port"], username=self.connection_settings["username"], password=self.connection_settings["password"]) as client:
             self.client = client
 
-            #Subscribe to topics
-            if "topics" in self.input_settings:
-                for topic in self.input_settings["topics"]:
-                    await client.subscribe(topic)
+            #Subscribe to the topics of every flow sharing this connection
+            for topic in self.topics():
+                await client.subscribe(topic)
 
             print("MQTT connection established.")
 
-            async with asyncio.TaskGroup() as tg:
-                """Asynchronously listen for messages and enqueue them."""
-                async for message in client.messages:
-                    print(f"Received message from topic {message.topic}")
-                    message_data = {"topic": str(message.topic), "payload": message.payload.decode()}
-                    tg.create_task(self._queue.put(message_data))  # Spawn new coroutine
+            await self._receive(client.messages)
 
             # simulate i/o operation using sleep
             await asyncio.sleep(random.random())
 
 
+    async def _receive(self, messages):
+        """Publish inbound messages to the subscriptions, one at a time.
+
+        The next message is only read once the previous one is queued, so a
+        full queue holds back the reader (and the broker) rather than
+        piling up pending messages in memory.
+        """
+        async for message in messages:
+            print(f"Received message from topic {message.topic}")
+            message_data = {"topic": str(message.topic), "payload": message.payload.decode()}
+            await self.publish(message_data, topic=message.topic)
+
     async def disconnect(self):
         """Disconnect from the MQTT broker."""
         await self.client.disconnect()
         print("MQTT connection closed.")
 
+    def topics(self):
+        """Topics to subscribe to at the broker, for all subscriptions."""
+        topics = list(self.input_settings.get("topics", []))
+        for subscription in self.subscriptions:
+            for topic in subscription.topics or []:
+                if topic not in topics:
+                    topics.append(topic)
+        return topics
+
     async def read_input(self):
         """Retrieve messages from the queue asynchronously."""
-        while True:
-            # get a unit of work
-            Item_size, item = await self._queue.get()
-            if item is None:
-                break
-            # report
-
-            # Notify the queue that the "work item" has been processed.
-            self._queue.task_done()
-
-            # simulate i/o operation using sleep
-            await asyncio.sleep(0.1)
+        return await self.default_subscription.read_input()
 
-            return item
-        
     async def send_output(self, data):
-        # Connect to the MQTT broker
-        async with aiomqtt.Client(hostname=self.connection_settings["host"], port=self.connection_settings["port"], username=self.connection_settings["username"], password=self.connection_settings["password"]) as client:
-            """Publish a message to a specific topic."""
-            topic = data.get("topic", self.output_settings.get("default_topic"))
-            payload = data.get("payload")
-            qos = data.get("qos", 0)
-            retain = data.get("retain", False)
+        """Publish a message to a specific topic, using the pooled publisher."""
+        topic = data.get("topic", self.output_settings.get("default_topic"))
+        payload = data.get("payload")
+        qos = data.get("qos", 0)
+        retain = data.get("retain", False)
+
+        if topic and payload:
+            publisher = MqttPublisher.get(self.connection_settings)
+            await asyncio.wrap_future(publisher.publish(topic, payload, qos=qos, retain=retain))
+            print(f"Published data to MQTT topic {topic}: {payload}")
+        else:
+            print("Invalid output data for MQTT publish. Missing 'topic' or 'payload'.")
 
-            if topic and payload:
-                await client.publish(topic, payload, qos=qos, retain=retain)
-                print(f"Published data to MQTT topic {topic}: {payload}")
-            else:
-                print("Invalid output data for MQTT publish. Missing 'topic' or 'payload'.")
 
+class WebsocketConnection(BaseConnection):
+    """Long-lived connection to a Matter server WebSocket.
 
-            print("MQTT connection established.")
+    Inbound events are published to the subscriptions. Commands can be sent
+    concurrently by many flows over the same socket; responses are matched
+    to their command by `message_id`. If the socket drops, the connection is
+    re-established with exponential backoff and `start_listening` is sent
+    again.
+    """
 
+    # Seconds to wait before reconnecting, doubled after each failed attempt
+    reconnect_delay = 1.0
+    max_reconnect_delay = 60.0
+    # Seconds to wait for the response to a command
+    command_timeout = 30
 
-class WebsocketConnection(BaseConnection):
     def __init__(self, connection_settings, input_settings, output_settings):
         super().__init__(connection_settings, input_settings, output_settings)
         self.client = None
         self.input_data = None
 
+        self._pending = dict()
+        self._connected = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._closing = False
+
     async def connect(self):
+        """Keep a socket open to the Matter server until `disconnect`."""
         URL = f'http://{self.connection_settings["host"]}:{self.connection_settings["port"]}/ws'
-        async with aiohttp.ClientSession().ws_connect(URL) as ws:
-            self.client = ws 
+        self._closing = False
+        delay = self.reconnect_delay
+
+        async with aiohttp.ClientSession() as session:
+            while not self._closing:
+                try:
+                    async with session.ws_connect(URL) as ws:
+                        self.client = ws
+                        delay = self.reconnect_delay
+                        print("Websocket connection established.")
+
+                        await self._start_listening()
+                        self._connected.set()
+                        await self._receive(ws)
+                except Exception as e:
+                    # Network errors, but also e.g. a malformed frame: none
+                    # of them should leave the flows without input
+                    print(f"Websocket connection error: {e!r}")
+                finally:
+                    self._connected.clear()
+                    self.client = None
+                    self._fail_pending(ConnectionError("Websocket connection closed"))
+
+                if not self._closing:
+                    print(f"Reconnecting to Websocket in {delay:.1f} seconds")
+                    await asyncio.sleep(delay * (1 + random.random() / 10))
+                    delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _start_listening(self):
+        # The response (a dump of all nodes) is published to the flows
+        message_object = {
+            "message_id": uuid.uuid4().hex,
+            "command": "start_listening"
+        }
+
+        print("Starting to Listen - Sending command")
+        async with self._send_lock:
+            await self.client.send_str(json.dumps(message_object))
+
+    async def _receive(self, ws):
+        # Like MQTTConnection._receive, a full queue holds back the reader;
+        # responses to commands then wait behind the queued events too
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                message_response = msg.json()
+
+                # Responses to commands go back to the sender only
+                response = self._pending.pop(message_response.get("message_id"), None)
+                if response is not None:
+                    if not response.done():
+                        response.set_result(message_response)
+                    continue
+
+                await self.publish(message_response)
+
+    def _fail_pending(self, error):
+        pending, self._pending = self._pending, dict()
+        for response in pending.values():
+            if not response.done():
+                response.set_exception(error)
 
-            print("Websocket connection established.")
+    async def disconnect(self):
+        self._closing = True
+        if self.client is not None:
+            await self.client.close()
+        print("Websocket connection closed.")
 
-            try:
-                rand_message_id = str(random.randint(1, 9999999) )
-                message_object = {
-                    "message_id": rand_message_id,
-                    "command": "start_listening"
-                }
-                
-                print("Starting to Listen - Sending command")
-                await ws.send_str(json.dumps(message_object))
-            except:
-                print("Connect Listening Set Up Error")        
-
-            async with asyncio.TaskGroup() as tg:
-                async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        message_response = msg.json()
-                        print("got message from ws sending to queue")
-                        #print(message_response)
-                        tg.create_task(self._queue.put(message_response))  # Spawn new coroutine
+    async def command(self, command, args=None, timeout=None):
+        """Send a command to the Matter server and wait for its response.
 
+        Waits for the connection to be (re-)established first. Safe to call
+        concurrently from many flows.
 
-            # simulate i/o operation using sleep
-            await asyncio.sleep(random.random())
+        Args:
+            command: Matter server command, e.g. "get_node"
+            args: Optional command arguments
+            timeout: Seconds to wait, defaults to `command_timeout`
 
-    async def disconnect(self):
-        await self.client.disconnect()
-        print("Websocket connection closed.")
+        Returns:
+            The response message
 
+        Raises:
+            ConnectionError: the socket closed before the response arrived
+            TimeoutError: no response within `timeout` seconds
+        """
+        timeout = self.command_timeout if timeout is None else timeout
 
-    async def read_input(self):
-        while True:
-            # get a unit of work
-            Item_size, item = await self._queue.get()
-            if item is None:
-                break
-            # report
+        message_id = uuid.uuid4().hex
+        message_object = {"message_id": message_id, "command": command}
+        if args is not None:
+            message_object["args"] = args
 
-            # Notify the queue that the "work item" has been processed.
-            self._queue.task_done()
+        async with asyncio.timeout(timeout):
+            await self._connected.wait()
 
-            # simulate i/o operation using sleep
-            await asyncio.sleep(0.1)
+            response = asyncio.get_running_loop().create_future()
+            self._pending[message_id] = response
+            try:
+                async with self._send_lock:
+                    await self.client.send_str(json.dumps(message_object))
+                return await response
+            finally:
+                self._pending.pop(message_id, None)
 
-            return item
+    async def read_input(self):
+        return await self.default_subscription.read_input()
 
     async def send_output(self, data):
-        URL = f'http://{self.connection_settings["host"]}:{self.connection_settings["port"]}/ws'
-        async with aiohttp.ClientSession().ws_connect(URL) as ws:
-            self.client = ws 
-
-            print("Websocket connection established.")
-            await ws.send_str(item)
+        """Send data over the shared socket.
+
+        A message with a "command" is sent with `command` and its response
+        returned; anything else is sent as-is.
+        """
+        if isinstance(data, dict) and "command" in data:
+            return await self.command(data["command"], data.get("args"))
+
+        item = data if isinstance(data, str) else json.dumps(data)
+        await self._connected.wait()
+        async with self._send_lock:
+            await self.client.send_str(item)
         print(f"Published data to Websocket: {item}")
 
 
@@ -330,6 +850,9 @@ class FileConnection(BaseConnection):
         print(f"Sending data to Webhook: {data}")
 
 class ConnectionFactory:
+    # upstream connections shared between flows, see `get_connection`
+    _connections = dict()
+
     @staticmethod
     def create_connection(connection_type, connection_settings, input_settings, output_settings):
         if connection_type == "Websocket":
@@ -339,40 +862,116 @@ class ConnectionFactory:
         else:
             raise ValueError(f"Unknown connection type: {connection_type}")
 
+    @staticmethod
+    def connection_key(connection_type, connection_settings):
+        """Identify the upstream server (and account) a connection talks to."""
+        key = (connection_type, connection_settings.get("host"), connection_settings.get("port"))
+        if connection_type == "Mqtt":
+            key += (connection_settings.get("username"),)
+        return key
 
-async def useWsConnectionForConsuming(websocket_connection_settings, websocket_input_settings, websocket_output_settings):
-    websocket_connection = ConnectionFactory.create_connection("Websocket", websocket_connection_settings, websocket_input_settings, websocket_output_settings)
+    @staticmethod
+    def get_connection(connection_type, connection_settings, input_settings, output_settings):
+        """Return the shared connection to a server, creating it if needed.
+
+        Flows reading from the same server share one connection; each flow
+        should `subscribe` to get its own queue of messages.
+
+        Returns:
+            (connection, created) where `created` is True if the caller
+            is responsible for starting the connection
+        """
+        key = ConnectionFactory.connection_key(connection_type, connection_settings)
+        connection = ConnectionFactory._connections.get(key)
+        if connection is not None:
+            return connection, False
+
+        connection = ConnectionFactory.create_connection(connection_type, connection_settings, input_settings, output_settings)
+        ConnectionFactory._connections[key] = connection
+        return connection, True
+
+
+async def consume(subscription, handler, max_in_flight=1, batch_size=100, rate=None, batched=False):
+    """Process a subscription's queued messages as fast as `handler` allows.
+
+    Messages are drained from the queue in batches of up to `batch_size`.
+    At most `max_in_flight` calls to `handler` run at once; further messages
+    stay in the (bounded) queue, which in turn holds back the producer.
+
+    Runs of one WorkflowPlan are serialized (see `execute_async`), so a
+    `max_in_flight` above 1 only helps when `handler` runs several flows;
+    for a single flow the extra messages just wait for the run lock.
+
+    An exception raised by `handler` is printed and the message dropped;
+    it does not stop the consumer.
+
+    Args:
+        subscription: Subscription (or connection) to read from
+        handler: Coroutine function called with each message
+        max_in_flight: Maximum number of messages handled concurrently
+        batch_size: Maximum number of messages taken from the queue at once
+        rate: Optional MessageRate, marked for every handled message
+        batched: If True, `handler` is called with each list of messages
+            taken from the queue instead of with single messages
+    """
+    in_flight = asyncio.Semaphore(max_in_flight)
+    tasks = set()
+
+    async def handle(message, count):
+        try:
+            await handler(message)
+        finally:
+            in_flight.release()
+            if rate is not None:
+                rate.mark(count)
+
+    def done(task):
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            print(f"Error handling message: {error!r}")
+            traceback.print_exception(error)
+
+    async def start(message, count):
+        await in_flight.acquire()
+        task = asyncio.create_task(handle(message, count))
+        tasks.add(task)
+        task.add_done_callback(done)
 
-    print("started useWsConnectionForConsuming")
-    await websocket_connection.connect()
+    while True:
+        messages = await subscription.read_many(batch_size)
 
-async def useWsConnectionForReading(websocket_connection_settings, websocket_input_settings, websocket_output_settings):
-    websocket_connection = ConnectionFactory.create_connection("Websocket", websocket_connection_settings, websocket_input_settings, websocket_output_settings)
-    print("started useWsConnectionForReading")
+        finished = None in messages
+        if finished:
+            messages = messages[:messages.index(None)]
 
-    while True:
-        message = await websocket_connection.read_input()
-        print("received message:")
-        print(message)
-        await asyncio.sleep(0.1)
+        if batched:
+            if messages:
+                await start(messages, len(messages))
+        else:
+            for message in messages:
+                await start(message, 1)
 
-async def useMqttConnectionForConsuming(filenames, verbose, mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings):
-    mqtt_connection = ConnectionFactory.create_connection("Mqtt", mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings)
+        if finished:
+            # Errors were already reported by done()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return
 
-    print("started useMqttConnectionForConsuming")
-    await mqtt_connection.connect()
+        # Let the producer and other flows run between batches
+        await asyncio.sleep(0)
 
-async def useMqttConnectionForReading(filenames, verbose, mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings):
-    mqtt_connection = ConnectionFactory.create_connection("Mqtt", mqtt_connection_settings, mqtt_input_settings, mqtt_output_settings)
-    print("started useMqttConnectionForReading")
+
+async def useConnectionForConsuming(connection):
+    print("started useConnectionForConsuming")
+    await connection.connect()
+
+async def useSubscriptionForReading(subscription):
+    print("started useSubscriptionForReading")
 
     while True:
-        message = await mqtt_connection.read_input()
-        input = json.dumps(message)
-        in_stream = io.BytesIO(input.encode('utf-8'))
-        sys.stdin = io.TextIOWrapper(in_stream, encoding='utf-8')        
-        await execute_async(filenames, verbose)
-        await asyncio.sleep(0.1)
+        message = await subscription.read_input()
+        print("received message:")
+        print(message)
 
 
 async def run_all_ws_flows(connection_settings, input_settings, output_settings):
@@ -380,9 +979,14 @@ async def run_all_ws_flows(connection_settings, input_settings, output_settings)
     print("Begin to start tasks...")
     results = []
 
+    websocket_connection, created = ConnectionFactory.get_connection("Websocket", connection_settings, input_settings, output_settings)
+
     async with asyncio.TaskGroup() as tasks:
-        tasks.create_task(useWsConnectionForConsuming(connection_settings, input_settings, output_settings))
-        tasks.create_task(useWsConnectionForReading(connection_settings, input_settings, output_settings))
+        # Two readers sharing one socket, each receiving every message
+        for _ in range(2):
+            tasks.create_task(useSubscriptionForReading(websocket_connection.subscribe()))
+        if created:
+            tasks.create_task(useConnectionForConsuming(websocket_connection))
 
     print(f"All flows done")
 
@@ -0,0 +1,39 @@
+import functools
+
+import jmespath
+
+# Number of compiled JMESPath expressions kept by compile_expression()
+EXPRESSION_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression):
+    """Compile a JMESPath expression, reusing earlier compilations.
+
+    Flows evaluate the same few expressions for every message, so parsing
+    is done once per expression and shared by all Nodes in the process.
+
+    Args:
+        expression: JMESPath expression string
+
+    Returns:
+        Compiled expression with a `search(data)` method
+
+    Raises:
+        jmespath.exceptions.ParseError: `expression` is not valid JMESPath
+    """
+    return jmespath.compile(expression)
+
+
+def search_expression(expression, data):
+    """Drop-in replacement for `jmespath.search` using the shared cache."""
+    return compile_expression(expression).search(data)
+
+
+def expression_cache_info():
+    """Hits, misses, maxsize and current size of the expression cache."""
+    return compile_expression.cache_info()
+
+
+def clear_expression_cache():
+    compile_expression.cache_clear()
@@ -1,5 +1,6 @@
 from .parameters import *
 import io
+import json
 
 class Node:
     """Node object
@@ -8,6 +9,17 @@ class Node:
     options = Options()
     option_types = OptionTypes()
 
+    # (node_type, node_key) -> class of every Node in matterflow.nodes
+    node_classes = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Register Nodes defined in matterflow.nodes.<node_type>.<module>
+        package = cls.__module__.split('.')
+        if len(package) == 4 and package[:2] == ['matterflow', 'nodes']:
+            Node.node_classes[(package[2], cls.__name__)] = cls
+
     def __init__(self, node_info):
         self.name = node_info.get('name')
         self.node_id = node_info.get('node_id')
@@ -28,6 +40,62 @@ class Node:
     def execute(self, predecessor_data, flow_vars):
         raise NotImplementedError()
 
+    def execute_batch(self, batch, flow_vars):
+        """Execute the Node on a batch of messages.
+
+        By default calls `execute()` once per message. Nodes that can share
+        work between messages (compiling queries, opening files or clients)
+        override this.
+
+        Args:
+            batch: list with the predecessor data of each message, i.e. a
+                list of the `predecessor_data` lists passed to `execute()`
+            flow_vars: Execution options, shared by all messages
+
+        Returns:
+            list with one output per message: a JSON string or decoded
+            object, or the ResourceWarning/NodeException which rejected
+            that message
+        """
+        outputs = list()
+
+        for predecessor_data in batch:
+            try:
+                outputs.append(self.execute(predecessor_data, flow_vars))
+            except (ResourceWarning, NodeException) as e:
+                outputs.append(e)
+
+        return outputs
+
+    def read_payload(self, payload, flow_vars):
+        """Execute the Node on a message injected by the workflow runner.
+
+        Only source Nodes with `accepts_payload` set implement this. The
+        payload is the decoded message (e.g. from MQTT or the Matter
+        WebSocket) and replaces whatever the Node would otherwise read.
+        """
+        raise NotImplementedError()
+
+    def next_timer(self, flow_vars, now):
+        """Time at which the Node next wants `on_timer()` to be called.
+
+        Only Nodes with `timed` set implement this, e.g. to flush a time
+        window when no further message arrives.
+
+        Returns:
+            Timestamp (seconds since the epoch), or None if there is
+            nothing to do until the Node next executes
+        """
+        return None
+
+    def on_timer(self, now, flow_vars):
+        """Execute the Node because its timer fired, see `next_timer()`.
+
+        Returns output like `execute()`, or raises ResourceWarning if there
+        is nothing to pass on to successor Nodes.
+        """
+        raise NotImplementedError()
+
     def get_execution_options(self, workflow, flow_nodes):
         """Replace Node options with flow variables.
 
@@ -50,19 +118,24 @@ class Node:
 
         # TODO: Can we iterate through flow_vars instead?
         #       If none are included, we can just return `self.options`.
+        # `self.options` is shared, so options are cloned before replacing
+        # their value
         for key, option in self.options.items():
 
             if key in flow_nodes:
                 replacement_value = flow_nodes[key].get_replacement_value()
+                option = option.clone()
                 option.set_value(replacement_value)
             else:
                 replacement_value = option.get_value()
 
             if key == 'file' and type(replacement_value) == io.TextIOWrapper:
                 # For files specified via stdin/stdout, store directly
+                option = option.clone()
                 option.set_value(replacement_value)
             elif key == 'file':
                 # Otherwise, point to filepath stored in Workflow directory
+                option = option.clone()
                 option.set_value(workflow.path(replacement_value))
 
             execution_options[key] = option
@@ -170,3 +243,29 @@ class NodeException(Exception):
 
     def __str__(self):
         return self.action + ': ' + self.reason
+
+
+def copy_on_write(data):
+    """Shallow copy of a dict or list that a Node is about to modify.
+
+    Node input may be the same object other Nodes received (see
+    MemoryResultStore), so it must not be modified in place. Instead of
+    copying the whole input, Nodes copy only the containers they change.
+    Other values are returned as they are.
+    """
+    if isinstance(data, dict):
+        return dict(data)
+    elif isinstance(data, list):
+        return list(data)
+    return data
+
+
+def as_output(data):
+    """Return `data` as Node output without a JSON round-trip.
+
+    Dicts and lists are returned as they are. Other values are encoded as
+    JSON, because a string returned by a Node is read as JSON.
+    """
+    if isinstance(data, (dict, list)):
+        return data
+    return json.dumps(data)
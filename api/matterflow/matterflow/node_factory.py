@@ -1,122 +1,68 @@
-from .nodes import *
+from . import nodes
+from .node import Node
+import functools
 import importlib
 
+# Sub-packages of matterflow.nodes holding the built-in Nodes
+NODE_TYPES = ('io', 'cloud', 'manipulation', 'flow_control', 'visualization', 'connection')
+
 
 def node_factory(node_info):
-    # Create a new Node with info
+    """Create a new Node with info.
+
+    The Node class is looked up by 'node_type' and 'node_key'. Any
+    'node_type' other than the built-in ones is a custom Node, imported
+    from its 'filename' in the custom_nodes directory.
+
+    Returns:
+        The new Node, or None if no Node class matches `node_info`.
+    """
     # TODO: should perform error-checking or add default values if missing
     node_type = node_info.get('node_type')
     node_key = node_info.get('node_key')
 
-    if node_type == 'io':
-        new_node = io_node(node_key, node_info)
-    elif node_type == 'cloud':
-        new_node = cloud_node(node_key, node_info)
-    elif node_type == 'manipulation':
-        new_node = manipulation_node(node_key, node_info)
-    elif node_type == 'flow_control':
-        new_node = flow_node(node_key, node_info)
-    elif node_type == 'visualization':
-        new_node = visualization_node(node_key, node_info)
-    elif node_type == 'connection':
-        new_node = connection_node(node_key, node_info)
-    else:
-        new_node = custom_node(node_key, node_info)
-
-    return new_node
-
-def connection_node(node_key, node_info):
-    if node_key == 'WsConnectionNode':
-        return WsConnectionNode(node_info)
-    elif node_key == 'MqttConnectionInNode':
-        return MqttConnectionInNode(node_info)
-    elif node_key == 'MqttConnectionOutNode':
-        return MqttConnectionOutNode(node_info)
-    else:
-        return None
+    if node_type not in NODE_TYPES:
+        return custom_node(node_key, node_info)
 
-def flow_node(node_key, node_info):
-    if node_key == 'StringNode':
-        return StringNode(node_info)
-    elif node_key == 'IntegerNode':
-        return IntegerNode(node_info)
-    elif node_key == 'DynamicNode':
-        return DynamicNode(node_info)
-    else:
+    node_class = get_node_class(node_type, node_key)
+    if node_class is None:
         return None
 
-
-def io_node(node_key, node_info):
-    if node_key == 'ReadCsvNode':
-        return ReadCsvNode(node_info)
-    elif node_key == 'TableCreatorNode':
-        return TableCreatorNode(node_info)
-    elif node_key == 'WriteCsvNode':
-        return WriteCsvNode(node_info)
-    elif node_key == 'ReadJsonNode':
-        return ReadJsonNode(node_info)
-    elif node_key == 'WriteJsonNode':
-        return WriteJsonNode(node_info)
-    elif node_key == 'WriteJsonToCsvNode':
-        return WriteJsonToCsvNode(node_info)
-    else:
-        return None
+    return node_class(node_info)
 
 
-def manipulation_node(node_key, node_info):
-    if node_key == 'JoinNode':
-        return JoinNode(node_info)
-    elif node_key == 'PivotNode':
-        return PivotNode(node_info)
-    elif node_key == 'FilterNode':
-        return FilterNode(node_info)
-    elif node_key == 'UnflattenAttributesNode':
-        return UnflattenAttributesNode(node_info)
-    elif node_key == 'MappingNode':
-        return MappingNode(node_info)
-    elif node_key == 'CombineNode':
-        return CombineNode(node_info)
-    elif node_key == 'SizeBufferNode':
-        return SizeBufferNode(node_info)
-    elif node_key == 'TimeBufferNode':
-        return TimeBufferNode(node_info)
-    elif node_key == 'MergeJsonNode':
-        return MergeJsonNode(node_info)
-    elif node_key == 'TranslateAttributesNode':
-        return TranslateAttributesNode(node_info)
-    elif node_key == 'JsonToCsvNode':
-        return JsonToCsvNode(node_info)
-    else:
-        return None
+def get_node_class(node_type, node_key):
+    """Built-in Node class registered as (`node_type`, `node_key`).
 
+    Node classes register themselves when their module is imported (see
+    `Node.__init_subclass__`), which happens on first use.
+    """
+    node_class = Node.node_classes.get((node_type, node_key))
+    if node_class is not None:
+        return node_class
 
-def visualization_node(node_key, node_info):
-    if node_key == 'GraphNode':
-        return GraphNode(node_info)
-    else:
+    module = nodes.NODE_MODULES.get(node_key)
+    if module is None or not module.startswith(f'matterflow.nodes.{node_type}.'):
         return None
 
-def cloud_node(node_key, node_info):
-    if node_key == 'WriteJsonToS3Node':
-        return WriteJsonToS3Node(node_info)
-    elif node_key == 'BatchPutToSitewiseNode':
-        return BatchPutToSitewiseNode(node_info)
-    elif node_key == 'WriteJsonToGCPNode':
-        return WriteJsonToGCPNode(node_info)
-    elif node_key == 'WriteJsonToAzureNode':
-        return WriteJsonToAzureNode(node_info)
-    else:
-        return None
+    importlib.import_module(module)
+    return Node.node_classes.get((node_type, node_key))
 
 
 def custom_node(node_key, node_info):
     try:
-        filename = node_info.get('filename')
-        module = importlib.import_module(f'matterflow.nodes.custom_nodes.{filename}')
-        my_class = getattr(module, node_key)
+        my_class = get_custom_node_class(node_info.get('filename'), node_key)
         instance = my_class(node_info)
 
         return instance
     except Exception as e:
         # print(str(e))
         return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_custom_node_class(filename, node_key):
+    # Lookups that fail raise, so they are not cached and are retried, e.g.
+    # once the custom Node has been uploaded
+    module = importlib.import_module(f'matterflow.nodes.custom_nodes.{filename}')
+    return getattr(module, node_key)
@@ -1,6 +1,36 @@
-from .flow_control import *
-from .io import *
-from .manipulation import *
-from .visualization import *
-from .connection import *
-from .cloud import *
+import importlib
+import sys
+
+
+def lazy_nodes(package, node_modules):
+    """Module `__getattr__` which imports Node classes on first access.
+
+    Node modules pull in heavy dependencies (pandas, cloud SDKs), so a
+    package only lists where its Nodes live and each module is imported
+    the first time one of its Nodes is used.
+
+    Args:
+        package: Name of the package, i.e. `__name__`
+        node_modules: dict of Node class name -> module, relative to `package`
+    """
+    def __getattr__(name):
+        if name not in node_modules:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        node_class = getattr(importlib.import_module(node_modules[name], package), name)
+        setattr(sys.modules[package], name, node_class)
+        return node_class
+
+    return __getattr__
+
+
+from . import flow_control, io, manipulation, visualization, connection, cloud
+
+# Node class name -> module, for all built-in Nodes
+NODE_MODULES = dict()
+for _package in (flow_control, io, manipulation, visualization, connection, cloud):
+    for _name, _module in _package.NODE_MODULES.items():
+        NODE_MODULES[_name] = _package.__name__ + _module
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
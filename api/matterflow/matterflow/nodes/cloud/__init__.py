@@ -1,4 +1,12 @@
-from .write_json_to_s3 import WriteJsonToS3Node
-from .batch_put_to_sitewise import BatchPutToSitewiseNode
-from .write_json_to_gcp import WriteJsonToGCPNode
-from .write_json_to_azure import WriteJsonToAzureNode
\ No newline at end of file
+from matterflow.nodes import lazy_nodes
+
+# Node class name -> module, imported when the Node is first used
+NODE_MODULES = {
+    "WriteJsonToS3Node": ".write_json_to_s3",
+    "BatchPutToSitewiseNode": ".batch_put_to_sitewise",
+    "WriteJsonToGCPNode": ".write_json_to_gcp",
+    "WriteJsonToAzureNode": ".write_json_to_azure",
+}
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
@@ -1,10 +1,9 @@
 from matterflow.node import IONode, NodeException
 from matterflow.parameters import *
 import json
-import jmespath
+from matterflow.expression import search_expression
 from io import StringIO  # for handling in-memory text streams
 import boto3
-import pandas as pd
 
 class BatchPutToSitewiseNode(IONode):
     """BatchPutToSitewiseNode
@@ -18,6 +17,7 @@ class BatchPutToSitewiseNode(IONode):
     num_in = 1
     num_out = 0
     download_result = False
+    blocking = True
 
     OPTIONS = {
         "aws_access_key_id": StringParameter(
@@ -84,7 +84,7 @@ class BatchPutToSitewiseNode(IONode):
                 print("trying to exclude now...................")
                 filter_search_string = flow_vars["exclude"].get_value()
 
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
+                search_results = search_expression(filter_search_string, predecessor_data[0])
                 if search_results is not None: #if we found what we are looking for then exclude and dont write to disk
                     return '{"excluded":"true"}'
 
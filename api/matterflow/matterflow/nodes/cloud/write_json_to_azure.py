@@ -4,7 +4,7 @@ import json
 import pandas as pd
 from io import StringIO  # For handling in-memory text streams
 from azure.storage.blob import BlobServiceClient, BlobClient, ContainerClient
-import jmespath
+from matterflow.expression import compile_expression
 
 class WriteJsonToAzureNode(IONode):
     """WriteJsonToAzureNode
@@ -18,6 +18,7 @@ class WriteJsonToAzureNode(IONode):
     num_in = 1
     num_out = 0
     download_result = False
+    blocking = True
 
     OPTIONS = {
         "azure_connection_string": StringParameter(
@@ -55,17 +56,33 @@ class WriteJsonToAzureNode(IONode):
     }
 
     def execute(self, predecessor_data, flow_vars):
+        return self.execute_batch([predecessor_data], flow_vars)[0]
+
+    def execute_batch(self, batch, flow_vars):
+        # A batch is combined into one DataFrame and uploaded once
         try:
+            outputs = list()
+            frames = list()
+
             # Check for exclusion criteria based on the 'exclude' parameter
+            exclude = None
             if flow_vars["exclude"].get_value() != '':
-                filter_search_string = flow_vars["exclude"].get_value()
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
-                if search_results is not None:  # If exclusion condition is met
-                    return '{"excluded":"true"}'
+                exclude = compile_expression(flow_vars["exclude"].get_value())
+
+            for predecessor_data in batch:
+                if exclude is not None and exclude.search(predecessor_data[0]) is not None:  # If exclusion condition is met
+                    outputs.append('{"excluded":"true"}')
+                else:
+                    # Prepare DataFrame from incoming data
+                    frames.append(pd.DataFrame(predecessor_data[0]))
+                    outputs.append('{"status":"success"}')
+
+            if not frames:
+                return outputs
 
-            # Prepare DataFrame from incoming data
-            data = predecessor_data[0]
-            df = pd.DataFrame(data)
+            # Only the last message would remain after overwriting
+            overwrite = flow_vars["write_mode"].get_value() == 'overwrite'
+            df = frames[-1] if overwrite else pd.concat(frames, ignore_index=True)
 
             # Set up Azure Blob Storage client
             connection_string = flow_vars["azure_connection_string"].get_value() or ""
@@ -86,12 +103,13 @@ class WriteJsonToAzureNode(IONode):
             content_to_upload = buffer.getvalue()
 
             # Upload the data to Azure Blob Storage
-            if flow_vars["write_mode"].get_value() == 'overwrite':
+            if overwrite:
                 blob_client.upload_blob(content_to_upload, overwrite=True)
             else:  # Append mode
                 try:
                     # Check if blob exists and read the current content
                     existing_data = blob_client.download_blob().readall().decode('utf-8')
+                    buffer = StringIO()
                     if file_format == 'json':
                         # Concatenate JSON records
                         existing_df = pd.read_json(StringIO(existing_data), orient='records')
@@ -114,7 +132,7 @@ class WriteJsonToAzureNode(IONode):
 
                 blob_client.upload_blob(content_to_upload, overwrite=True)
 
-            return '{"status":"success"}'
+            return outputs
 
         except Exception as e:
             raise NodeException('write data to azure blob', str(e))
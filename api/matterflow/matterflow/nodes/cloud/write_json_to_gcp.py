@@ -1,11 +1,11 @@
 from matterflow.node import IONode, NodeException
 from matterflow.parameters import *
 import json
-import jmespath
+from matterflow.expression import compile_expression
 from io import StringIO
 from google.cloud import storage  # Google Cloud Storage client
 from google.oauth2 import service_account
-import pandas as pd
+from google.api_core.exceptions import NotFound
 import csv
 from typing import List, Dict, Union, Optional
 
@@ -21,6 +21,7 @@ class WriteJsonToGCPNode(IONode):
     num_in = 1
     num_out = 0
     download_result = False
+    blocking = True
 
     OPTIONS = {
         "file": FileParameter(
@@ -99,13 +100,28 @@ class WriteJsonToGCPNode(IONode):
             return output.getvalue()
 
     def execute(self, predecessor_data, flow_vars):
+        return self.execute_batch([predecessor_data], flow_vars)[0]
+
+    def execute_batch(self, batch, flow_vars):
+        # A batch is read from and uploaded to the bucket once, using one client
         try:
+            outputs = list()
+            messages = list()
+
             # Check for exclude condition
+            exclude = None
             if flow_vars["exclude"].get_value() != '':
-                filter_search_string = flow_vars["exclude"].get_value()
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
-                if search_results is not None:  # If match found, skip writing
-                    return '{"excluded":"true"}'
+                exclude = compile_expression(flow_vars["exclude"].get_value())
+
+            for predecessor_data in batch:
+                if exclude is not None and exclude.search(predecessor_data[0]) is not None:  # If match found, skip writing
+                    outputs.append('{"excluded":"true"}')
+                else:
+                    messages.append(predecessor_data[0])
+                    outputs.append('{"written":"true"}')
+
+            if not messages:
+                return outputs
 
             bucket_name = flow_vars["bucket"].get_value()
             file_name = flow_vars["filename"].get_value()
@@ -125,29 +141,31 @@ class WriteJsonToGCPNode(IONode):
                 try:
                     existing_data = blob.download_as_text()
                     skip_header = True  # Skip writing header for new data
-                except storage.exceptions.NotFound:
+                except NotFound:
                     existing_data = ""
                     skip_header = False
 
                 converter = self.JSONToCSVConverter()
-                csv_data = converter.json_to_csv(predecessor_data[0], existing_csv=existing_data, skip_header=skip_header)
+                csv_data = existing_data
+                for message in messages:
+                    csv_data = converter.json_to_csv(message, existing_csv=csv_data, skip_header=skip_header)
 
                 # Write combined data back to GCS
                 blob.upload_from_string(csv_data, content_type='text/csv')
             else:
                 # Handle JSON case
-                json_string = json.dumps(predecessor_data[0])
+                json_strings = [json.dumps(message) for message in messages]
                 if write_mode:
-                    blob.upload_from_string(json_string, content_type='application/json')
+                    # Only the last message would remain after overwriting
+                    blob.upload_from_string(json_strings[-1], content_type='application/json')
                 else:
                     try:
-                        existing_data = blob.download_as_text()
-                        updated_data = existing_data + '\n' + json_string
-                    except storage.exceptions.NotFound:
-                        updated_data = json_string
-                    blob.upload_from_string(updated_data, content_type='application/json')
+                        json_strings.insert(0, blob.download_as_text())
+                    except NotFound:
+                        pass
+                    blob.upload_from_string('\n'.join(json_strings), content_type='application/json')
 
-            return '{"written":"true"}'
+            return outputs
 
         except Exception as e:
             raise NodeException('write data to GCP', str(e))
@@ -4,7 +4,6 @@ import json
 import jmespath
 from io import StringIO  # for handling in-memory text streams
 import boto3
-import pandas as pd
 import csv
 import os
 from typing import List, Dict, Union, Optional
@@ -21,6 +20,7 @@ class WriteJsonToS3Node(IONode):
     num_in = 1
     num_out = 0
     download_result = False
+    blocking = True
 
     OPTIONS = {
         "aws_access_key_id": StringParameter(
@@ -101,12 +101,18 @@ class WriteJsonToS3Node(IONode):
             return output.getvalue()
 
     def execute(self, predecessor_data, flow_vars):
+        return self.execute_batch([predecessor_data], flow_vars)[0]
+
+    def execute_batch(self, batch, flow_vars):
+        # A batch is read from and written to S3 once, using one session
         try:
             bucket = flow_vars["bucket"].get_value()
             file_name = flow_vars["filename"].get_value()
             write_mode = flow_vars["write_mode"].get_value() == 'overwrite'
             output_format = flow_vars["output_format"].get_value()
 
+            messages = [predecessor_data[0] for predecessor_data in batch]
+
             session = boto3.Session(
                 aws_access_key_id=flow_vars["aws_access_key_id"].get_value(),
                 aws_secret_access_key=flow_vars["aws_secret_access_key"].get_value(),
@@ -114,40 +120,38 @@ class WriteJsonToS3Node(IONode):
             s3_resource = session.resource('s3')
 
             if output_format == "csv":
-                try:
-                    obj = s3_resource.Object(bucket, file_name)
-                    existing_data = obj.get()['Body'].read().decode('utf-8')
-                    skip_header = True  # Skip writing header for new data
-                except Exception as e:
-                    if hasattr(e, 'response') and e.response['Error']['Code'] == 'NoSuchKey':
-                        existing_data = ""
-                        skip_header = False
-                    else:
-                        raise NodeException('write json to s3', 'AWS S3 error - check your credentials, bucket, and filename')
+                existing_data = self.read_existing(s3_resource, bucket, file_name)
+                skip_header = existing_data is not None  # Skip writing header for new data
 
                 converter = self.JSONToCSVConverter()
-                csv_data = converter.json_to_csv(predecessor_data[0], existing_csv=existing_data, skip_header=skip_header)
+                csv_data = existing_data or ""
+                for message in messages:
+                    csv_data = converter.json_to_csv(message, existing_csv=csv_data, skip_header=skip_header)
 
                 # Write combined data back to S3
                 s3_resource.Object(bucket, file_name).put(Body=csv_data)
             else:
-                # Handle JSON case (unchanged)
-                json_string = json.dumps(predecessor_data[0])
+                json_strings = [json.dumps(message) for message in messages]
                 if write_mode:
-                    s3_resource.Object(bucket, file_name).put(Body=json_string)
+                    # Only the last message would remain after overwriting
+                    s3_resource.Object(bucket, file_name).put(Body=json_strings[-1])
                 else:
-                    try:
-                        obj = s3_resource.Object(bucket, file_name)
-                        existing_data = obj.get()['Body'].read().decode('utf-8')
-                        updated_data = existing_data + '\n' + json_string
-                    except Exception as e:
-                        if hasattr(e, 'response') and e.response['Error']['Code'] == 'NoSuchKey':
-                            updated_data = json_string
-                        else:
-                            raise NodeException('write json to s3', 'AWS S3 error - check your credentials, bucket, and filename')
-                    s3_resource.Object(bucket, file_name).put(Body=updated_data)
-
-            return '{"written":"true"}'
+                    existing_data = self.read_existing(s3_resource, bucket, file_name)
+                    if existing_data is not None:
+                        json_strings.insert(0, existing_data)
+                    s3_resource.Object(bucket, file_name).put(Body='\n'.join(json_strings))
+
+            return ['{"written":"true"}'] * len(batch)
 
         except Exception as e:
-            raise NodeException('write json to s3', str(e))
\ No newline at end of file
+            raise NodeException('write json to s3', str(e))
+
+    def read_existing(self, s3_resource, bucket, file_name):
+        """Return the current contents of the S3 object, or None if it does not exist."""
+        try:
+            obj = s3_resource.Object(bucket, file_name)
+            return obj.get()['Body'].read().decode('utf-8')
+        except Exception as e:
+            if hasattr(e, 'response') and e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise NodeException('write json to s3', 'AWS S3 error - check your credentials, bucket, and filename')
@@ -1,3 +1,11 @@
-from .ws_connection import WsConnectionNode
-from .mqtt_connection_in import MqttConnectionInNode
-from .mqtt_connection_out import MqttConnectionOutNode
\ No newline at end of file
+from matterflow.nodes import lazy_nodes
+
+# Node class name -> module, imported when the Node is first used
+NODE_MODULES = {
+    "WsConnectionNode": ".ws_connection",
+    "MqttConnectionInNode": ".mqtt_connection_in",
+    "MqttConnectionOutNode": ".mqtt_connection_out",
+}
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
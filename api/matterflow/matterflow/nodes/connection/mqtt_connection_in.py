@@ -2,7 +2,6 @@ from matterflow.node import ConnectionNode, NodeException
 from matterflow.parameters import *
 import json
 import os
-import pandas as pd
 from matterflow.connection import *
 
 class MqttConnectionInNode(ConnectionNode):
@@ -17,6 +16,7 @@ class MqttConnectionInNode(ConnectionNode):
     name = "MQTT Connection (In)"
     num_in = 0
     num_out = 1
+    accepts_payload = True
 
     test_file_path = ""
 
@@ -55,6 +55,9 @@ class MqttConnectionInNode(ConnectionNode):
             if flow_vars["file"].get_value() == DIR_PATH + "/":
                 return '{"message":"try uploading a test json file"}'
             else:    
+                # Only needed to read test files, not for flows run by the CLI
+                import pandas as pd
+
                 df = pd.read_json(
                     flow_vars["file"].get_value()
                     , typ='series'
@@ -66,6 +69,10 @@ class MqttConnectionInNode(ConnectionNode):
         except Exception as e:
             print(str(e))
             raise NodeException('MQTT Connection In', str(e))
+
+    def read_payload(self, payload, flow_vars):
+        # Messages are already decoded by the MQTT connection
+        return payload
         
     def validate(self):
         """Validate Node configuration
@@ -1,11 +1,9 @@
 from matterflow.node import ConnectionNode, NodeException
 from matterflow.parameters import *
 import json
-import pandas as pd
 from matterflow.connection import *
-import jmespath
+from matterflow.expression import search_expression
 import asyncio
-import aiomqtt
 
 class MqttConnectionOutNode(ConnectionNode):
     """MqttConnectionOutNode
@@ -22,6 +20,9 @@ class MqttConnectionOutNode(ConnectionNode):
 
     test_file_path = ""
 
+    # Seconds to wait for the broker when not running inside an event loop
+    publish_timeout = 30
+
     OPTIONS = {
         "connection": TextParameter(
             "Connection Settings",
@@ -47,34 +48,31 @@ class MqttConnectionOutNode(ConnectionNode):
                 print("trying to exclude now...................")
                 filter_search_string = flow_vars["exclude"].get_value()
 
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
+                search_results = search_expression(filter_search_string, predecessor_data[0])
                 if search_results is not None: #if we found what we are looking for then exclude and dont write to disk
                     return '{"excluded":"true"}'
 
             # Convert JSON data to string
             json_string = json.dumps(predecessor_data[0])
 
-            # Create the MQTT client
             connection_settings = json.loads(flow_vars["connection"].get_value())
             output_settings  = json.loads(flow_vars["output"].get_value())
 
-            # Define the async task to run the MQTT client publish
-            async def mqtt_publish(payload, connection_settings, output_settings):
-                try:
-                    async with aiomqtt.Client(hostname=connection_settings["host"], port=connection_settings["port"], username=connection_settings["username"], password=connection_settings["password"]) as client:
-                        await client.publish(output_settings["Topic"], payload=payload)
-                except Exception as e:
-                    print(f"Error in MQTT publish: {str(e)}")
-                    raise
-
-            payload = json_string
-            # Check if an event loop is already running
+            # Publish over the pooled client for this broker
+            publisher = MqttPublisher.get(connection_settings)
+            published = publisher.publish(
+                output_settings["Topic"],
+                json_string,
+                qos=output_settings.get("QoS", 0),
+                retain=output_settings.get("Retain", False),
+            )
+
+            # Inside a running flow (e.g. the CLI) publishes are pipelined,
+            # otherwise wait so errors are reported by this Node
             try:
-                loop = asyncio.get_running_loop()
-                # Run the task in the current running loop
-                asyncio.create_task(mqtt_publish(payload, connection_settings, output_settings))
+                asyncio.get_running_loop()
             except RuntimeError:  # No event loop is running
-                asyncio.run(mqtt_publish(payload, connection_settings, output_settings))
+                published.result(timeout=self.publish_timeout)
 
             return json_string
 
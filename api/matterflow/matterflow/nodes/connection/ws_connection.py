@@ -1,12 +1,11 @@
 from matterflow.node import ConnectionNode, NodeException
 from matterflow.parameters import *
 import json
-import pandas as pd
 from matterflow.connection import *
 import click
 import os 
 import socket
-import jmespath
+from matterflow.expression import search_expression
 
 def isWebsocketOpen(ip,port):
    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -29,6 +28,7 @@ class WsConnectionNode(ConnectionNode):
     name = "Matter WS Connection (In)"
     num_in = 0
     num_out = 1
+    accepts_payload = True
 
     #test_file_path = os.path.dirname(os.path.realpath(__file__)) + "/../../tests/sample_matter.json"
     test_file_path = ""
@@ -65,23 +65,35 @@ class WsConnectionNode(ConnectionNode):
             if flow_vars["file"].get_value() == DIR_PATH +"/":
                 return '{"message":"try uploading a test json file"}'
             else:    
+                # Only needed to read test files, not for flows run by the CLI
+                import pandas as pd
+
                 df = pd.read_json(
                     flow_vars["file"].get_value()
                     , typ='series'
                 )
 
-                # Now try to match the accepted events
-                expression = flow_vars["accept_events"].get_value()
-                data = df.to_json()
-                result = jmespath.search(expression, json.loads(data))
-                if result is None or result == False:
-                    raise ResourceWarning('Info: No match found in event from Matter WS. Expected ' + expression)
-        
-                return df.to_json()
+                return self.accept_event(json.loads(df.to_json()), flow_vars)
 
         except Exception as e:
             print(str(e))
             raise NodeException('WS Connection', str(e))
+
+    def read_payload(self, payload, flow_vars):
+        try:
+            return self.accept_event(payload, flow_vars)
+        except Exception as e:
+            print(str(e))
+            raise NodeException('WS Connection', str(e))
+
+    def accept_event(self, data, flow_vars):
+        # Now try to match the accepted events
+        expression = flow_vars["accept_events"].get_value()
+        result = search_expression(expression, data)
+        if result is None or result == False:
+            raise ResourceWarning('Info: No match found in event from Matter WS. Expected ' + expression)
+
+        return data
         
     def validate(self):
         """Validate Node configuration
@@ -1,3 +1,11 @@
-from .string_input import StringNode
-from .integer_input import IntegerNode
-from .dynamic_input import DynamicNode
+from matterflow.nodes import lazy_nodes
+
+# Node class name -> module, imported when the Node is first used
+NODE_MODULES = {
+    "StringNode": ".string_input",
+    "IntegerNode": ".integer_input",
+    "DynamicNode": ".dynamic_input",
+}
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
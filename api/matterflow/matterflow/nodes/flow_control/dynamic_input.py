@@ -1,6 +1,6 @@
 from matterflow.node import FlowNode, NodeException
 from matterflow.parameters import *
-import jmespath
+from matterflow.expression import search_expression
 import json
 
 class DynamicNode(FlowNode):
@@ -40,7 +40,7 @@ class DynamicNode(FlowNode):
         if len(filter_settings)>0:
             filter = filter_settings
 
-        data = jmespath.search(filter, predecessor_data[0])
+        data = search_expression(filter, predecessor_data[0])
 
         # Check if data is a primitive type (str, int, float, bool) and not None
         if data is not None and isinstance(data, (str, int, float, bool)):
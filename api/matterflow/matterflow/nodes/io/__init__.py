@@ -1,6 +1,14 @@
-from .read_csv import ReadCsvNode
-from .read_json import ReadJsonNode
-from .write_csv import WriteCsvNode
-from .write_json import WriteJsonNode
-from .table_creator import TableCreatorNode
-from .write_json_to_csv import WriteJsonToCsvNode
+from matterflow.nodes import lazy_nodes
+
+# Node class name -> module, imported when the Node is first used
+NODE_MODULES = {
+    "ReadCsvNode": ".read_csv",
+    "ReadJsonNode": ".read_json",
+    "WriteCsvNode": ".write_csv",
+    "WriteJsonNode": ".write_json",
+    "TableCreatorNode": ".table_creator",
+    "WriteJsonToCsvNode": ".write_json_to_csv",
+}
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
@@ -1,6 +1,5 @@
 from matterflow.node import IONode, NodeException
 from matterflow.parameters import *
-import pandas as pd
 import json
 
 class ReadJsonNode(IONode):
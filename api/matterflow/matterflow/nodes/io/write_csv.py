@@ -1,7 +1,6 @@
 from matterflow.node import IONode, NodeException
 from matterflow.parameters import *
 
-import pandas as pd
 import csv
 import json
 import os
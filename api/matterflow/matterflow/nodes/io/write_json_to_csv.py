@@ -1,7 +1,7 @@
 from matterflow.node import IONode, NodeException
 from matterflow.parameters import *
 import json
-import jmespath
+from matterflow.expression import compile_expression, search_expression
 import csv
 import os
 from typing import List, Dict, Union, Optional
@@ -129,34 +129,50 @@ class WriteJsonToCsvNode(IONode):
             :param append: If True, append to the CSV file. Otherwise, overwrite.
             """
 
+            if not isinstance(json_data, (dict, list)):
+                raise ValueError("Input must be a list of JSON objects or a single JSON object")
+
+            mode = 'a' if not overwrite and os.path.exists(csv_filename) else 'w'
+            header_written = not overwrite and os.path.exists(csv_filename)
+            
+            with open(csv_filename, mode, newline='', encoding='utf-8') as csvfile:
+                self.write_rows(csvfile, json_data, header_written)
+
+        def write_rows(self, csvfile, json_data: Union[List[Dict], Dict], header_written: bool) -> bool:
+            """
+            Write JSON data as CSV rows to an open file.
+            :param csvfile: File to write to.
+            :param json_data: JSON object or list of JSON objects to write.
+            :param header_written: If True, the file already has a header.
+            :return: True if the file now has a header.
+            """
+
             if isinstance(json_data, dict):
                 json_data = [json_data]
             elif isinstance(json_data, list):
                 json_data = json_data
             else:
                 raise ValueError("Input must be a list of JSON objects or a single JSON object")
+
+            writer = None
+            for entry in json_data:
+                flattened_entry = self.flatten_json(entry)
                 
-            mode = 'a' if not overwrite and os.path.exists(csv_filename) else 'w'
-            header_written = not overwrite and os.path.exists(csv_filename)
-            
-            with open(csv_filename, mode, newline='', encoding='utf-8') as csvfile:
-                writer = None
-                for entry in json_data:
-                    flattened_entry = self.flatten_json(entry)
-                    
-                    # If columns are specified, filter the entry based on the columns.
-                    if self.columns:
-                        flattened_entry = {key: flattened_entry.get(key) for key in self.columns}
-                    
-                    # Initialize CSV DictWriter if not already done.
-                    if writer is None:
-                        fieldnames = self.columns if self.columns else flattened_entry.keys()
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        if not header_written:
-                            writer.writeheader()
-                            header_written = True
-                    
-                    writer.writerow(flattened_entry)
+                # If columns are specified, filter the entry based on the columns.
+                if self.columns:
+                    flattened_entry = {key: flattened_entry.get(key) for key in self.columns}
+                
+                # Initialize CSV DictWriter if not already done.
+                if writer is None:
+                    fieldnames = self.columns if self.columns else flattened_entry.keys()
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                    if not header_written:
+                        writer.writeheader()
+                        header_written = True
+                
+                writer.writerow(flattened_entry)
+
+            return header_written
 
     def execute(self, predecessor_data, flow_vars):
 
@@ -165,7 +181,7 @@ class WriteJsonToCsvNode(IONode):
             if flow_vars["exclude"].get_value() != '':
                 filter_search_string = flow_vars["exclude"].get_value()
 
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
+                search_results = search_expression(filter_search_string, predecessor_data[0])
                 if search_results is not None: #if we found what we are looking for then exclude and dont write to disk
                     return '{"excluded":"true"}'
 
@@ -191,3 +207,43 @@ class WriteJsonToCsvNode(IONode):
             raise NodeException('write json to csv', str(e))
 
 
+
+    def execute_batch(self, batch, flow_vars):
+        # Open the file once and write every message that is not excluded
+        outputs = list()
+        try:
+            exclude = None
+            if flow_vars["exclude"].get_value() != '':
+                exclude = compile_expression(flow_vars["exclude"].get_value())
+
+            overwrite = flow_vars["write_mode"].get_value() == 'overwrite'
+            output_file = flow_vars["file"].get_value()
+
+            json_batch = list()
+            for predecessor_data in batch:
+                if exclude is not None and exclude.search(predecessor_data[0]) is not None:
+                    outputs.append('{"excluded":"true"}')
+                else:
+                    json_batch.append(predecessor_data[0])
+                    outputs.append('{"written":"true"}')
+
+            if not json_batch:
+                return outputs
+
+            # When overwriting, only the last message would remain in the file
+            if overwrite:
+                json_batch = json_batch[-1:]
+
+            converter = self.JSONToCSVConverter(columns=None)  # Use None to include all fields
+
+            mode = 'a' if not overwrite and os.path.exists(output_file) else 'w'
+            header_written = mode == 'a'
+
+            with open(output_file, mode, newline='', encoding='utf-8') as csvfile:
+                for json_data in json_batch:
+                    header_written = converter.write_rows(csvfile, json_data, header_written)
+
+            return outputs
+
+        except Exception as e:
+            raise NodeException('write json to csv', str(e))
@@ -1,9 +1,17 @@
-from .filter import FilterNode
-from .unflattenattributes import UnflattenAttributesNode
-from .mapping import MappingNode
-from .combine import CombineNode
-from .sizebuffer import SizeBufferNode
-from .timebuffer import TimeBufferNode
-from .mergejson import MergeJsonNode
-from .translateattributes import TranslateAttributesNode
-from .json_to_csv import JsonToCsvNode
\ No newline at end of file
+from matterflow.nodes import lazy_nodes
+
+# Node class name -> module, imported when the Node is first used
+NODE_MODULES = {
+    "FilterNode": ".filter",
+    "UnflattenAttributesNode": ".unflattenattributes",
+    "MappingNode": ".mapping",
+    "CombineNode": ".combine",
+    "SizeBufferNode": ".sizebuffer",
+    "TimeBufferNode": ".timebuffer",
+    "MergeJsonNode": ".mergejson",
+    "TranslateAttributesNode": ".translateattributes",
+    "JsonToCsvNode": ".json_to_csv",
+}
+
+__all__ = list(NODE_MODULES)
+__getattr__ = lazy_nodes(__name__, NODE_MODULES)
@@ -1,7 +1,6 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
 
-import pandas as pd
 import json
 
 class CombineNode(ManipulationNode):
@@ -1,9 +1,8 @@
-from matterflow.node import ManipulationNode, NodeException
+from matterflow.node import ManipulationNode, NodeException, as_output, copy_on_write
 from matterflow.parameters import *
 
-import pandas as pd
 import json
-import jmespath
+from matterflow.expression import compile_expression
 
 class FilterNode(ManipulationNode):
     name = "Filter"
@@ -29,11 +28,14 @@ class FilterNode(ManipulationNode):
     }
 
     def execute(self, predecessor_data, flow_vars):
-        # Convert JSON data to string
-        try:
-            json_string = json.dumps(predecessor_data[0])
+        output = self.execute_batch([predecessor_data], flow_vars)[0]
+        if isinstance(output, NodeException):
+            raise output
+        return output
 
-            message = json.loads(json.dumps(predecessor_data[0]))
+    def execute_batch(self, batch, flow_vars):
+        # Compile the filter once for all messages
+        try:
             filter_settings = flow_vars["filter"].get_value()
             include_settings = flow_vars["include"].get_value()
             data_settings = flow_vars["data"].get_value()
@@ -43,26 +45,41 @@ class FilterNode(ManipulationNode):
             if len(filter_settings)>0:
                 filter = filter_settings
 
-            input = '{"filtered":"true"}'
-            transformedandfilterdata = jmespath.search(filter, message)
-            if transformedandfilterdata is not None and transformedandfilterdata is not False:
-                #we have found a match
-                if include_settings: #check if we are to include
-                    if data_settings: #check if data settings is true then we return the filtered
-                        print("Filtering - sending back transformed data")
-                        if type(transformedandfilterdata) is list and len(transformedandfilterdata)>0:
-                            transformedandfilterdata[0]['filtered'] = "true"
-                        input = json.dumps(transformedandfilterdata)
-                    else:
-                        print("Filtering - sending back original")
-                        input = json.dumps(message)  
-            else:
-                if not include_settings:
-                    input = json.dumps(message)
-                else:
-                    print("Filtering - ignoring message as the message does not given matching filter")
-
-            return input
-
+            expression = compile_expression(filter)
         except Exception as e:
             raise NodeException('filter', str(e))
+
+        outputs = list()
+        for predecessor_data in batch:
+            try:
+                outputs.append(self.filter_message(predecessor_data[0], expression, include_settings, data_settings))
+            except Exception as e:
+                outputs.append(NodeException('filter', str(e)))
+
+        return outputs
+
+    def filter_message(self, data, expression, include_settings, data_settings):
+        # The message is only read, so it is searched and passed on as is
+        output = {"filtered": "true"}
+        transformedandfilterdata = expression.search(data)
+        if transformedandfilterdata is not None and transformedandfilterdata is not False:
+            #we have found a match
+            if include_settings: #check if we are to include
+                if data_settings: #check if data settings is true then we return the filtered
+                    print("Filtering - sending back transformed data")
+                    if type(transformedandfilterdata) is list and len(transformedandfilterdata)>0:
+                        # The result may contain parts of the message
+                        transformedandfilterdata = copy_on_write(transformedandfilterdata)
+                        transformedandfilterdata[0] = copy_on_write(transformedandfilterdata[0])
+                        transformedandfilterdata[0]['filtered'] = "true"
+                    output = transformedandfilterdata
+                else:
+                    print("Filtering - sending back original")
+                    output = data
+        else:
+            if not include_settings:
+                output = data
+            else:
+                print("Filtering - ignoring message as the message does not given matching filter")
+
+        return as_output(output)
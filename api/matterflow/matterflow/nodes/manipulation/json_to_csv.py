@@ -1,7 +1,7 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
 import json
-import jmespath
+from matterflow.expression import search_expression
 import csv
 import os
 import io
@@ -81,7 +81,7 @@ class JsonToCsvNode(ManipulationNode):
             if flow_vars["exclude"].get_value() != '':
                 filter_search_string = flow_vars["exclude"].get_value()
 
-                search_results = jmespath.search(filter_search_string, predecessor_data[0])
+                search_results = search_expression(filter_search_string, predecessor_data[0])
                 if search_results is not None: #if we found what we are looking for then exclude and dont write to disk
                     return '{"excluded":"true"}'
 
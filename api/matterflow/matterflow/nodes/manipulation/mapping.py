@@ -1,115 +1,203 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
 
-import pandas as pd
+import functools
 import json
-import jmespath
+from matterflow.expression import compile_expression
 import time
 import re
 
-def findMappedItems(searchString, predecessor_data):
-    #this function will go thru each of the predecessor_data input sources
-    #and try to find the search string using jmespath
-    #once found the item is return so the order to the predecessor_data is important
-    #if not found then an emtry string is returned
-    needle = ""
-
-    # lets remove the double brackets (if any)
-    hasDoubleBrackets = re.findall(r'\{\{[^{}]*\}\}', searchString)
-    if hasDoubleBrackets:   
-        searchString = re.sub(r'[{}]', '', searchString)
-
-    if len(searchString) == 0:
-        return needle
-    
-    try:
-        for source_data in predecessor_data:
-            needle = jmespath.search(searchString, source_data)
-
-            if needle is not None:
-                return needle # only the first thing found will be returned
-
-    except Exception as e:
-        #If we have not found anything then return the original search string
-        return searchString
-
-    if hasDoubleBrackets:
-        #return '{"error":"unable to find match"}'
-        raise NodeException('mapping', 'unable to find match')
-    
-    return searchString # if we cant find anything then return the original string
-
-def count_curly_bracket_pairs(s):
-    # Initialize counters
-    open_brackets = 0
-    bracket_pairs = 0
-
-    # Iterate through each character in the string
-    for index in range(len(s)):
-        if s[index] == '$' and index < len(s) and s[index+1] == '{':
-            # Increment open bracket counter
-            open_brackets += 1
-        elif s[index] == '}':
-            # Check if there's an unmatched opening bracket
-            if open_brackets > 0:
-                open_brackets -= 1
-                bracket_pairs += 1
-
-    return bracket_pairs
-
-def replaceCurlys(item, new_json_object, predecessor_data):
-    replacedString = item['fieldValue']
-    for i in range(count_curly_bracket_pairs(replacedString)):
-        for key, value in list(new_json_object.items()):
-            placeholder = f'${{{key}}}'
-            if placeholder in item['fieldValue']:
-                replacedString = replacedString.replace(placeholder, str(value))
-
-    print(replacedString)
-    
-    #check if we removed all the curly
-    if (count_curly_bracket_pairs(replacedString) >0):
-        new_json_object[item['fieldName']] = "Error" 
-    else:     
-        new_json_object[item['fieldName']] = findMappedItems(replacedString, predecessor_data)
-
-    return new_json_object[item['fieldName']]
-
-
-# Recursive function to handle nested subInputFields
-def process_item(item, predecessor_data, result):
-
-    # If the item has subInputFields, process them recursively
-    if item['fieldDatatype'] == 'Object' and 'subInputFields' in item and item['subInputFields']:
-        # Create a nested object for this field
-        sub_object = {}
-        for sub_item in item['subInputFields']:
-            sub_object[sub_item['fieldName']] = process_item(sub_item, predecessor_data, result)
-        result = sub_object
-    else:
+# Number of compiled model mappings kept by compile_mapping()
+MAPPING_CACHE_SIZE = 128
+
+DOUBLE_BRACKETS = re.compile(r'\{\{[^{}]*\}\}')
+PLACEHOLDER = re.compile(r'\$\{([^}]*)\}')
+# A placeholder left in a template after replacing, see replace_placeholders()
+UNREPLACED = re.compile(r'\$\{.*\}', re.DOTALL)
+
+
+class MappingQuery:
+    """A field value looked up in the predecessor data using jmespath.
+
+    The value is parsed once: double brackets are removed and the JMESPath
+    expression is compiled. Values that are not valid JMESPath are plain
+    strings which map to themselves.
+    """
+
+    def __init__(self, search_string):
+        # lets remove the double brackets (if any)
+        self.required = DOUBLE_BRACKETS.search(search_string) is not None
+        if self.required:
+            search_string = re.sub(r'[{}]', '', search_string)
+
+        self.search_string = search_string
+        self.expression = None
+
+        if len(search_string) > 0:
+            try:
+                self.expression = compile_expression(search_string)
+            except Exception:
+                pass
+
+    def find(self, predecessor_data):
+        #this function will go thru each of the predecessor_data input sources
+        #and try to find the search string using jmespath
+        #once found the item is return so the order to the predecessor_data is important
+        #if not found then an emtry string is returned
+        if len(self.search_string) == 0:
+            return ""
+
+        try:
+            for source_data in predecessor_data:
+                if self.expression is None:
+                    # Not valid JMESPath, i.e. searching would fail
+                    return self.search_string
+
+                needle = self.expression.search(source_data)
+
+                if needle is not None:
+                    return needle # only the first thing found will be returned
+
+        except Exception as e:
+            #If we have not found anything then return the original search string
+            return self.search_string
+
+        if self.required:
+            raise NodeException('mapping', 'unable to find match')
+
+        return self.search_string # if we cant find anything then return the original string
+
+
+class MappingField:
+    """A compiled field of a model mapping.
+
+    Depending on its definition, a field is a nested object of subfields,
+    a timestamp, a template with ${fieldName} placeholders or a query.
+    """
+
+    def __init__(self, item):
+        self.name = item['fieldName']
+        self.datatype = item['fieldDatatype']
+        self.fields = None
+        self.template = None
+        self.segments = None
+        self.query = None
+
+        if self.datatype == 'Object' and 'subInputFields' in item and item['subInputFields']:
+            self.fields = [MappingField(sub_item) for sub_item in item['subInputFields']]
+        elif self.datatype in ('Timestamp', 'Datetime'):
+            pass
+        elif '${' in item['fieldValue'] and '}' in item['fieldValue']:
+            # Alternating literal text and placeholder names
+            self.template = item['fieldValue']
+            self.segments = PLACEHOLDER.split(self.template)
+        else:
+            self.query = MappingQuery(item['fieldValue'])
+
+    def evaluate(self, predecessor_data, result):
+        """Value of the field for one message.
+
+        Args:
+            predecessor_data: Input data of the MappingNode
+            result: Mapped object so far, used to replace placeholders
+        """
+        if self.fields is not None:
+            sub_object = {}
+            for field in self.fields:
+                sub_object[field.name] = field.evaluate(predecessor_data, result)
+            return sub_object
+
         # If the field is a timestamp, use the current timestamp
-        if item['fieldDatatype'] == 'Timestamp':
-            result = int(time.time())
+        if self.datatype == 'Timestamp':
+            return int(time.time())
+
         # If the field is a datetime, use the current timestamp
-        elif item['fieldDatatype'] == 'Datetime':
-             result = time.strftime("%a %b %d %Y %H:%M:%S", time.localtime())
-        else:
-            # Replace placeholders with actual values
-            if '${' in item['fieldValue'] and '}' in item['fieldValue']:
-                result = replaceCurlys(item, result, predecessor_data)
+        if self.datatype == 'Datetime':
+            return time.strftime("%a %b %d %Y %H:%M:%S", time.localtime())
+
+        if self.segments is not None:
+            # Placeholder values are also added to the mapped object, so
+            # later fields can refer to them
+            result[self.name] = self.replace_placeholders(predecessor_data, result)
+            return result[self.name]
+
+        value = self.query.find(predecessor_data)
+        if value is not None:
+            if isinstance(value, list) and self.datatype == 'Array':
+                pass  # Return all entries
+            elif isinstance(value, list) and len(value) == 1:
+                value = value[0]  # Return the first entry
+            elif isinstance(value, str) and value.isnumeric() and self.datatype == 'Number':
+                value = int(value)
+
+        return value
+
+    def replace_placeholders(self, predecessor_data, result):
+        parts = list()
+        for i, segment in enumerate(self.segments):
+            if i % 2 == 0:
+                parts.append(segment)
+            elif segment in result:
+                parts.append(str(result[segment]))
             else:
-                # Use the fieldName as the key and fieldValue as the value in the new JSON object
-                tempFieldValue = findMappedItems(item['fieldValue'], predecessor_data)
-                if tempFieldValue is not None:
-                    if isinstance(tempFieldValue, list) and item['fieldDatatype'] == 'Array':
-                        tempFieldValue = tempFieldValue  # Return all entries
-                    elif isinstance(tempFieldValue, list) and len(tempFieldValue) == 1:
-                        tempFieldValue = tempFieldValue[0]  # Return the first entry
-                    elif isinstance(tempFieldValue, str) and tempFieldValue.isnumeric() and item['fieldDatatype'] == 'Number':
-                        tempFieldValue = int(tempFieldValue)
-                result = tempFieldValue
-
-    return result
+                #not all the curly brackets could be replaced
+                return "Error"
+
+        replaced = ''.join(parts)
+        if UNREPLACED.search(replaced):
+            # Substituted values brought in placeholders of their own
+            replaced = self.replace_repeatedly(result)
+            if UNREPLACED.search(replaced):
+                return "Error"
+
+        return findMappedItems(replaced, predecessor_data)
+
+    def replace_repeatedly(self, result):
+        """Replace placeholders once per placeholder of the template.
+
+        Placeholders inside substituted values are replaced by later passes
+        if the template has them too, like the replacement done before
+        mappings were compiled.
+        """
+        replaced = self.template
+        for _ in range(len(self.segments) // 2):
+            for key, value in list(result.items()):
+                placeholder = f'${{{key}}}'
+                if placeholder in self.template:
+                    replaced = replaced.replace(placeholder, str(value))
+
+        return replaced
+
+
+class MappingPlan:
+    """A model mapping compiled into MappingFields.
+
+    Args:
+        items: Field definitions of the model mapping
+    """
+
+    def __init__(self, items):
+        self.fields = [MappingField(item) for item in items]
+
+    def apply(self, predecessor_data):
+        """Map the input data of a MappingNode to a new JSON object."""
+        new_json_object = {}
+
+        for field in self.fields:
+            new_json_object[field.name] = field.evaluate(predecessor_data, new_json_object)
+
+        return new_json_object
+
+
+@functools.lru_cache(maxsize=MAPPING_CACHE_SIZE)
+def compile_mapping(json_data):
+    """Compile a model mapping (a JSON array string) into a MappingPlan."""
+    return MappingPlan(json.loads(json_data))
+
+
+def findMappedItems(searchString, predecessor_data):
+    return MappingQuery(searchString).find(predecessor_data)
+
 
 class MappingNode(ManipulationNode):
     """MappingNode
@@ -137,15 +225,10 @@ class MappingNode(ManipulationNode):
         try:
             model_mapping_settings = flow_vars["modelmapping"].get_value()
 
-            # Parse the JSON array string into a Python list of dictionaries
-            json_array = json.loads(model_mapping_settings['json_data'])
-
-            # Initialize an empty dictionary to hold the new JSON object
-            new_json_object = {}
+            # Compiled once per model mapping and re-used for every message
+            mapping_plan = compile_mapping(model_mapping_settings['json_data'])
 
-            # Iterate over each object in the JSON array
-            for item in json_array:
-                new_json_object[item['fieldName']] = process_item(item, predecessor_data, new_json_object)
+            new_json_object = mapping_plan.apply(predecessor_data)
 
             # Convert the new JSON object to a JSON string (if needed)
             new_json_object_str = json.dumps(new_json_object)
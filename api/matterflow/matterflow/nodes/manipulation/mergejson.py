@@ -1,9 +1,9 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
 
-import pandas as pd
+import copy
 import json
-import jmespath
+from matterflow.expression import search_expression
 from collections import defaultdict
 
 
@@ -20,15 +20,18 @@ def merge_jsons(json1, json2, jmespath_expr_for_matching, jmespath_expr_for_inse
     
     :return: The merged JSON object.
     """
+
+    # json1 may be shared with other nodes, so merge into a copy
+    json1 = copy.deepcopy(json1)
     
     # Extract the data from json2 based on the jmespath expression
-    json2_data = jmespath.search(jmespath_expr_for_matching, json2)
+    json2_data = search_expression(jmespath_expr_for_matching, json2)
     
     if json2_data is None:
         raise ValueError(f"No matching data found in json2 for expression: {jmespath_expr_for_matching}")
     
     # Find the place in json1 where the data from json2 should be inserted
-    json1_insertion_point = jmespath.search(jmespath_expr_for_insertion, json1)
+    json1_insertion_point = search_expression(jmespath_expr_for_insertion, json1)
     
     if json1_insertion_point is None:
         raise ValueError(f"No matching insertion point found in json1 for expression: {jmespath_expr_for_insertion}")
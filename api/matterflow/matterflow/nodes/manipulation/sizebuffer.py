@@ -1,7 +1,7 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
+from matterflow.buffer import MessageBuffer
 import os
-import pandas as pd
 import json
 
 class SizeBufferNode(ManipulationNode):
@@ -24,6 +24,11 @@ class SizeBufferNode(ManipulationNode):
             default=0,
             docstring="Size of file to buffer (Bytes)"
         ),
+        "persist": BooleanParameter(
+            "Persist Buffer",
+            default=True,
+            docstring="Log buffered messages to disk, to recover them after a restart"
+        ),
     }
 
     def execute(self, predecessor_data, flow_vars):
@@ -32,40 +37,30 @@ class SizeBufferNode(ManipulationNode):
         if 'meta' in predecessor_data[0] and predecessor_data[0]['meta']['status'] == 'rejected':
             return predecessor_data[0]
 
-        # use a temporary file to buffer into
-        DIR_PATH = os.getenv('DIR_PATH') or '/tmp'
-        tempFileName = DIR_PATH + "/" + self.node_id + "_sizebuffer.json"
-
-        # Read the existing JSONL file
-        try:
-            with open(tempFileName, 'r') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            data = []
-
-        # Append the new JSON object to the list
-        data.append(predecessor_data[0])
+        # buffer in memory, logging each message to a temporary file
+        buffer = self.get_buffer(flow_vars)
 
-        # Write the updated list to the JSONL file
-        with open(tempFileName, 'w') as f:
-            json.dump(data, f)
-
-        # Check the file size
-        fileSize = os.path.getsize(tempFileName)
+        # Append the new JSON object to the buffer
+        fileSize = buffer.append(predecessor_data[0])
         bufferSize = flow_vars["bufferSize"].get_value()
 
-        # Check if the file size is smaller than the buffer size
+        # Check if the buffered size is smaller than the buffer size
         if fileSize < bufferSize:
             #return '[]'
             raise ResourceWarning('Not yet reached buffer size of ' + str(bufferSize) + ' bytes. Currently at ' + str(fileSize) + ' bytes')
         else:
-            # Return the entire contents of the file
-            with open(tempFileName, 'r') as f:
-                jsonObj = json.load(f)
+            # Return the entire contents of the buffer
+            return buffer.drain()
+
+    def get_buffer(self, flow_vars):
+        DIR_PATH = os.getenv('DIR_PATH') or '/tmp'
+        name = self.node_id + "_sizebuffer"
+
+        walPath = None
+        if flow_vars["persist"].get_value():
+            walPath = DIR_PATH + "/" + name + ".jsonl"
 
-            #remove the buffer file
-            os.remove(tempFileName)        
-            return json.dumps(jsonObj) #return the jsonObj
+        return MessageBuffer.get(name, walPath)
 
     def validate(self):
         """Validate Node configuration
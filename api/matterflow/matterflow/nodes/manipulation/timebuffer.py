@@ -1,14 +1,24 @@
 from matterflow.node import ManipulationNode, NodeException
 from matterflow.parameters import *
+from matterflow.buffer import MessageBuffer
 import os
-import pandas as pd
 import json
+import math
 import time
 
 class TimeBufferNode(ManipulationNode):
     """TimeBuffer
 
-    Buffers the incoming json into a buffer until the time duration to buffer (seconds) is reached.
+    Buffers the incoming json into time windows of the duration to buffer (seconds).
+
+    Tumbling windows follow each other without overlap; each window's
+    messages are passed on once, when it closes. Sliding windows pass on
+    all messages of the last duration to buffer every slide interval (or
+    on every message if no interval is set).
+
+    Windows are aligned to multiples of their duration (e.g. hourly windows
+    close on the hour). When run from the command line, windows close on a
+    timer even when no further message arrives.
 
     Raises:
         NodeException: any error buffering Json files, converting
@@ -18,6 +28,7 @@ class TimeBufferNode(ManipulationNode):
     name = "TimeBuffer"
     num_in = 1
     num_out = 1
+    timed = True
 
     OPTIONS = {
         "bufferTime": IntegerParameter(
@@ -25,6 +36,22 @@ class TimeBufferNode(ManipulationNode):
             default=0,
             docstring="Time duration to buffer (seconds)"
         ),
+        "window": SelectParameter(
+            "Window",
+            options=["tumbling", "sliding"],
+            default="tumbling",
+            docstring="Pass on each window once (tumbling) or overlapping windows (sliding)"
+        ),
+        "slideTime": IntegerParameter(
+            "Slide Interval",
+            default=0,
+            docstring="Time between sliding windows (seconds), 0 for every message"
+        ),
+        "persist": BooleanParameter(
+            "Persist Buffer",
+            default=True,
+            docstring="Log buffered messages to disk, to recover them after a restart"
+        ),
     }
 
     def execute(self, predecessor_data, flow_vars):
@@ -32,49 +59,103 @@ class TimeBufferNode(ManipulationNode):
         if 'meta' in predecessor_data[0] and predecessor_data[0]['meta']['status'] == 'rejected':
             return predecessor_data[0]
 
-        # Define the temporary file for buffering
-        DIR_PATH = os.getenv('DIR_PATH') or '/tmp'
-        tempFileName = DIR_PATH + "/" + self.node_id + "_timebuffer.json"
+        # Buffer in memory, logging each message to a temporary file
+        buffer = self.get_buffer(flow_vars)
+        buffer_time = flow_vars["bufferTime"].get_value()
+        current_time = time.time()
 
-        # Read the existing JSONL file or initialize an empty buffer
-        try:
-            with open(tempFileName, 'r') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            data = []
+        if buffer_time <= 0:
+            buffer.append(predecessor_data[0], current_time)
+            return buffer.drain()
 
-        # Append the new JSON object to the list
-        data.append(predecessor_data[0])
+        if flow_vars["window"].get_value() == "sliding":
+            return self.slide(buffer, predecessor_data[0], current_time, flow_vars)
 
-        # Determine when the file was created or last modified
-        if os.path.exists(tempFileName):
-            file_creation_time = os.path.getmtime(tempFileName)  # File's last modified time
-        else:
-            file_creation_time = time.time()  # Fallback (unlikely to be used)
+        # Close the current window first if its time is up
+        window_end = self.window_end(buffer, buffer_time)
+        if window_end is not None and current_time >= window_end:
+            window = buffer.drain()
+            buffer.append(predecessor_data[0], current_time)
+            return window
 
-        # Write the updated list to the JSONL file
-        with open(tempFileName, 'w') as f:
-            json.dump(data, f)
+        # Append the new JSON object to the buffer
+        buffer.append(predecessor_data[0], current_time)
 
-        # Get the current time and buffer duration
-        current_time = time.time()
+        elapsed_time = int(buffer.age(current_time))  # Elapsed time in seconds
+        raise ResourceWarning(
+            f"Not yet reached buffer time of {buffer_time} seconds. "
+            f"Elapsed time: {elapsed_time} seconds"
+        )
+
+    def slide(self, buffer, message, current_time, flow_vars):
+        buffer_time = flow_vars["bufferTime"].get_value()
+        slide_time = flow_vars["slideTime"].get_value()
+
+        buffer.append(message, current_time)
+        buffer.evict(current_time - buffer_time)
+
+        if slide_time > 0 and buffer.flush_at is None:
+            buffer.flush_at = self.boundary(current_time, slide_time)
+
+        if slide_time <= 0 or current_time >= buffer.flush_at:
+            if slide_time > 0:
+                buffer.flush_at = self.boundary(current_time, slide_time)
+            return buffer.messages()
+
+        raise ResourceWarning(
+            f"Not yet reached slide interval of {slide_time} seconds. "
+            f"Next window in {int(buffer.flush_at - current_time)} seconds"
+        )
+
+    def next_timer(self, flow_vars, now):
+        buffer = self.get_buffer(flow_vars)
+        buffer_time = flow_vars["bufferTime"].get_value()
+
+        if buffer_time <= 0 or len(buffer) == 0:
+            return None
+
+        if flow_vars["window"].get_value() == "sliding":
+            return buffer.flush_at
+
+        return self.window_end(buffer, buffer_time)
+
+    def on_timer(self, now, flow_vars):
+        buffer = self.get_buffer(flow_vars)
         buffer_time = flow_vars["bufferTime"].get_value()
+        due = self.next_timer(flow_vars, now)
+
+        if due is None or now < due:
+            raise ResourceWarning("Time window not yet closed")
+
+        if flow_vars["window"].get_value() == "sliding":
+            buffer.evict(now - buffer_time)
+            buffer.flush_at = self.boundary(now, flow_vars["slideTime"].get_value())
+            if len(buffer) == 0:
+                raise ResourceWarning("No messages in time window")
+            return buffer.messages()
+
+        return buffer.drain()
+
+    def window_end(self, buffer, buffer_time):
+        """End of the tumbling window holding the buffered messages."""
+        if buffer.created is None:
+            return None
+        return self.boundary(buffer.created, buffer_time)
+
+    @staticmethod
+    def boundary(timestamp, interval):
+        """The first multiple of `interval` after `timestamp`."""
+        return (math.floor(timestamp / interval) + 1) * interval
+
+    def get_buffer(self, flow_vars):
+        DIR_PATH = os.getenv('DIR_PATH') or '/tmp'
+        name = self.node_id + "_timebuffer"
+
+        wal_path = None
+        if flow_vars["persist"].get_value():
+            wal_path = DIR_PATH + "/" + name + ".jsonl"
 
-        # Check if the buffer duration has elapsed
-        elapsed_time = int(current_time - file_creation_time)  # Elapsed time in seconds
-        if elapsed_time < buffer_time:
-            raise ResourceWarning(
-                f"Not yet reached buffer time of {buffer_time} seconds. "
-                f"Elapsed time: {elapsed_time} seconds"
-            )
-        else:
-            # Return the entire contents of the buffer
-            with open(tempFileName, 'r') as f:
-                jsonObj = json.load(f)
-
-            # Remove the buffer file
-            os.remove(tempFileName)
-            return json.dumps(jsonObj)  # Return the buffered data
+        return MessageBuffer.get(name, wal_path)
 
     def validate(self):
         """Validate Node configuration
@@ -1,7 +1,6 @@
-from matterflow.node import ManipulationNode, NodeException
+from matterflow.node import ManipulationNode, NodeException, as_output, copy_on_write
 from matterflow.parameters import *
 
-import pandas as pd
 import json
 import jmespath
 from collections import defaultdict
@@ -9,7 +8,7 @@ from collections import defaultdict
 
 #######################
 
-def transform_json_data(input_json):
+def transform_json_data(input_data):
     def nested_dict():
         return defaultdict(nested_dict)
 
@@ -22,19 +21,13 @@ def transform_json_data(input_json):
     def unflatten_attributes(data):
         if isinstance(data, dict):
             transformed_data = nested_dict()
-            keys_to_remove = []
             for key, value in data.items():
                 parts = key.split('/')
                 #if len(parts) == 3 and all(part.isdigit() for part in parts):
                 if len(parts) == 3:
                     transformed_data[parts[0]][parts[1]][parts[2]] = value
-                    keys_to_remove.append(key)
                 else:
                     transformed_data[key] = value
-            
-            # Remove the original flat keys after adding the nested structure
-            for key in keys_to_remove:
-                del data[key]
 
             # Convert defaultdict back to regular dictionary
             return convert_to_regular_dict(transformed_data)
@@ -54,33 +47,32 @@ def transform_json_data(input_json):
         if isinstance(data, list):
             return [process_json(item) for item in data]
         elif isinstance(data, dict):
+            # Copy the containers that change, the input is left untouched
+            data = copy_on_write(data)
             if 'data' in data:
                 #check if the attributes are nested
                 if 'attributes' in data['data']:
+                    data['data'] = copy_on_write(data['data'])
                     data['data']['attributes'] = unflatten_attributes(data['data']['attributes'])
                 else:
                     data['data'] = unflatten_attributes(data['data'])
             if 'result' in data:
-                for result in data['result']:
+                data['result'] = copy_on_write(data['result'])
+                for index, result in enumerate(data['result']):
                     if 'attributes' in result:
+                        result = data['result'][index] = copy_on_write(result)
                         result['attributes'] = unflatten_attributes(result['attributes'])
             return data
         else:
             return data
 
     try:
-        # Load the input JSON string into a Python object
-        data = json.loads(input_json)
-
         # Process the JSON object
-        processed_data = process_json(data)
-
-        # Convert the Python object back to a JSON string
-        return json.dumps(processed_data)
+        return process_json(input_data)
 
     except Exception as e:
-        # Return the original JSON string in case of an exception
-        return input_json
+        # Return the original data in case of an exception
+        return input_data
 #######################
 
 
@@ -93,13 +85,8 @@ class UnflattenAttributesNode(ManipulationNode):
     }
 
     def execute(self, predecessor_data, flow_vars):
-            # Convert JSON data to string
         try:
-            json_string = json.dumps(predecessor_data[0])
-
-            json_string = transform_json_data(json_string)
-
-            return json_string
+            return as_output(transform_json_data(predecessor_data[0]))
 
         except Exception as e:
             raise NodeException('unflatten abbributes', str(e))
@@ -1,4 +1,6 @@
+import copy
 import os
+import weakref
 
 
 class Options:
@@ -7,19 +9,35 @@ class Options:
 
     Clones the values in the class variable `OPTIONS` and sets their values
     with the values in in the instance variable `option_values`.
+
+    The Parameters are cached per instance until `option_values` changes,
+    so they are shared by everyone reading `options`: clone a Parameter
+    before changing its value.
     """
 
+    def __init__(self):
+        # instance -> (copy of option_values, options)
+        self._cache = weakref.WeakKeyDictionary()
+
     def __get__(self, obj, objtype):
         # return class variable OPTIONS if invoked from class
         if obj is None:
             return getattr(objtype, "OPTIONS", dict())
+
+        option_values = getattr(obj, "option_values", dict())
+        cached = self._cache.get(obj)
+        if cached is not None and cached[0] == option_values:
+            return cached[1]
+
         # otherwise clone class's options and set values from instance
         options = dict()
         for k, v in obj.OPTIONS.items():
             options[k] = v.clone()
-        for k, v in getattr(obj, "option_values", dict()).items():
+        for k, v in option_values.items():
             if k in options:
                 options[k].set_value(v)
+
+        self._cache[obj] = (dict(option_values), options)
         return options
 
 
@@ -40,6 +58,8 @@ class OptionTypes:
 
 
 class Parameter:
+    __slots__ = ("_label", "_value", "_default", "_docstring")
+
     type = None
 
     def __init__(self, label="", default=None, docstring=None):
@@ -49,7 +69,10 @@ class Parameter:
         self._docstring = docstring
 
     def clone(self):
-        return self.__class__(self.label, self.default, self.docstring)
+        """Copy of the Parameter without its value."""
+        clone = copy.copy(self)
+        clone._value = None
+        return clone
 
     def get_value(self):
         if self._value is None:
@@ -84,6 +107,8 @@ class Parameter:
 
 
 class FileParameter(Parameter):
+    __slots__ = ()
+
     type = "file"
 
     def validate(self):
@@ -92,6 +117,8 @@ class FileParameter(Parameter):
             raise ParameterValidationError(self)
 
 class StringParameter(Parameter):
+    __slots__ = ()
+
     type = "string"
 
     def validate(self):
@@ -101,6 +128,8 @@ class StringParameter(Parameter):
 
 
 class TextParameter(Parameter):
+    __slots__ = ()
+
     type = "text"
 
     def validate(self):
@@ -110,6 +139,8 @@ class TextParameter(Parameter):
 
 
 class IntegerParameter(Parameter):
+    __slots__ = ()
+
     type = "int"
 
     def validate(self):
@@ -119,6 +150,8 @@ class IntegerParameter(Parameter):
 
 
 class BooleanParameter(Parameter):
+    __slots__ = ()
+
     type = "boolean"
 
     def validate(self):
@@ -128,6 +161,8 @@ class BooleanParameter(Parameter):
 
 
 class SelectParameter(Parameter):
+    __slots__ = ("options",)
+
     type = "select"
 
     def __init__(self, label="", options=None, default=None, docstring=None):
@@ -146,6 +181,8 @@ class SelectParameter(Parameter):
 
 
 class InstanceSelectParameter(Parameter):
+    __slots__ = ("options",)
+
     type = "instanceselect"
 
     def __init__(self, label="", options=None, default=None, docstring=None):
@@ -0,0 +1,267 @@
+import json
+import os
+
+# A row offset is kept in the index for every ROW_INDEX_STEP rows
+ROW_INDEX_STEP = 100
+
+# Size of the blocks read by iter_json_array()
+READ_CHUNK_SIZE = 64 * 1024
+
+# Formats of row files, see read_rows()
+ARRAY = 'array'
+JSONL = 'jsonl'
+
+
+def index_path(path):
+    """Location of the row-offset index written alongside `path`."""
+    return path + '.index'
+
+
+def dump_rows(rows, f):
+    """Write `rows` as a JSON array, with one row per line.
+
+    The file stays a valid JSON document, while each row can be read on
+    its own once its line is found.
+
+    Args:
+        rows: list of JSON-like rows
+        f: File opened in binary mode
+
+    Returns:
+        Byte offsets of every `ROW_INDEX_STEP`-th row.
+    """
+    offsets = list()
+    position = f.write(b'[\n')
+
+    for i, row in enumerate(rows):
+        if i % ROW_INDEX_STEP == 0:
+            offsets.append(position)
+
+        # json.dumps escapes newlines, so a row never spans several lines
+        separator = b',\n' if i < len(rows) - 1 else b'\n'
+        position += f.write(json.dumps(row).encode() + separator)
+
+    f.write(b']')
+    return offsets
+
+
+def write_row_index(path, row_format, rows, offsets):
+    """Write the row-offset index of the file at `path`.
+
+    The index records the size and modification time of the file, so an
+    index left behind by an older version of the file is ignored.
+    """
+    stat = os.stat(path)
+    index = {
+        'format': row_format,
+        'rows': rows,
+        'step': ROW_INDEX_STEP,
+        'offsets': offsets,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+    with open(index_path(path), 'w') as f:
+        json.dump(index, f)
+
+
+def read_row_index(path):
+    """Row-offset index of the file at `path`, or None if missing or stale."""
+    try:
+        with open(index_path(path)) as f:
+            index = json.load(f)
+
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+    if index.get('size') != stat.st_size or index.get('mtime_ns') != stat.st_mtime_ns:
+        return None
+
+    return index
+
+
+def remove_row_index(path):
+    try:
+        os.remove(index_path(path))
+    except FileNotFoundError:
+        pass
+
+
+def index_jsonl(path):
+    """Build and save the row-offset index of a JSON Lines file.
+
+    Lines are only counted, not parsed. Failing to save the index, e.g. in
+    a read-only directory, is not an error; it is then rebuilt next time.
+    """
+    rows = 0
+    offsets = list()
+    position = 0
+
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                if rows % ROW_INDEX_STEP == 0:
+                    offsets.append(position)
+                rows += 1
+            position += len(line)
+
+    index = {'format': JSONL, 'rows': rows, 'step': ROW_INDEX_STEP, 'offsets': offsets}
+    try:
+        write_row_index(path, JSONL, rows, offsets)
+    except OSError:
+        pass
+
+    return index
+
+
+def read_indexed_rows(path, index, offset, limit):
+    """Read rows `offset` to `offset + limit` using the row-offset index."""
+    rows = list()
+    if offset >= index['rows'] or limit == 0:
+        return rows
+
+    block, skip = divmod(offset, index['step'])
+
+    with open(path, 'rb') as f:
+        f.seek(index['offsets'][block])
+
+        for line in f:
+            line = line.strip()
+            if not line or line == b']':
+                # Blank lines of JSON Lines files are not rows
+                continue
+
+            if skip > 0:
+                skip -= 1
+                continue
+
+            rows.append(json.loads(line.rstrip(b',')))
+            if limit is not None and len(rows) == limit:
+                break
+
+    return rows
+
+
+def iter_json_array(f):
+    """Parse the items of a JSON array file one at a time.
+
+    Only the item being parsed is held in memory, not the whole document.
+
+    Args:
+        f: File opened in text mode
+
+    Raises:
+        ValueError: the file does not hold a JSON array
+        json.JSONDecodeError: invalid JSON
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(READ_CHUNK_SIZE).lstrip()
+    chunk_size = READ_CHUNK_SIZE
+    eof = False
+
+    if not buffer.startswith('['):
+        raise ValueError('Data is not a JSON array')
+
+    position = 1
+    while True:
+        # Skip whitespace and separators, reading ahead if the buffer ran out
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+
+        if position == len(buffer):
+            if eof:
+                raise json.JSONDecodeError('Unterminated array', buffer, position)
+            buffer = f.read(chunk_size)
+            position = 0
+            eof = not buffer
+            continue
+
+        if buffer[position] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            item, end = None, None
+
+        # An item is complete once followed by a separator; a number cut off
+        # by the end of the buffer parses too, e.g. '7' of '7.5'
+        following = end
+        while following is not None and following < len(buffer) and buffer[following] in ' \t\r\n':
+            following += 1
+
+        if following is None or following == len(buffer) or buffer[following] not in ',]':
+            if eof:
+                raise json.JSONDecodeError('Invalid array item', buffer, position)
+
+            more = f.read(chunk_size)
+            eof = not more
+            buffer = buffer[position:] + more
+            position = 0
+            # Items larger than a chunk are re-parsed; read ahead faster
+            chunk_size *= 2
+            continue
+
+        chunk_size = READ_CHUNK_SIZE
+        yield item
+        position = end
+
+
+def read_rows(path, offset=0, limit=None):
+    """Read a window of the rows stored at `path`.
+
+    Rows are the items of a JSON array, or the lines of a JSON Lines
+    ('.jsonl') file. Files written by `dump_rows()`, and JSON Lines files
+    once indexed, are read through their row-offset index: only the rows
+    requested are parsed. Other arrays are parsed item by item without
+    loading the whole file. A document which is not an array is a single
+    row.
+
+    Args:
+        path: Location of the file
+        offset: Number of rows to skip
+        limit: Maximum number of rows to return, None for all rows
+
+    Returns:
+        tuple of (rows, total number of rows)
+
+    Raises:
+        OSError: the file cannot be read
+        json.JSONDecodeError: invalid JSON
+    """
+    index = read_row_index(path)
+    if index is None and os.path.splitext(path)[1] == '.jsonl':
+        index = index_jsonl(path)
+
+    if index is not None:
+        return read_indexed_rows(path, index, offset, limit), index['rows']
+
+    rows = list()
+    total = 0
+
+    with open(path) as f:
+        try:
+            for item in iter_json_array(f):
+                if total >= offset and (limit is None or len(rows) < limit):
+                    rows.append(item)
+                total += 1
+        except ValueError as e:
+            if isinstance(e, json.JSONDecodeError):
+                raise
+
+            # Not an array: the whole document is the only row
+            f.seek(0)
+            document = json.load(f)
+            return ([document] if offset == 0 and limit != 0 else []), 1
+
+    return rows, total
+
+
+def slice_rows(data, offset=0, limit=None):
+    """`read_rows()` for data already in memory."""
+    if not isinstance(data, list):
+        data = [data]
+
+    end = None if limit is None else offset + limit
+    return data[offset:end], len(data)
@@ -0,0 +1,107 @@
+import json
+
+from . import rows
+
+
+class ResultStore:
+    """Storage for the output of executed Nodes.
+
+    After a Node executes, the Workflow hands its output (a JSON-like Python
+    object) to the store and saves the returned key in the Node's 'data'
+    attribute. Successor Nodes later read their input back using that key.
+    """
+
+    def put(self, workflow, node_id, data):
+        """Store Node output and return the key used to retrieve it.
+
+        Args:
+            workflow: The Workflow that executed the Node.
+            node_id: The Node which produced `data`.
+            data: JSON-like Python object returned by the Node.
+
+        Returns:
+            Key to save in the Node's 'data' attribute.
+        """
+        raise NotImplementedError()
+
+    def get(self, workflow, key):
+        """Retrieve Node output previously stored under `key`.
+
+        Raises:
+            KeyError/OSError: No data stored under `key`.
+        """
+        raise NotImplementedError()
+
+    def get_rows(self, workflow, key, offset=0, limit=None):
+        """Retrieve a window of the rows of the Node output under `key`.
+
+        Rows are the items of list output; other output is a single row.
+
+        Returns:
+            tuple of (rows, total number of rows)
+
+        Raises:
+            KeyError/OSError: No data stored under `key`.
+        """
+        return rows.slice_rows(self.get(workflow, key), offset, limit)
+
+    def clear(self):
+        pass
+
+
+class MemoryResultStore(ResultStore):
+    """Keeps Node output in-process as Python objects.
+
+    Nothing is serialized, so successors receive the same object the
+    predecessor returned. Nodes must therefore not mutate their input data
+    in place. Used by default, e.g. by the CLI where results only need to
+    live for a single run of the flow.
+    """
+
+    def __init__(self):
+        self._results = dict()
+
+    def put(self, workflow, node_id, data):
+        key = workflow.generate_file_name(workflow, node_id)
+        self._results[key] = data
+        return key
+
+    def get(self, workflow, key):
+        return self._results[key]
+
+    def clear(self):
+        self._results.clear()
+
+
+class FileResultStore(ResultStore):
+    """Writes Node output to JSON files in the Workflow's root directory.
+
+    Results survive between requests, which the editor relies on to display
+    and download the data of previously executed Nodes. List output is
+    written one row per line, with a row-offset index alongside, so the
+    editor can page through large output without loading it all.
+    """
+
+    def put(self, workflow, node_id, data):
+        file_name = workflow.generate_file_name(workflow, node_id)
+        path = workflow.path(file_name)
+
+        if isinstance(data, list):
+            with open(path, 'wb') as f:
+                offsets = rows.dump_rows(data, f)
+
+            rows.write_row_index(path, rows.ARRAY, len(data), offsets)
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f)
+
+            rows.remove_row_index(path)
+
+        return file_name
+
+    def get(self, workflow, key):
+        with open(workflow.path(key)) as f:
+            return json.load(f)
+
+    def get_rows(self, workflow, key, offset=0, limit=None):
+        return rows.read_rows(workflow.path(key), offset, limit)
@@ -0,0 +1,192 @@
+import unittest
+import json
+import os
+import time
+from matterflow import MessageBuffer, Workflow, node_factory
+
+
+class MessageBufferTestCase(unittest.TestCase):
+    def setUp(self):
+        self.wal_path = "/tmp/test_message_buffer.jsonl"
+        if os.path.exists(self.wal_path):
+            os.remove(self.wal_path)
+
+        self.messages = [{"event": "attribute_updated", "data": [1, "0/6/0", i]} for i in range(3)]
+
+    def test_size(self):
+        buffer = MessageBuffer()
+        for message in self.messages:
+            buffer.append(message)
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.size, len(json.dumps(self.messages)))
+
+    def test_drain(self):
+        buffer = MessageBuffer(self.wal_path)
+        for message in self.messages:
+            buffer.append(message, timestamp=100)
+
+        self.assertEqual(buffer.age(now=160), 60)
+        self.assertEqual(buffer.drain(), self.messages)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.size, 0)
+        self.assertEqual(buffer.age(), 0)
+        self.assertFalse(os.path.exists(self.wal_path))
+
+    def test_recover(self):
+        buffer = MessageBuffer(self.wal_path)
+        for message in self.messages:
+            buffer.append(message, timestamp=100)
+
+        # Simulate a crash while writing
+        with open(self.wal_path, 'a') as f:
+            f.write('[101, {"event": ')
+
+        recovered = MessageBuffer(self.wal_path)
+        self.assertEqual(recovered.created, 100)
+        self.assertEqual(recovered.size, buffer.size)
+
+        recovered.append({"event": "node_added"})
+        self.assertEqual(MessageBuffer(self.wal_path).drain(), self.messages + [{"event": "node_added"}])
+
+    def test_evict(self):
+        buffer = MessageBuffer(self.wal_path)
+        for i, message in enumerate(self.messages):
+            buffer.append(message, timestamp=100 + i)
+
+        self.assertEqual(buffer.evict(before=101), 1)
+        self.assertEqual(buffer.messages(), self.messages[1:])
+        self.assertEqual(buffer.size, len(json.dumps(self.messages[1:])))
+        self.assertEqual(buffer.created, 101)
+        self.assertEqual(MessageBuffer(self.wal_path).messages(), self.messages[1:])
+
+    def test_evict_compaction(self):
+        buffer = MessageBuffer(self.wal_path)
+        buffer.compact_lines = 10
+
+        # A sliding window: every append evicts the oldest message
+        for i in range(6):
+            buffer.append({"value": i}, timestamp=100 + i)
+            buffer.evict(before=100 + i - 2)
+
+        # Evictions are appended to the log rather than rewriting it
+        with open(self.wal_path) as f:
+            self.assertEqual(len(f.readlines()), 6 + 3)
+        self.assertEqual(MessageBuffer(self.wal_path).messages(), [{"value": i} for i in range(3, 6)])
+
+        for i in range(6, 10):
+            buffer.append({"value": i}, timestamp=100 + i)
+            buffer.evict(before=100 + i - 2)
+
+        # Compacted once the dead lines passed the threshold
+        with open(self.wal_path) as f:
+            self.assertLess(len(f.readlines()), 6)
+        recovered = MessageBuffer(self.wal_path)
+        self.assertEqual(recovered.messages(), [{"value": i} for i in range(7, 10)])
+        self.assertEqual(recovered.size, buffer.size)
+
+    def test_get(self):
+        self.assertIs(MessageBuffer.get("test_get"), MessageBuffer.get("test_get"))
+        self.assertIsNot(MessageBuffer.get("test_get"), MessageBuffer.get("test_get_other"))
+
+    def test_toggle_wal(self):
+        buffer = MessageBuffer.get("test_toggle_wal")
+        buffer.drain()
+        buffer.append(self.messages[0], timestamp=100)
+
+        # Turning persistence on logs the buffered messages too
+        self.assertIs(MessageBuffer.get("test_toggle_wal", self.wal_path), buffer)
+        buffer.append(self.messages[1], timestamp=101)
+        self.assertEqual(MessageBuffer(self.wal_path).messages(), self.messages[:2])
+
+        # Turning it off removes the log, but keeps the messages
+        MessageBuffer.get("test_toggle_wal")
+        buffer.append(self.messages[2], timestamp=102)
+        self.assertIsNone(buffer.wal_path)
+        self.assertFalse(os.path.exists(self.wal_path))
+        self.assertEqual(buffer.messages(), self.messages)
+
+    def test_toggle_wal_recovers(self):
+        MessageBuffer(self.wal_path).append(self.messages[0], timestamp=100)
+
+        buffer = MessageBuffer.get("test_toggle_wal_recovers")
+        buffer.drain()
+        buffer.append(self.messages[1], timestamp=101)
+
+        MessageBuffer.get("test_toggle_wal_recovers", self.wal_path)
+        self.assertEqual(buffer.messages(), self.messages[:2])
+        self.assertEqual(buffer.size, len(json.dumps(self.messages[:2])))
+        self.assertEqual(MessageBuffer(self.wal_path).messages(), self.messages[:2])
+        buffer.drain()
+
+    def test_size_buffer_node(self):
+        workflow = Workflow("Buffer Test", root_dir="/tmp")
+        node = node_factory({
+            "name": "SizeBuffer",
+            "node_id": "size_buffer_test",
+            "node_type": "manipulation",
+            "node_key": "SizeBufferNode",
+            "options": {"bufferSize": len(json.dumps(self.messages)), "persist": False},
+        })
+        options = node.get_execution_options(workflow, dict())
+
+        for message in self.messages[:2]:
+            with self.assertRaises(ResourceWarning):
+                node.execute([message], options)
+
+        self.assertEqual(node.execute([self.messages[2]], options), self.messages)
+
+
+class TimeBufferNodeTestCase(unittest.TestCase):
+    def create_node(self, node_id, **options):
+        workflow = Workflow("Buffer Test", root_dir="/tmp")
+        node = node_factory({
+            "name": "TimeBuffer",
+            "node_id": node_id,
+            "node_type": "manipulation",
+            "node_key": "TimeBufferNode",
+            "options": dict(options, persist=False),
+        })
+        MessageBuffer.get(node_id + "_timebuffer").drain()
+        return node, node.get_execution_options(workflow, dict())
+
+    def test_tumbling_window(self):
+        node, options = self.create_node("tumbling_test", bufferTime=3600)
+        now = time.time()
+
+        self.assertIsNone(node.next_timer(options, now))
+        with self.assertRaises(ResourceWarning):
+            node.execute([{"value": 1}], options)
+
+        # The window closes on the hour, whether or not messages arrive
+        due = node.next_timer(options, now)
+        self.assertEqual(due % 3600, 0)
+        self.assertGreater(due, now)
+
+        with self.assertRaises(ResourceWarning):
+            node.on_timer(due - 1, options)
+        self.assertEqual(node.on_timer(due, options), [{"value": 1}])
+        self.assertIsNone(node.next_timer(options, due))
+
+    def test_sliding_window(self):
+        node, options = self.create_node("sliding_test", bufferTime=3600, window="sliding")
+
+        self.assertEqual(node.execute([{"value": 1}], options), [{"value": 1}])
+        self.assertEqual(node.execute([{"value": 2}], options), [{"value": 1}, {"value": 2}])
+        self.assertIsNone(node.next_timer(options, time.time()))
+
+    def test_sliding_window_interval(self):
+        node, options = self.create_node("sliding_interval_test", bufferTime=3600, window="sliding", slideTime=60)
+        now = time.time()
+
+        with self.assertRaises(ResourceWarning):
+            node.execute([{"value": 1}], options)
+
+        due = node.next_timer(options, now)
+        self.assertEqual(due % 60, 0)
+        self.assertEqual(node.on_timer(due, options), [{"value": 1}])
+
+        # Messages stay in the window after it was passed on
+        self.assertEqual(node.on_timer(due + 60, options), [{"value": 1}])
+        with self.assertRaises(ResourceWarning):
+            node.on_timer(due + 3660, options)
@@ -0,0 +1,415 @@
+import unittest
+import asyncio
+import contextlib
+import io
+import json
+import os
+import aiomqtt
+from aiohttp import web
+from matterflow.connection import BaseConnection, ConnectionFactory, MemQueue, MessageRate, MQTTConnection, MqttPublisher, WebsocketConnection, consume, deep_sizeof
+
+
+class FakeMessage:
+    def __init__(self, topic, payload):
+        self.topic = topic
+        self.payload = payload
+
+
+class QueueConnection(BaseConnection):
+    def __init__(self):
+        super().__init__(dict(), dict(), dict())
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def read_input(self):
+        pass
+
+    def send_output(self, data):
+        pass
+
+
+class ConnectionTestCase(unittest.TestCase):
+    def test_get_many(self):
+        async def run():
+            queue = MemQueue()
+            for i in range(5):
+                await queue.put({"value": i})
+
+            first = await queue.get_many(3)
+            second = await queue.get_many(3)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual([item["value"] for size, item in first], [0, 1, 2])
+        self.assertEqual([item["value"] for size, item in second], [3, 4])
+
+    def test_deep_sizeof(self):
+        small = {"data": [1]}
+        large = {"data": list(range(1000))}
+        self.assertGreater(deep_sizeof(large), deep_sizeof(small) + 1000)
+
+    def test_memory_budget_blocks(self):
+        item = {"payload": "x" * 1000}
+        budget = deep_sizeof(item) * 2
+
+        async def run():
+            queue = MemQueue(maxmemsize=budget)
+            await queue.put(item)
+            await queue.put(item)
+
+            with self.assertRaises(asyncio.QueueFull):
+                queue.put_nowait(item)
+
+            blocked_put = asyncio.create_task(queue.put(item))
+            await asyncio.sleep(0.01)
+            self.assertFalse(blocked_put.done())
+
+            queue.get_nowait()
+            await asyncio.wait_for(blocked_put, 1)
+            return queue.stats()
+
+        stats = asyncio.run(run())
+        self.assertEqual(stats["depth"], 2)
+        self.assertLessEqual(stats["bytes"], budget)
+        self.assertGreater(stats["wait_time"], 0)
+
+    def test_drop_oldest(self):
+        async def run():
+            queue = MemQueue(maxsize=2, overflow=MemQueue.DROP_OLDEST)
+            for i in range(5):
+                await queue.put({"value": i})
+            return queue.stats(), await queue.get_many(10)
+
+        stats, items = asyncio.run(run())
+        self.assertEqual(stats["dropped"], 3)
+        self.assertEqual([item["value"] for size, item in items], [3, 4])
+
+    def test_drop_newest(self):
+        async def run():
+            queue = MemQueue(maxsize=2, overflow=MemQueue.DROP_NEWEST)
+            for i in range(5):
+                await queue.put({"value": i})
+            return queue.stats(), await queue.get_many(10)
+
+        stats, items = asyncio.run(run())
+        self.assertEqual(stats["dropped"], 3)
+        self.assertEqual([item["value"] for size, item in items], [0, 1])
+
+    def test_spill_to_disk(self):
+        spill_path = "/tmp/test_memqueue_spill.jsonl"
+
+        async def run():
+            queue = MemQueue(maxsize=2, overflow=MemQueue.SPILL_TO_DISK, spill_path=spill_path)
+            for i in range(6):
+                await queue.put({"value": i})
+            stats = queue.stats()
+
+            values = []
+            while not queue.empty():
+                size, item = await queue.get()
+                values.append(item["value"])
+            return stats, values
+
+        stats, values = asyncio.run(run())
+        self.assertEqual(stats["depth"], 6)
+        self.assertEqual(stats["spilled"], 4)
+        self.assertEqual(values, list(range(6)))
+        self.assertFalse(os.path.exists(spill_path))
+
+    def test_consume(self):
+        received = []
+        rate = MessageRate()
+
+        async def handler(message):
+            received.append(message["value"])
+
+        async def run():
+            connection = QueueConnection()
+            subscription = connection.subscribe()
+            for i in range(250):
+                await connection.publish({"value": i})
+            await connection.publish(None)
+
+            await consume(subscription, handler, max_in_flight=4, batch_size=100, rate=rate)
+
+        asyncio.run(run())
+        self.assertEqual(received, list(range(250)))
+        self.assertEqual(rate.total, 250)
+        self.assertGreater(rate.per_second, 0)
+
+    def test_consume_max_in_flight(self):
+        active = []
+        peak = []
+
+        async def handler(message):
+            active.append(message)
+            peak.append(len(active))
+            await asyncio.sleep(0.001)
+            active.remove(message)
+
+        async def run():
+            connection = QueueConnection()
+            subscription = connection.subscribe()
+            for i in range(20):
+                await connection.publish({"value": i})
+            await connection.publish(None)
+
+            await consume(subscription, handler, max_in_flight=3)
+
+        asyncio.run(run())
+        self.assertEqual(max(peak), 3)
+
+    def test_consume_handler_error(self):
+        received = []
+
+        async def handler(message):
+            if message["value"] == 1:
+                raise ValueError("bad message")
+            received.append(message["value"])
+
+        async def run():
+            connection = QueueConnection()
+            subscription = connection.subscribe()
+            for i in range(3):
+                await connection.publish({"value": i})
+            await connection.publish(None)
+
+            with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()):
+                await consume(subscription, handler)
+            return output.getvalue()
+
+        # The error is reported and the other messages are still handled
+        self.assertIn("bad message", asyncio.run(run()))
+        self.assertEqual(received, [0, 2])
+
+    def test_consume_batched(self):
+        batches = []
+
+        async def handler(messages):
+            batches.append([message["value"] for message in messages])
+
+        async def run():
+            connection = QueueConnection()
+            subscription = connection.subscribe()
+            for i in range(25):
+                await connection.publish({"value": i})
+            await connection.publish(None)
+
+            await consume(subscription, handler, batch_size=10, batched=True)
+
+        asyncio.run(run())
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(sum(batches, []), list(range(25)))
+
+    def test_fan_out(self):
+        async def run():
+            connection = QueueConnection()
+            first = connection.subscribe()
+            second = connection.subscribe()
+            for i in range(3):
+                await connection.publish({"value": i})
+            return await first.read_many(10), await second.read_many(10)
+
+        first, second = asyncio.run(run())
+        self.assertEqual([item["value"] for item in first], [0, 1, 2])
+        self.assertEqual(first, second)
+
+    def test_reader_backpressure(self):
+        read = []
+
+        async def messages():
+            for i in range(10000):
+                read.append(i)
+                yield FakeMessage("sensors/kitchen", json.dumps({"value": i}).encode())
+
+        async def run():
+            connection = MQTTConnection(dict(), dict(), dict())
+            subscription = connection.subscribe(maxsize=10)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                reader = asyncio.create_task(connection._receive(messages()))
+                for _ in range(100):
+                    await asyncio.sleep(0)
+
+                # The reader waits for room instead of holding pending messages
+                flooded = (len(read), subscription.queue.qsize(), len(asyncio.all_tasks()))
+
+                received = []
+                while len(received) < 10000:
+                    received.extend(await subscription.read_many(100))
+                await reader
+
+            return flooded, [json.loads(message["payload"])["value"] for message in received]
+
+        (read_count, queued, tasks), received = asyncio.run(run())
+        self.assertEqual((read_count, queued), (11, 10))
+        self.assertLess(tasks, 5)
+        self.assertEqual(received, list(range(10000)))
+
+    def test_fan_out_full_queue(self):
+        async def run():
+            connection = QueueConnection()
+            slow = connection.subscribe(maxsize=1)
+            fast = connection.subscribe()
+            await connection.publish({"value": 0})
+
+            # The slow flow's full queue does not hold up the fast flow
+            publish = asyncio.create_task(connection.publish({"value": 1}))
+            fast_values = [item["value"] for item in await asyncio.wait_for(fast.read_many(10), 1)]
+            self.assertFalse(publish.done())
+
+            # but does hold back the connection until it has room
+            slow_values = [item["value"] for item in await slow.read_many(10)]
+            await asyncio.wait_for(publish, 1)
+            slow_values.extend(item["value"] for item in await slow.read_many(10))
+            return fast_values, slow_values
+
+        self.assertEqual(asyncio.run(run()), ([0, 1], [0, 1]))
+
+    def test_subscription_topics(self):
+        async def run():
+            connection = QueueConnection()
+            humidity = connection.subscribe(["humidity/#"])
+            everything = connection.subscribe()
+            await connection.publish({"value": 1}, topic="humidity/kitchen")
+            await connection.publish({"value": 2}, topic="temperature/kitchen")
+            return await humidity.read_many(10), await everything.read_many(10)
+
+        humidity, everything = asyncio.run(run())
+        self.assertEqual([item["value"] for item in humidity], [1])
+        self.assertEqual([item["value"] for item in everything], [1, 2])
+
+    def test_shared_connection(self):
+        settings = {"host": "shared-test-host", "port": 5580}
+        first, created = ConnectionFactory.get_connection("Websocket", settings, dict(), dict())
+        second, created_again = ConnectionFactory.get_connection("Websocket", dict(settings), dict(), dict())
+        other, _ = ConnectionFactory.get_connection("Websocket", {"host": "shared-test-host", "port": 5581}, dict(), dict())
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_publisher_pool(self):
+        settings = {"host": "localhost", "port": 1883, "username": "mqtt_user", "password": "mqtt_password"}
+        publisher = MqttPublisher.get(settings)
+
+        self.assertIs(MqttPublisher.get(dict(settings)), publisher)
+        self.assertIsNot(MqttPublisher.get(dict(settings, username="other")), publisher)
+
+    def test_publisher_unreachable_broker(self):
+        # Nothing listens on port 1 (and no MQTT broker in the test environment)
+        publisher = MqttPublisher({"host": "127.0.0.1", "port": 1}, reconnect_interval=0)
+        published = publisher.publish("sensors/response", "{}", qos=1)
+
+        with self.assertRaises(aiomqtt.MqttError):
+            published.result(timeout=10)
+        self.assertEqual(publisher.stats()["failed"], 1)
+
+    def test_publisher_bad_settings(self):
+        # A missing host is not an MqttError, but must not stop the publisher
+        publisher = MqttPublisher({"port": 1883}, reconnect_interval=0)
+
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                publisher.publish("sensors/response", "{}").result(timeout=10)
+        self.assertEqual(publisher.stats()["failed"], 2)
+
+
+class WebsocketConnectionTestCase(unittest.TestCase):
+    """Runs WebsocketConnection against a minimal Matter server stand-in."""
+
+    async def start_server(self, bad_frames=0):
+        self.listening = 0
+        self.sockets = []
+
+        async def handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            self.sockets.append(ws)
+
+            async for msg in ws:
+                message = msg.json()
+                if message["command"] == "start_listening":
+                    self.listening += 1
+                    await ws.send_json({"message_id": message["message_id"], "result": []})
+                    if self.listening <= bad_frames:
+                        await ws.send_str("{not json")
+                    await ws.send_json({"event": "node_added", "data": {"node_id": self.listening}})
+                else:
+                    # Answer slower commands later, so responses arrive out of order
+                    await asyncio.sleep(0.05 * message["args"]["delay"])
+                    await ws.send_json({"message_id": message["message_id"], "result": message["args"]})
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, WebsocketConnection({"host": "127.0.0.1", "port": port}, dict(), dict())
+
+    def test_commands_and_reconnect(self):
+        async def run():
+            runner, connection = await self.start_server()
+            connection.reconnect_delay = 0.01
+            subscription = connection.subscribe()
+            connect = asyncio.create_task(connection.connect())
+
+            # Commands sent concurrently get their own responses
+            responses = await asyncio.gather(
+                connection.command("get_node", {"delay": 2}),
+                connection.command("get_node", {"delay": 1}),
+            )
+
+            # Events (and the start_listening dump) go to the flows
+            first = await subscription.read_many(10)
+            while len(first) < 2:
+                first += await subscription.read_many(10)
+
+            # Drop the socket; the connection comes back and listens again
+            await self.sockets[0].close()
+            event = await asyncio.wait_for(subscription.read_input(), 5)
+            while "event" not in event:
+                event = await asyncio.wait_for(subscription.read_input(), 5)
+
+            await connection.disconnect()
+            await asyncio.wait_for(connect, 5)
+            await runner.cleanup()
+            return responses, first, event
+
+        responses, first, event = asyncio.run(run())
+        self.assertEqual([r["result"]["delay"] for r in responses], [2, 1])
+        self.assertEqual(first[1], {"event": "node_added", "data": {"node_id": 1}})
+        self.assertEqual(event["data"]["node_id"], 2)
+        self.assertEqual(self.listening, 2)
+
+    def test_reconnect_after_bad_frame(self):
+        async def run():
+            runner, connection = await self.start_server(bad_frames=1)
+            connection.reconnect_delay = 0.01
+            subscription = connection.subscribe()
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                connect = asyncio.create_task(connection.connect())
+
+                # The first socket dies on the bad frame, before its event
+                event = await asyncio.wait_for(subscription.read_input(), 5)
+                while "event" not in event:
+                    event = await asyncio.wait_for(subscription.read_input(), 5)
+
+                await connection.disconnect()
+                await asyncio.wait_for(connect, 5)
+            await runner.cleanup()
+            return event, output.getvalue()
+
+        event, output = asyncio.run(run())
+        self.assertEqual(event["data"]["node_id"], 2)
+        self.assertEqual(self.listening, 2)
+        self.assertIn("JSONDecodeError", output)
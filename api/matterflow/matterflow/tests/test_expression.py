@@ -0,0 +1,26 @@
+import unittest
+import jmespath
+from matterflow import compile_expression, search_expression, expression_cache_info
+from matterflow.expression import clear_expression_cache
+
+
+class ExpressionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        clear_expression_cache()
+        self.data = {"event": "attribute_updated", "data": [1, "0/6/0", True]}
+
+    def test_compile_once(self):
+        expression = compile_expression("data[1]")
+
+        self.assertIs(compile_expression("data[1]"), expression)
+        self.assertEqual(expression_cache_info().hits, 1)
+        self.assertEqual(expression_cache_info().misses, 1)
+
+    def test_search(self):
+        self.assertEqual(search_expression("data[1]", self.data), "0/6/0")
+        self.assertIsNone(search_expression("result", self.data))
+        self.assertEqual(expression_cache_info().currsize, 2)
+
+    def test_invalid_expression(self):
+        with self.assertRaises(jmespath.exceptions.ParseError):
+            search_expression("data[", self.data)
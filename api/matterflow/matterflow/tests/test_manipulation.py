@@ -0,0 +1,69 @@
+import unittest
+import copy
+import json
+import tracemalloc
+from matterflow.nodes import FilterNode, UnflattenAttributesNode
+from matterflow.nodes.manipulation.translateattributes import process_json
+
+
+class ManipulationCopyOnWriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.message = {
+            "event": "node_updated",
+            "data": {"node_id": 1, "attributes": {f"1/6/{i}": i for i in range(5000)}},
+        }
+        self.original = copy.deepcopy(self.message)
+
+    def flow_vars(self, filter, include=True, data=False):
+        flow_vars = {key: option.clone() for key, option in FilterNode.OPTIONS.items()}
+        flow_vars["filter"].set_value(filter)
+        flow_vars["include"].set_value(include)
+        flow_vars["data"].set_value(data)
+        return flow_vars
+
+    def peak_allocation(self, function):
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_filter_passes_message_on(self):
+        output = FilterNode(dict()).execute([self.message], self.flow_vars("event == 'node_updated'"))
+
+        self.assertIs(output, self.message)
+
+    def test_filter_rejects_message(self):
+        output = FilterNode(dict()).execute([self.message], self.flow_vars("event == 'attribute_updated'"))
+
+        self.assertEqual(output, {"filtered": "true"})
+
+    def test_filter_transformed_data(self):
+        messages = [{"node_id": 1}, {"node_id": 2}]
+        output = FilterNode(dict()).execute([messages], self.flow_vars("[*]", data=True))
+
+        self.assertEqual(output, [{"node_id": 1, "filtered": "true"}, {"node_id": 2}])
+        self.assertEqual(messages, [{"node_id": 1}, {"node_id": 2}])
+
+    def test_filter_allocation(self):
+        node = FilterNode(dict())
+        flow_vars = self.flow_vars("event == 'node_updated'")
+
+        round_trip = self.peak_allocation(lambda: json.loads(json.dumps(self.message)))
+        filtered = self.peak_allocation(lambda: node.execute([self.message], flow_vars))
+
+        # Passing the message on costs a fraction of copying it
+        self.assertLess(filtered * 10, round_trip)
+
+    def test_unflatten_copy_on_write(self):
+        output = UnflattenAttributesNode(dict()).execute([self.message], dict())
+
+        self.assertEqual(output["data"]["attributes"]["1"]["6"]["0"], 0)
+        self.assertDictEqual(self.message, self.original)
+
+    def test_translate_copy_on_write(self):
+        output = process_json(self.message)
+
+        self.assertIn("1/OnOff/OnOff", output["data"]["attributes"])
+        self.assertDictEqual(self.message, self.original)
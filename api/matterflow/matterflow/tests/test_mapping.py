@@ -0,0 +1,71 @@
+import unittest
+import json
+from matterflow.node import NodeException
+from matterflow.nodes import MappingNode
+from matterflow.nodes.manipulation.mapping import compile_mapping
+from matterflow.parameters import InstanceSelectParameter
+
+
+class MappingNodeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.mapping = json.dumps([
+            {"fieldName": "IntegerValue", "fieldDatatype": "Number", "fieldValue": "data[0]"},
+            {"fieldName": "Attribute", "fieldDatatype": "String", "fieldValue": "{{data[${IntegerValue}]}}"},
+            {"fieldName": "Path", "fieldDatatype": "String", "fieldValue": "/path/to/thing/${IntegerValue}"},
+            {"fieldName": "Missing", "fieldDatatype": "String", "fieldValue": "/path/${Unknown}"},
+            {"fieldName": "Value", "fieldDatatype": "Object", "fieldValue": "", "subInputFields": [
+                {"fieldName": "event", "fieldDatatype": "String", "fieldValue": "event"},
+                {"fieldName": "count", "fieldDatatype": "Number", "fieldValue": "count"},
+            ]},
+        ])
+        self.flow_vars = {"modelmapping": InstanceSelectParameter("ModelMapping")}
+        self.flow_vars["modelmapping"].set_value({"json_data": self.mapping})
+        self.data = {"event": "attribute_updated", "data": [1, "0/6/0", True], "count": "42"}
+
+    def test_execute(self):
+        node = MappingNode(dict())
+        output = json.loads(node.execute([self.data], self.flow_vars))
+
+        self.assertDictEqual(output, {
+            "IntegerValue": 1,
+            "Attribute": "0/6/0",
+            "Path": "/path/to/thing/1",
+            "Missing": "Error",
+            "Value": {"event": "attribute_updated", "count": 42},
+        })
+
+    def test_plan_cached(self):
+        self.assertIs(compile_mapping(self.mapping), compile_mapping(self.mapping))
+
+    def test_unable_to_find_match(self):
+        self.flow_vars["modelmapping"].set_value({"json_data": json.dumps([
+            {"fieldName": "Value", "fieldDatatype": "String", "fieldValue": "{{missing}}"}
+        ])})
+
+        with self.assertRaises(NodeException):
+            MappingNode(dict()).execute([self.data], self.flow_vars)
+
+    def test_invalid_required_expression(self):
+        self.flow_vars["modelmapping"].set_value({"json_data": json.dumps([
+            {"fieldName": "Value", "fieldDatatype": "String", "fieldValue": "{{data[}}"}
+        ])})
+        node = MappingNode(dict())
+
+        # The expression is returned as-is, unless there is no data to search
+        self.assertEqual(json.loads(node.execute([self.data], self.flow_vars)), {"Value": "data["})
+        with self.assertRaises(NodeException):
+            node.execute([], self.flow_vars)
+
+    def test_placeholders_in_values(self):
+        self.flow_vars["modelmapping"].set_value({"json_data": json.dumps([
+            {"fieldName": "Event", "fieldDatatype": "String", "fieldValue": "event"},
+            {"fieldName": "Name", "fieldDatatype": "String", "fieldValue": "name"},
+            {"fieldName": "Path", "fieldDatatype": "String", "fieldValue": "/path/${Name}"},
+            {"fieldName": "Both", "fieldDatatype": "String", "fieldValue": "${Name}/${Event}"},
+        ])})
+        data = dict(self.data, name="${Event}")
+        output = json.loads(MappingNode(dict()).execute([data], self.flow_vars))
+
+        # Left-over placeholders are an error, unless the template fills them
+        self.assertEqual(output["Path"], "Error")
+        self.assertEqual(output["Both"], "attribute_updated/attribute_updated")
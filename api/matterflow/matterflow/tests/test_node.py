@@ -1,4 +1,6 @@
 import unittest
+import subprocess
+import sys
 from matterflow import *
 from matterflow.nodes import *
 from matterflow.tests.sample_test_data import GOOD_NODES, BAD_NODES, DATA_FILES
@@ -106,3 +108,33 @@ class NodeTestCase(unittest.TestCase):
         except NodeException as e:
             self.assertEqual(str(e), "execute: JoinNode requires 2 inputs. 0 were provided")
 
+
+    def test_lazy_node_modules(self):
+        # A fresh interpreter, as other tests already imported every Node
+        code = (
+            "import sys\n"
+            "from matterflow import node_factory\n"
+            "node_factory({'node_type': 'connection', 'node_key': 'MqttConnectionOutNode'})\n"
+            "print(sorted(m for m in ('boto3', 'pandas', 'altair') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_node_modules(self):
+        import matterflow.nodes
+
+        for name in matterflow.nodes.NODE_MODULES:
+            self.assertTrue(issubclass(getattr(matterflow.nodes, name), Node))
+
+    def test_node_class_registry(self):
+        from matterflow.node_factory import get_node_class
+
+        self.assertIs(get_node_class("manipulation", "FilterNode"), FilterNode)
+        self.assertIs(Node.node_classes[("manipulation", "FilterNode")], FilterNode)
+        self.assertIsNone(get_node_class("io", "FilterNode"))
+        self.assertIsNone(get_node_class("io", "UnknownNode"))
+
+    def test_unknown_node(self):
+        self.assertIsNone(node_factory({"node_type": "io", "node_key": "UnknownNode"}))
+        self.assertIsNone(node_factory({"node_type": "custom_nodes", "node_key": "UnknownNode", "filename": "unknown"}))
@@ -53,3 +53,33 @@ class ParameterTestCase(unittest.TestCase):
         except ParameterValidationError as e:
             self.assertEqual(str(e), "Invalid value '42' (type 'int') for StringParameter")
 
+
+    def test_clone_select_param(self):
+        param = SelectParameter("Window", options=["tumbling", "sliding"], default="tumbling", docstring="my docstring")
+        param.set_value("sliding")
+        clone = param.clone()
+
+        self.assertEqual(clone.options, ["tumbling", "sliding"])
+        self.assertEqual(clone.get_value(), "tumbling")
+        self.assertEqual(clone.docstring, "my docstring")
+
+    def test_options_cached(self):
+        node = Node({"name": "Test", "node_id": "1", "node_type": "io"})
+        node.OPTIONS = {"index": StringParameter("Index", default="a")}
+
+        options = node.options
+        self.assertIs(node.options, options)
+
+        node.option_values["index"] = "b"
+        self.assertIsNot(node.options, options)
+        self.assertEqual(node.options["index"].get_value(), "b")
+
+    def test_execution_options_leave_options_unchanged(self):
+        node = Node({"name": "Test", "node_id": "1", "node_type": "io", "options": {"file": "data.csv"}})
+        node.OPTIONS = {"file": FileParameter("File")}
+        workflow = Workflow("Options Test", root_dir="/tmp")
+
+        execution_options = node.get_execution_options(workflow, dict())
+
+        self.assertEqual(execution_options["file"].get_value(), "/tmp/data.csv")
+        self.assertEqual(node.options["file"].get_value(), "data.csv")
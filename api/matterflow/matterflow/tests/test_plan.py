@@ -0,0 +1,345 @@
+import unittest
+import asyncio
+import time
+import json
+import os
+import networkx as nx
+from matterflow import Workflow, WorkflowException, node_factory, MemoryResultStore
+from matterflow.node import IONode
+
+
+class SlowWriteNode(IONode):
+    """Stands in for a cloud writer making a slow, blocking call."""
+    name = "Slow Write"
+    num_in = 1
+    num_out = 0
+    blocking = True
+    OPTIONS = dict()
+
+    def execute(self, predecessor_data, flow_vars):
+        time.sleep(0.2)
+        return predecessor_data[0]
+
+
+class WorkflowPlanTestCase(unittest.TestCase):
+    def setUp(self):
+        with open('/tmp/plan_sample.json', 'w') as f:
+            json.dump({"event": "attribute_updated", "data": [1, "0/40/6", 99]}, f)
+
+        self.workflow = Workflow("Plan Test", root_dir="/tmp", graph=nx.DiGraph(),
+                                 flow_vars=nx.Graph(), store=MemoryResultStore())
+
+        read_json = node_factory({
+            "name": "Read Json",
+            "node_id": "1",
+            "node_type": "io",
+            "node_key": "ReadJsonNode",
+            "options": {"file": "plan_sample.json"},
+        })
+        filter_node = node_factory({
+            "name": "Filter",
+            "node_id": "2",
+            "node_type": "manipulation",
+            "node_key": "FilterNode",
+            "options": {"filter": "data[2]"},
+            "option_replace": {
+                "filter": {"node_id": "3", "is_global": False}
+            }
+        })
+        string_node = node_factory({
+            "name": "String Input",
+            "node_id": "3",
+            "node_type": "flow_control",
+            "node_key": "StringNode",
+            "options": {"default_value": "event", "var_name": "expression"},
+        })
+
+        for node in [read_json, filter_node, string_node]:
+            self.workflow.update_or_add_node(node)
+
+        self.workflow.add_edge(read_json, filter_node)
+        self.workflow.add_edge(string_node, filter_node)
+
+    def run_plan(self, plan):
+        for node_id in plan.execution_order:
+            plan.execute(node_id)
+
+        return self.workflow.retrieve_node_data(plan.get_node("2"))
+
+    def test_compile(self):
+        plan = self.workflow.compile()
+
+        self.assertEqual(len(plan.execution_order), 3)
+        self.assertIs(plan.get_node("2"), plan.get_node("2"))
+
+    def test_execute_plan(self):
+        plan = self.workflow.compile()
+
+        self.assertEqual(self.run_plan(plan)["event"], "attribute_updated")
+        self.assertEqual(self.run_plan(plan)["event"], "attribute_updated")
+
+    def test_options_resolved_once(self):
+        plan = self.workflow.compile()
+
+        options = plan.execution_options("2")
+        self.assertIs(plan.execution_options("2"), options)
+        self.assertEqual(options["filter"].get_value(), "event")
+
+    def test_set_option(self):
+        plan = self.workflow.compile()
+
+        options = plan.execution_options("1")
+        plan.set_option("1", "file", "missing.json")
+
+        self.assertIsNot(plan.execution_options("1"), options)
+        self.assertEqual(plan.execution_options("1")["file"].get_value(), "/tmp/missing.json")
+
+    def test_inject_payload(self):
+        ws_node = node_factory({
+            "name": "Matter WS Connection (In)",
+            "node_id": "4",
+            "node_type": "connection",
+            "node_key": "WsConnectionNode",
+            "options": {"accept_events": "event == 'attribute_updated'"},
+        })
+        self.workflow.update_or_add_node(ws_node)
+        plan = self.workflow.compile()
+
+        message = {"event": "attribute_updated", "data": [1, "0/6/0", True]}
+        plan.execute("4", payload=message)
+        self.assertIs(self.workflow.retrieve_node_data(plan.get_node("4")), message)
+
+        plan.execute("4", payload={"event": "node_added"})
+        rejected = self.workflow.retrieve_node_data(plan.get_node("4"))
+        self.assertEqual(rejected["meta"]["status"], "rejected")
+
+    def test_payload_ignored_by_other_nodes(self):
+        plan = self.workflow.compile()
+
+        plan.execute("1", payload={"event": "node_added"})
+        data = self.workflow.retrieve_node_data(plan.get_node("1"))
+        self.assertEqual(data["event"], "attribute_updated")
+
+    def test_fail_execute_node(self):
+        plan = self.workflow.compile()
+
+        with self.assertRaises(WorkflowException):
+            plan.execute("100")
+
+    def add_batch_nodes(self):
+        ws_node = node_factory({
+            "name": "Matter WS Connection (In)",
+            "node_id": "4",
+            "node_type": "connection",
+            "node_key": "WsConnectionNode",
+            "options": {"accept_events": "event == 'attribute_updated'"},
+        })
+        filter_node = node_factory({
+            "name": "Filter",
+            "node_id": "5",
+            "node_type": "manipulation",
+            "node_key": "FilterNode",
+            "options": {"filter": "data[2]"},
+        })
+        self.workflow.update_or_add_node(ws_node)
+        self.workflow.update_or_add_node(filter_node)
+        self.workflow.add_edge(ws_node, filter_node)
+
+    def test_execute_batch(self):
+        self.add_batch_nodes()
+        plan = self.workflow.compile()
+
+        payloads = [
+            {"event": "attribute_updated", "data": [1, "0/6/0", True]},
+            {"event": "node_added", "data": 1},
+            {"event": "attribute_updated", "data": [1, "0/6/0", False]},
+        ]
+        outputs = plan.execute_batch(payloads)
+
+        self.assertEqual(outputs["4"][0], payloads[0])
+        self.assertEqual(outputs["4"][1]["meta"]["status"], "rejected")
+        self.assertEqual(outputs["5"][0], payloads[0])
+        self.assertEqual(outputs["5"][1]["meta"]["reason"], "Data rejected by previous nodes")
+        self.assertEqual(outputs["5"][2], {"filtered": "true"})
+
+        # Nodes without payloads run once per message on their own input
+        self.assertEqual(len(outputs["2"]), 3)
+        self.assertEqual(outputs["2"][0]["event"], "attribute_updated")
+
+        # The last message's output is stored, as after sequential execution
+        self.assertEqual(self.workflow.retrieve_node_data(plan.get_node("5")), {"filtered": "true"})
+
+    def test_execute_batch_matches_execute(self):
+        self.add_batch_nodes()
+        plan = self.workflow.compile()
+
+        payloads = [{"event": "attribute_updated", "data": [1, "0/6/0", value]} for value in [True, False, 3]]
+
+        expected = list()
+        for payload in payloads:
+            for node_id in plan.execution_order:
+                plan.execute(node_id, payload)
+            expected.append(self.workflow.retrieve_node_data(plan.get_node("5")))
+
+        self.assertEqual(plan.execute_batch(payloads)["5"], expected)
+
+    def test_execute_batch_write_csv(self):
+        csv_file = "/tmp/plan_batch.csv"
+        if os.path.exists(csv_file):
+            os.remove(csv_file)
+
+        write_csv = node_factory({
+            "name": "Write Json To Csv",
+            "node_id": "6",
+            "node_type": "io",
+            "node_key": "WriteJsonToCsvNode",
+            "options": {"file": csv_file, "write_mode": "append", "exclude": "data[?@ == `99`]"},
+        })
+        outputs = write_csv.execute_batch(
+            [[{"node": 1, "value": i}] for i in range(3)] + [[{"data": [99]}]],
+            write_csv.get_execution_options(self.workflow, dict())
+        )
+
+        self.assertEqual(outputs[-1], '{"excluded":"true"}')
+        with open(csv_file) as f:
+            self.assertEqual(f.read().splitlines(), ["node,value", "1,0", "1,1", "1,2"])
+
+    def compile_fan_out(self, **kwargs):
+        for node_id in ["7", "8"]:
+            node = node_factory({
+                "name": "Write Json To Csv",
+                "node_id": node_id,
+                "node_type": "io",
+                "node_key": "WriteJsonToCsvNode",
+            })
+            self.workflow.update_or_add_node(node)
+            self.workflow.add_edge(self.workflow.get_node("1"), node)
+
+        plan = self.workflow.compile(**kwargs)
+        for node_id in ["7", "8"]:
+            plan.nodes[node_id] = SlowWriteNode({"node_id": node_id, "node_type": "io"})
+        return plan
+
+    def test_execute_async(self):
+        plan = self.compile_fan_out()
+
+        started = time.monotonic()
+        asyncio.run(plan.execute_async())
+        elapsed = time.monotonic() - started
+
+        # Both slow branches ran at the same time
+        self.assertLess(elapsed, 0.35)
+        for node_id in ["2", "7", "8"]:
+            data = self.workflow.retrieve_node_data(plan.get_node(node_id))
+            self.assertEqual(data["event"], "attribute_updated")
+
+    def test_execute_async_concurrency_limit(self):
+        plan = self.compile_fan_out(max_concurrency=1)
+
+        started = time.monotonic()
+        asyncio.run(plan.execute_async())
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.4)
+
+    def test_execute_batch_async(self):
+        plan = self.compile_fan_out()
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            outputs = await plan.execute_batch_async([None])
+            ticker.cancel()
+            return outputs
+
+        outputs = asyncio.run(run())
+
+        # The event loop kept running while the slow writers blocked
+        self.assertGreater(len(ticks), 10)
+        self.assertEqual(outputs["7"][0]["event"], "attribute_updated")
+
+    def add_timer_nodes(self):
+        ws_node = node_factory({
+            "name": "Matter WS Connection (In)",
+            "node_id": "4",
+            "node_type": "connection",
+            "node_key": "WsConnectionNode",
+            "options": {"accept_events": "event"},
+        })
+        time_buffer = node_factory({
+            "name": "TimeBuffer",
+            "node_id": "9",
+            "node_type": "manipulation",
+            "node_key": "TimeBufferNode",
+            "options": {"bufferTime": 3600, "persist": False},
+        })
+        filter_node = node_factory({
+            "name": "Filter",
+            "node_id": "10",
+            "node_type": "manipulation",
+            "node_key": "FilterNode",
+            "options": {"filter": "[?data[2]]"},
+        })
+        for node in [ws_node, time_buffer, filter_node]:
+            self.workflow.update_or_add_node(node)
+        self.workflow.add_edge(ws_node, time_buffer)
+        self.workflow.add_edge(time_buffer, filter_node)
+
+    def test_execute_timer(self):
+        self.add_timer_nodes()
+        plan = self.workflow.compile()
+        self.assertEqual(plan.timed_nodes(), ["9"])
+
+        message = {"event": "attribute_updated", "data": [1, "0/6/0", True]}
+        for node_id in plan.execution_order:
+            plan.execute(node_id, message)
+
+        due = plan.next_timer("9", time.time())
+        asyncio.run(plan.execute_timer("9", due))
+
+        self.assertEqual(self.workflow.retrieve_node_data(plan.get_node("10")), [message])
+        self.assertIsNone(plan.next_timer("9", due))
+
+    def test_execute_timer_blocking(self):
+        self.add_timer_nodes()
+        for node_id in ["11", "12"]:
+            self.workflow.update_or_add_node(node_factory({
+                "name": "Write Json To Csv",
+                "node_id": node_id,
+                "node_type": "io",
+                "node_key": "WriteJsonToCsvNode",
+            }))
+            self.workflow.add_edge(self.workflow.get_node("9"), self.workflow.get_node(node_id))
+
+        plan = self.workflow.compile()
+        for node_id in ["11", "12"]:
+            plan.nodes[node_id] = SlowWriteNode({"node_id": node_id, "node_type": "io"})
+
+        message = {"event": "attribute_updated", "data": [1, "0/6/0", True]}
+        plan.execute("4", message)
+        plan.execute("9")
+        due = plan.next_timer("9", time.time())
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            started = time.monotonic()
+            await plan.execute_timer("9", due)
+            ticker.cancel()
+            return time.monotonic() - started
+
+        elapsed = asyncio.run(run())
+
+        # The slow writers ran side by side in the executor, off the event loop
+        self.assertLess(elapsed, 0.35)
+        self.assertGreater(len(ticks), 10)
+        self.assertEqual(self.workflow.retrieve_node_data(plan.get_node("11")), [message])
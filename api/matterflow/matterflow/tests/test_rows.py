@@ -0,0 +1,118 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from matterflow import Workflow, WorkflowException, Node, FileResultStore
+from matterflow.rows import (
+    ARRAY, ROW_INDEX_STEP, dump_rows, index_path, iter_json_array, read_row_index, read_rows, write_row_index
+)
+
+
+class RowsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.rows = [{"node_id": i, "value": "reading\n%d" % i} for i in range(2 * ROW_INDEX_STEP + 50)]
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def path(self, file_name):
+        return os.path.join(self.dir.name, file_name)
+
+    def write_indexed(self, file_name):
+        path = self.path(file_name)
+        with open(path, 'wb') as f:
+            offsets = dump_rows(self.rows, f)
+        write_row_index(path, ARRAY, len(self.rows), offsets)
+        return path
+
+    def test_dump_rows_is_json(self):
+        path = self.write_indexed('rows')
+
+        with open(path) as f:
+            self.assertEqual(json.load(f), self.rows)
+
+    def test_read_indexed_rows(self):
+        path = self.write_indexed('rows')
+
+        rows, total = read_rows(path, ROW_INDEX_STEP + 5, 3)
+        self.assertEqual(total, len(self.rows))
+        self.assertEqual(rows, self.rows[ROW_INDEX_STEP + 5:ROW_INDEX_STEP + 8])
+
+        # Windows past the last row
+        self.assertEqual(read_rows(path, len(self.rows) - 2, 10)[0], self.rows[-2:])
+        self.assertEqual(read_rows(path, len(self.rows), 10)[0], [])
+        self.assertEqual(read_rows(path)[0], self.rows)
+
+    def test_stale_index(self):
+        path = self.write_indexed('rows')
+
+        with open(path, 'w') as f:
+            json.dump(self.rows[:3], f)
+
+        self.assertIsNone(read_row_index(path))
+        self.assertEqual(read_rows(path, 1, 5), (self.rows[1:3], 3))
+
+    def test_read_jsonl(self):
+        path = self.path('readings.jsonl')
+        with open(path, 'w') as f:
+            for row in self.rows:
+                f.write(json.dumps(row) + '\n\n')
+
+        self.assertEqual(read_rows(path, 2 * ROW_INDEX_STEP + 1, 2), (self.rows[2 * ROW_INDEX_STEP + 1:2 * ROW_INDEX_STEP + 3], len(self.rows)))
+        self.assertTrue(os.path.exists(index_path(path)))
+
+    def test_iter_json_array(self):
+        data = [1, 23456, "a, ]", {"b": [1, 2]}, None, 7.5]
+        document = json.dumps(data, indent=2)
+
+        self.assertEqual(list(iter_json_array(io.StringIO(document))), data)
+
+        # Items split across reads
+        self.assertEqual(list(iter_json_array(SlowReader(document))), data)
+
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO('{"a": 1}')))
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO('[1, 2')))
+
+    def test_read_unindexed_rows(self):
+        path = self.path('rows.json')
+        with open(path, 'w') as f:
+            json.dump(self.rows, f)
+
+        self.assertEqual(read_rows(path, 10, 2), (self.rows[10:12], len(self.rows)))
+
+    def test_read_document(self):
+        path = self.path('document.json')
+        with open(path, 'w') as f:
+            json.dump({"a": 1}, f)
+
+        self.assertEqual(read_rows(path), ([{"a": 1}], 1))
+        self.assertEqual(read_rows(path, 1), ([], 1))
+
+    def test_workflow_rows(self):
+        workflow = Workflow("Rows Test", root_dir=self.dir.name, store=FileResultStore())
+        node = Node({"name": "Test", "node_id": "1", "node_type": "io"})
+        node.data = Workflow.store_node_data(workflow, "1", self.rows)
+
+        page = workflow.retrieve_node_rows(node, offset=5, limit=2, query="node_id")
+        self.assertDictEqual(page, {'offset': 5, 'limit': 2, 'total': len(self.rows), 'rows': [5, 6]})
+
+        page = workflow.retrieve_node_rows_by_file(node.data, limit=1)
+        self.assertEqual(page['rows'], self.rows[:1])
+
+        with self.assertRaises(WorkflowException):
+            workflow.retrieve_node_rows(node, query="[")
+
+        # Output which is not a list has no index
+        Workflow.store_node_data(workflow, "1", {"a": 1})
+        self.assertFalse(os.path.exists(index_path(workflow.path(node.data))))
+        self.assertEqual(workflow.retrieve_node_rows(node)['rows'], [{"a": 1}])
+
+
+class SlowReader(io.StringIO):
+    def read(self, size=-1):
+        return super().read(3)
@@ -0,0 +1,63 @@
+import unittest
+import copy
+import json
+import os
+from matterflow import Workflow, WorkflowException, Node, MemoryResultStore, FileResultStore, node_factory
+
+
+class ResultStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data = {"event": "attribute_updated", "data": [1, "0/40/6", 99]}
+        self.node = Node({"name": "Test", "node_id": "1", "node_type": "io"})
+
+    def test_workflow_default_store(self):
+        workflow = Workflow("Store Test", root_dir="/tmp")
+        self.assertIsInstance(workflow.store, MemoryResultStore)
+
+    def test_memory_store_round_trip(self):
+        workflow = Workflow("Store Test", root_dir="/tmp", store=MemoryResultStore())
+
+        self.node.data = Workflow.store_node_data(workflow, "1", self.data)
+
+        self.assertEqual(self.node.data, "Store Test-1")
+        self.assertIs(workflow.retrieve_node_data(self.node), self.data)
+
+    def test_file_store_round_trip(self):
+        workflow = Workflow("File Store Test", root_dir="/tmp", store=FileResultStore())
+
+        self.node.data = Workflow.store_node_data(workflow, "1", self.data)
+
+        self.assertTrue(os.path.exists(workflow.path(self.node.data)))
+        self.assertDictEqual(workflow.retrieve_node_data(self.node), self.data)
+
+    def test_missing_data(self):
+        workflow = Workflow("Store Test", root_dir="/tmp", store=MemoryResultStore())
+        self.node.data = "Store Test-missing"
+
+        self.assertIn("error", workflow.retrieve_node_data(self.node))
+
+    def test_not_executed(self):
+        workflow = Workflow("Store Test", root_dir="/tmp", store=MemoryResultStore())
+
+        with self.assertRaises(WorkflowException):
+            workflow.retrieve_node_data(self.node)
+
+    def test_shared_input_not_modified(self):
+        # Nodes receive the stored object itself, which siblings share
+        message = {
+            "data": {"attributes": {"0/6/0": True}},
+            "result": [{"node_id": 1, "attributes": {"1/6/0": False}}],
+        }
+        original = copy.deepcopy(message)
+
+        for node_key in ["TranslateAttributesNode", "UnflattenAttributesNode"]:
+            node = node_factory({
+                "name": node_key,
+                "node_id": node_key,
+                "node_type": "manipulation",
+                "node_key": node_key,
+            })
+            output = node.execute([message], dict())
+
+            self.assertNotEqual(output, json.dumps(original))
+            self.assertEqual(message, original)
@@ -0,0 +1,50 @@
+import unittest
+from matterflow.nodes.manipulation.translateattributes import (
+    get_cluster_index, process_json, translate_attributes_with_endpoint,
+    test_data_with_endpoint_flattened, test_data_with_endpoint_non_flattened
+)
+
+
+class TranslateAttributesTestCase(unittest.TestCase):
+    def test_cluster_index(self):
+        index = get_cluster_index()
+
+        self.assertIs(index, get_cluster_index())
+        self.assertEqual(index.clusters[6], "OnOff")
+        self.assertEqual(index.attributes[(6, 16384)], "GlobalSceneControl")
+        self.assertEqual(index.path(8, 0), "LevelControl/CurrentLevel")
+        self.assertEqual(index.path(8, 9999), "LevelControl/9999")
+        self.assertEqual(index.path(9999, 1), "9999/1")
+
+    def test_translate_flattened(self):
+        translated = translate_attributes_with_endpoint(test_data_with_endpoint_flattened)
+
+        self.assertEqual(translated["0/Identify/IdentifyTime"], 10)
+        self.assertEqual(translated["1/OnOff/GlobalSceneControl"], True)
+        self.assertEqual(translated["3/EthernetNetworkDiagnostics/FullDuplex"], True)
+
+    def test_translate_non_flattened(self):
+        translated = translate_attributes_with_endpoint(test_data_with_endpoint_non_flattened)
+
+        self.assertDictEqual(translated["1"], {
+            "Groups": {"NameSupport": True},
+            "OnOff": {"OnOff": False, "GlobalSceneControl": True},
+        })
+
+    def test_translate_unknown(self):
+        translated = translate_attributes_with_endpoint({"0/9999/1": 1, "0/6/9999": 2})
+
+        self.assertDictEqual(translated, {"0/9999/1": 1, "0/OnOff/9999": 2})
+
+    def test_process_attribute_updated(self):
+        message = {"event": "attribute_updated", "data": [1, "1/6/0", True]}
+
+        self.assertEqual(process_json(message)["data"], [1, "1/OnOff/OnOff", True])
+
+    def test_process_node_updated(self):
+        message = {"event": "node_updated", "data": {"node_id": 1, "attributes": {"0/40/1": "Vendor", "1/6/0": False}}}
+
+        self.assertDictEqual(process_json(message)["data"]["attributes"], {
+            "0/BasicInformation/VendorName": "Vendor",
+            "1/OnOff/OnOff": False,
+        })
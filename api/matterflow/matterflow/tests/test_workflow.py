@@ -1,6 +1,8 @@
 import unittest
+import io
 import os
 from matterflow import Workflow, WorkflowException, Node, NodeException, node_factory
+from matterflow.workflow import WorkflowUtils
 import networkx as nx
 
 from matterflow.tests.sample_test_data import GOOD_NODES, BAD_NODES, DATA_FILES
@@ -84,6 +86,31 @@ class WorkflowTestCase(unittest.TestCase):
         result = self.workflow.get_packaged_nodes(root_path="foobar")
         self.assertIsNone(result)
 
+    def test_extract_node_info_skips_helper_classes(self):
+        # Node modules may define helper classes besides their Node
+        for node, node_key in [('mapping', 'MappingNode'), ('translateattributes', 'TranslateAttributesNode')]:
+            node_info = WorkflowUtils.extract_node_info('manipulation', node, None)
+            self.assertEqual(node_info['node_key'], node_key)
+
+    def test_workflow_packaged_nodes_cached(self):
+        packaged = self.workflow.packaged_nodes()
+        self.assertIs(self.workflow.packaged_nodes(), packaged)
+        self.assertIs(self.workflow.get_packaged_nodes(), packaged.nodes)
+
+        # Adding a Node directory rebuilds the catalogue
+        os.makedirs(os.path.join(self.workflow.node_dir, 'extra'), exist_ok=True)
+        try:
+            rebuilt = self.workflow.packaged_nodes()
+            self.assertIsNot(rebuilt, packaged)
+            self.assertIn('Extra', rebuilt.nodes)
+            self.assertNotEqual(rebuilt.etag, packaged.etag)
+
+            Workflow.clear_packaged_nodes(self.workflow.node_dir)
+            self.assertIsNot(self.workflow.packaged_nodes(), rebuilt)
+        finally:
+            os.rmdir(os.path.join(self.workflow.node_dir, 'extra'))
+            Workflow.clear_packaged_nodes()
+
     def test_get_flow_variables(self):
         flow_var_options = self.workflow.get_all_flow_var_options("1")
 
@@ -153,6 +180,31 @@ class WorkflowTestCase(unittest.TestCase):
 
         self.assertDictEqual(retrieved_node.__dict__, read_csv_node.__dict__)
 
+    def test_get_node_cached(self):
+        workflow = Workflow("Cache Test", root_dir="/tmp", graph=nx.DiGraph())
+        node_info = dict(self.read_csv_node, node_id="cached")
+        workflow.update_or_add_node(node_factory(node_info))
+
+        node = workflow.get_node("cached")
+        self.assertIs(workflow.get_node("cached"), node)
+
+        workflow.update_or_add_node(node_factory(dict(node_info, name="Renamed")))
+        self.assertEqual(workflow.get_node("cached").name, "Renamed")
+
+        workflow.remove_node(node)
+        self.assertIsNone(workflow.get_node("cached"))
+
+    def test_workflow_modified(self):
+        workflow = Workflow("Modified Test", root_dir="/tmp", graph=nx.DiGraph())
+        self.assertFalse(workflow.modified)
+
+        workflow.get_node("1")
+        workflow.execution_order()
+        self.assertFalse(workflow.modified)
+
+        workflow.update_or_add_node(node_factory(dict(self.read_csv_node, node_id="modified")))
+        self.assertTrue(workflow.modified)
+
     def test_fail_get_node(self):
         retrieved_node = self.workflow.get_flow_var("100")
 
@@ -238,6 +290,17 @@ class WorkflowTestCase(unittest.TestCase):
         self.assertEqual(file.name, "/tmp/sample1.csv")
         file.close()
 
+    def test_upload_file_chunks(self):
+        class UploadedFile(io.BytesIO):
+            def chunks(self):
+                return iter([b'a,b\n', b'1,2\n'])
+
+        to_open = Workflow.upload_file(UploadedFile(), '/tmp/sample_chunks.csv')
+
+        with open(to_open, 'rb') as f:
+            self.assertEqual(f.read(), b'a,b\n1,2\n')
+        os.remove(to_open)
+
     def test_download_file_error(self):
         self.assertIsNone(self.workflow.download_file("100"))
 
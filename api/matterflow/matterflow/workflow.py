@@ -1,6 +1,9 @@
+import asyncio
+import hashlib
 import inspect
 import importlib
 import json
+import jmespath
 import os
 import networkx as nx
 import sys
@@ -8,10 +11,11 @@ import sys
 from collections import OrderedDict
 from modulefinder import ModuleFinder
 
-from matterflow.nodes import ReadCsvNode, WriteCsvNode
-
 from .node import Node, NodeException
 from .node_factory import node_factory
+from .expression import compile_expression
+from .rows import read_rows
+from .store import MemoryResultStore
 
 
 class Workflow:
@@ -23,20 +27,36 @@ class Workflow:
         node_dir: Location of custom nodes
         graph: A NetworkX Directed Graph
         flow_vars: Global flow variables associated with workflow
+        store: ResultStore holding the output of executed Nodes
+        modified: True once the name, Nodes or edges changed, e.g. to
+            decide whether the Workflow has to be saved again
     """
 
     DEFAULT_ROOT_PATH = os.getcwd()
     DEFAULT_NODE_PATH = os.path.join(os.getcwd(), '../matterflow/matterflow/nodes')
 
+    # Size of the blocks files are copied in by upload_file()
+    FILE_CHUNK_SIZE = 64 * 1024
+
+    # node_dir -> PackagedNodes, see get_packaged_nodes()
+    _packaged_nodes = dict()
+
     def __init__(self, name="Untitled", root_dir=DEFAULT_ROOT_PATH,
                  node_dir=DEFAULT_NODE_PATH, graph=nx.DiGraph(),
-                 flow_vars=nx.Graph()):
+                 flow_vars=nx.Graph(), store=None):
         try:
             self._name = name
             self._root_dir = WorkflowUtils.set_dir(root_dir)
             self._node_dir = WorkflowUtils.set_dir(node_dir, custom_nodes=True)
             self._graph = graph
             self._flow_vars = flow_vars
+            self._store = store if store is not None else MemoryResultStore()
+
+            # Node objects built from the graphs by node_id, see get_node()
+            self._nodes = dict()
+            self._flow_var_nodes = dict()
+
+            self.modified = False
         except OSError as e:
             raise WorkflowException('init workflow', str(e))
 
@@ -62,6 +82,10 @@ class Workflow:
     def flow_vars(self):
         return self._flow_vars
 
+    @property
+    def store(self):
+        return self._store
+
     def get_packaged_nodes(self, root_path=None, node_type=None):
         """Retrieve list of Nodes available to the Workflow.
 
@@ -90,9 +114,14 @@ class Workflow:
                 ]
                 ...
             }
+
+            When `root_path` is not specified, the catalogue of `node_dir`
+            is built once and shared until a Node directory changes (see
+            `packaged_nodes()`), so it must not be modified.
         """
         if root_path is None:
-            root_path = self.node_dir
+            packaged = self.packaged_nodes()
+            return None if packaged is None else packaged.nodes
 
         try:
             files = os.listdir(root_path)
@@ -128,29 +157,89 @@ class Workflow:
             # Otherwise, return list containing all Nodes of a `node_type`
             return nodes
 
+    def packaged_nodes(self):
+        """Cached catalogue of the Nodes in `node_dir`.
+
+        Building the catalogue imports every Node module, so it is only
+        rebuilt once the modification time of `node_dir` or one of its
+        sub-directories changed, i.e. a Node file was added or removed.
+        Overwriting an existing file does not change these, so uploads
+        call `clear_packaged_nodes()`.
+
+        Returns:
+            PackagedNodes, or None if `node_dir` cannot be read.
+        """
+        try:
+            mtimes = WorkflowUtils.get_dir_mtimes(self.node_dir)
+        except OSError:
+            return None
+
+        packaged = Workflow._packaged_nodes.get(self.node_dir)
+        if packaged is not None and packaged.mtimes == mtimes:
+            return packaged
+
+        nodes = self.get_packaged_nodes(self.node_dir)
+        if nodes is None:
+            return None
+
+        # Importing the Node modules may have created __pycache__ directories
+        try:
+            mtimes = WorkflowUtils.get_dir_mtimes(self.node_dir)
+        except OSError:
+            return None
+
+        packaged = PackagedNodes(mtimes, nodes)
+        Workflow._packaged_nodes[self.node_dir] = packaged
+        return packaged
+
+    @classmethod
+    def clear_packaged_nodes(cls, node_dir=None):
+        """Drop the cached catalogue of `node_dir`, or of all directories."""
+        if node_dir is None:
+            cls._packaged_nodes.clear()
+        else:
+            cls._packaged_nodes.pop(node_dir, None)
+
     def get_node(self, node_id):
         """Retrieves Node from workflow, if exists
 
+        Node objects are built once and cached until the Node is updated or
+        removed. The same object is returned on every call, so changes to it
+        must be saved with `update_or_add_node()`.
+
         Return:
             Node object, if one exists. Otherwise, None.
         """
-        if self._graph.has_node(node_id) is not True:
-            return None
-
-        node_info = self.graph.nodes[node_id]
-        return node_factory(node_info)
+        return self._get_cached_node(self.graph, self._nodes, node_id)
 
     def get_flow_var(self, node_id):
         """Retrieves a global flow variable from workflow, if exists
 
+        Cached like `get_node()`.
+
         Return:
             FlowNode object, if one exists. Otherwise, None.
         """
-        if self.flow_vars.has_node(node_id) is not True:
+        return self._get_cached_node(self.flow_vars, self._flow_var_nodes, node_id)
+
+    @staticmethod
+    def _get_cached_node(graph, nodes, node_id):
+        if graph.has_node(node_id) is not True:
             return None
 
-        node_info = self.flow_vars.nodes[node_id]
-        return node_factory(node_info)
+        node = nodes.get(node_id)
+        if node is not None:
+            return node
+
+        node = node_factory(graph.nodes[node_id])
+        if node is not None:
+            nodes[node_id] = node
+        return node
+
+    def _node_changed(self, node_id):
+        self._nodes.pop(node_id, None)
+        self._flow_var_nodes.pop(node_id, None)
+        self.modified = True
 
     def get_all_flow_var_options(self, node_id):
         """Retrieve all FlowNode options for a specified Node.
@@ -189,6 +278,8 @@ class Workflow:
         if graph.has_node(node.node_id) is False:
             graph.add_node(node.node_id)
 
+        self._node_changed(node.node_id)
+
         # NetworkX cannot store mutable data, so iterate through all Node
         # attributes to add to graph
         node_dict = node.__dict__
@@ -207,6 +298,7 @@ class Workflow:
     @name.setter
     def name(self, name: str):
         self._name = name
+        self.modified = True
 
     @property
     def filename(self):
@@ -231,6 +323,7 @@ class Workflow:
             raise WorkflowException('add_node', 'Edge between nodes already exists.')
 
         self.graph.add_edge(from_id, to_id)
+        self.modified = True
 
         return (from_id, to_id)
 
@@ -251,6 +344,8 @@ class Workflow:
         except nx.NetworkXError:
             raise WorkflowException('remove_edge', 'Edge from %s to %s does not exist in graph.' % (from_id, to_id))
 
+        self.modified = True
+
         return (from_id, to_id)
 
     def remove_node(self, node):
@@ -264,6 +359,7 @@ class Workflow:
             graph = self.flow_vars if node.is_global else self.graph
 
             graph.remove_node(node.node_id)
+            self._node_changed(node.node_id)
             return node
         except (AttributeError, nx.NetworkXError):
             raise WorkflowException('remove_node', 'Node does not exist in graph.')
@@ -285,8 +381,8 @@ class Workflow:
 
         Reads any stored data from preceding Nodes and passes in to
         'node_to_execute` as a list(). After execution, the new/updated
-        DataFrame is returned as a JSON object that is written to a new
-        file, with the file name saved to the executed Node.
+        data is handed to the Workflow's result store, with the returned
+        key saved to the executed Node.
 
         Returns:
             Executed Node object
@@ -302,6 +398,27 @@ class Workflow:
 
         flow_nodes = self.load_flow_nodes(node_to_execute.option_replace)
 
+        return self.execute_node(node_to_execute, preceding_data, flow_nodes)
+
+    def execute_node(self, node_to_execute, preceding_data, flow_nodes, execution_options=None, payload=None, timer=None):
+        """Execute an already constructed Node with the given inputs.
+
+        Shared by `execute()` and `WorkflowPlan`, which supplies Node objects
+        and resolved options built ahead of time.
+
+        Args:
+            node_to_execute: The Node to execute
+            preceding_data: list of predecessor data, see `load_input_data()`
+            flow_nodes: dict of FlowNodes, see `load_flow_nodes()`
+            execution_options: Pre-resolved options; computed if not given
+            payload: Message passed to `Node.read_payload()` instead of
+                executing on `preceding_data`
+            timer: Time passed to `Node.on_timer()` instead of executing
+                on `preceding_data`
+
+        Returns:
+            Executed Node object
+        """
         # We will use this flag to indicate successful execution
         execution_successful = True
         execution_failure_reason = ""
@@ -313,12 +430,22 @@ class Workflow:
         else:
             try:
                 # Validate input data, and replace flow variables
-                numberOfInputs = len(preceding_data)
-                node_to_execute.validate_input_data(numberOfInputs)
-                execution_options = node_to_execute.get_execution_options(self, flow_nodes)
-
-                # Pass in data to current Node to use in execution
-                output = node_to_execute.execute(preceding_data, execution_options)
+                if payload is None and timer is None:
+                    numberOfInputs = len(preceding_data)
+                    node_to_execute.validate_input_data(numberOfInputs)
+
+                if execution_options is None:
+                    execution_options = node_to_execute.get_execution_options(self, flow_nodes)
+
+                if timer is not None:
+                    # The Node's timer fired, e.g. to flush a time window
+                    output = node_to_execute.on_timer(timer, execution_options)
+                elif payload is not None:
+                    # Hand the injected message straight to the source Node
+                    output = node_to_execute.read_payload(payload, execution_options)
+                else:
+                    # Pass in data to current Node to use in execution
+                    output = node_to_execute.execute(preceding_data, execution_options)
 
             except ResourceWarning as e:
                 #We are using ResourceWarning when flows are correctly interrupted. 
@@ -333,28 +460,112 @@ class Workflow:
                 #raise e
 
         if execution_successful:
-            output_json_object = json.loads(output)
+            # Nodes may return a JSON string or an already decoded object
+            if isinstance(output, (str, bytes)):
+                output_json_object = json.loads(output)
+            else:
+                output_json_object = output
 
             # Update any Dynamic Input nodes with the new data
             if node_to_execute.name == 'Dynamic Input':
                 node_to_execute.option_values['default_value'] = output_json_object['value']
                 self.update_or_add_node(node_to_execute)
         else:
-            output_json_object = {
-                "meta": {
-                    "status": "rejected",
-                    "reason": execution_failure_reason
-                    }
-            }
+            output_json_object = Workflow.rejected_output(execution_failure_reason)
 
-        # Save new execution data to disk
-        node_to_execute.data = Workflow.store_node_data(self, node_id, json.dumps(output_json_object))
+        # Save new execution data to the result store
+        node_to_execute.data = Workflow.store_node_data(self, node_to_execute.node_id, output_json_object)
 
         if node_to_execute.data is None and node_to_execute.node_type != "flow_control":
             raise WorkflowException('execute', 'There was a problem saving node output.')
 
         return node_to_execute
 
+    def execute_node_batch(self, node_to_execute, batch, flow_nodes, execution_options=None, payloads=None):
+        """Execute a Node once for a batch of messages.
+
+        The batch counterpart of `execute_node()`: options are resolved once
+        and the Node's `execute_batch()` receives all messages, so it can
+        share setup between them. Messages rejected by previous Nodes are
+        passed through as rejected without executing.
+
+        Args:
+            node_to_execute: The Node to execute
+            batch: list with the predecessor data of each message
+            flow_nodes: dict of FlowNodes, see `load_flow_nodes()`
+            execution_options: Pre-resolved options; computed if not given
+            payloads: list of messages passed to `Node.read_payload()`, one
+                per message in `batch`
+
+        Returns:
+            list of output objects, one per message. The output of the last
+            message is also saved to the result store, as if the messages had
+            been executed one after another.
+        """
+        outputs = [None] * len(batch)
+        pending = list()
+
+        for index, preceding_data in enumerate(batch):
+            if len(self.find_rejected_proceding_data(preceding_data)) > 0:
+                outputs[index] = Workflow.rejected_output("Data rejected by previous nodes")
+            else:
+                pending.append(index)
+
+        if pending:
+            try:
+                # Validate input data, and replace flow variables
+                if payloads is None:
+                    node_to_execute.validate_input_data(len(batch[pending[0]]))
+
+                if execution_options is None:
+                    execution_options = node_to_execute.get_execution_options(self, flow_nodes)
+
+                if payloads is not None:
+                    results = list()
+                    for index in pending:
+                        try:
+                            results.append(node_to_execute.read_payload(payloads[index], execution_options))
+                        except (ResourceWarning, NodeException) as e:
+                            results.append(e)
+                else:
+                    results = node_to_execute.execute_batch([batch[index] for index in pending], execution_options)
+            except (ResourceWarning, NodeException) as e:
+                results = [e] * len(pending)
+
+            for index, output in zip(pending, results):
+                if isinstance(output, ResourceWarning):
+                    outputs[index] = Workflow.rejected_output(output.args)
+                elif isinstance(output, NodeException):
+                    outputs[index] = Workflow.rejected_output(output.reason)
+                elif isinstance(output, (str, bytes)):
+                    outputs[index] = json.loads(output)
+                else:
+                    outputs[index] = output
+
+                # Update any Dynamic Input nodes with the new data
+                if node_to_execute.name == 'Dynamic Input' and 'value' in outputs[index]:
+                    node_to_execute.option_values['default_value'] = outputs[index]['value']
+                    self.update_or_add_node(node_to_execute)
+
+        # Save the last message's data to the result store
+        if outputs:
+            node_to_execute.data = Workflow.store_node_data(self, node_to_execute.node_id, outputs[-1])
+
+            if node_to_execute.data is None and node_to_execute.node_type != "flow_control":
+                raise WorkflowException('execute', 'There was a problem saving node output.')
+
+        return outputs
+
+    @staticmethod
+    def rejected_output(reason):
+        """Output of a Node which did not process its input data."""
+        return {
+            "meta": {
+                "status": "rejected",
+                "reason": reason
+                }
+        }
+
     def find_rejected_proceding_data(self, preceding_data):
 
         '''
@@ -457,6 +668,18 @@ class Workflow:
 
         return input_data
 
+    def compile(self, max_concurrency=None):
+        """Compile the Workflow into a reusable WorkflowPlan.
+
+        Args:
+            max_concurrency: Maximum number of Nodes the plan runs at once,
+                see `WorkflowPlan.execute_async()`
+
+        Returns:
+            WorkflowPlan for the current state of the graph
+        """
+        return WorkflowPlan(self, max_concurrency)
+
     def execution_order(self):
         try:
             return list(nx.topological_sort(self.graph))
@@ -467,10 +690,24 @@ class Workflow:
 
     @staticmethod
     def upload_file(uploaded_file, to_open):
+        """Write an uploaded file to `to_open`, chunk by chunk.
+
+        Args:
+            uploaded_file: Django UploadedFile, or any binary file object
+            to_open: Path the file is written to
+
+        Returns:
+            `to_open`
+        """
         try:
-            # TODO: Change to a stream/other method for large files?
+            if hasattr(uploaded_file, 'chunks'):
+                chunks = uploaded_file.chunks()
+            else:
+                chunks = iter(lambda: uploaded_file.read(Workflow.FILE_CHUNK_SIZE), b'')
+
             with open(to_open, 'wb') as f:
-                f.write(uploaded_file.read())
+                for chunk in chunks:
+                    f.write(chunk)
 
             uploaded_file.close()
             return to_open
@@ -492,7 +729,7 @@ class Workflow:
 
             # Construct path to file in Workflow dir
             to_open = self.path(filename)
-            return open(to_open)
+            return open(to_open, 'rb')
         except KeyError:
             raise WorkflowException('download_file', '%s does not have an associated file' % node_id)
         except OSError as e:
@@ -502,53 +739,47 @@ class Workflow:
     def store_node_data(workflow, node_id, data):
         """Store Node data
 
-        Writes the current DataFrame to disk in JSON format.
+        Hands the Node output to the Workflow's result store.
 
         Args:
             workflow: The Workflow that stores the graph.
-            node_id: The Node which contains a DataFrame to save.
-            data: A pandas DataFrame converted to JSON.
+            node_id: The Node which produced the data.
+            data: JSON-like object returned by the Node.
 
         Returns:
-
+            Key to retrieve the data with, or None on failure.
         """
-        file_name = Workflow.generate_file_name(workflow, node_id)
-        file_path = workflow.path(file_name)
-
-        print(file_path)
         try:
-            with open(file_path, 'w') as f:
-                f.write(data)
-            return file_name
+            return workflow.store.put(workflow, node_id, data)
         except Exception as e:
             return None
 
     def retrieve_node_data(self, node_to_retrieve):
         """Retrieve Node data
 
-        Reads a saved DataFrame, referenced by the Node's 'data' attribute.
+        Reads the stored output referenced by the Node's 'data' attribute.
 
         Args:
-            node_to_retrieve: The Node containing a DataFrame saved to disk.
+            node_to_retrieve: The Node containing data in the result store.
 
         Returns:
-            Contents of the file (a DataFrame) in a JSON object.
+            Stored data, as a JSON-like object.
 
         Raises:
-            WorkflowException: Node does not exist, file does not exist, or
-                problem parsing the file.
+            WorkflowException: Node has not been executed, or problem
+                parsing the stored data.
         """
-        try:
-            with open(self.path(node_to_retrieve.data)) as f:
-                return json.load(f)
-        except OSError as e:
-            #instead of raising a WorkflowException('retrieve node data', str(e)) we will send back a readable error in the json
-            return {"error": "unable to load node data. try loading any inputs files and re-executing"}
-        except TypeError:
+        if node_to_retrieve.data is None:
             raise WorkflowException(
                 'retrieve node data',
                 'Node %s has not yet been executed. No data to retrieve.' % node_to_retrieve.node_id
             )
+
+        try:
+            return self.store.get(self, node_to_retrieve.data)
+        except (OSError, KeyError) as e:
+            #instead of raising a WorkflowException('retrieve node data', str(e)) we will send back a readable error in the json
+            return {"error": "unable to load node data. try loading any inputs files and re-executing"}
         except json.JSONDecodeError as e:
             raise WorkflowException('retrieve node data', str(e))
 
@@ -581,6 +812,95 @@ class Workflow:
         except json.JSONDecodeError as e:
             raise WorkflowException('retrieve node data by file', str(e))
 
+    def retrieve_node_rows(self, node_to_retrieve, offset=0, limit=None, query=None):
+        """Retrieve a page of Node data
+
+        Like `retrieve_node_data()`, but only reads rows `offset` to
+        `offset + limit` of the stored output (see `ResultStore.get_rows()`).
+
+        Args:
+            node_to_retrieve: The Node containing data in the result store.
+            offset: Number of rows to skip.
+            limit: Maximum number of rows to return, None for all rows.
+            query: JMESPath expression projecting each row, if any.
+
+        Returns:
+            dict-like with the 'rows' of the page, along with the 'offset',
+            'limit' and 'total' number of rows.
+
+        Raises:
+            WorkflowException: Node has not been executed, invalid `query`,
+                or problem parsing the stored data.
+        """
+        if node_to_retrieve.data is None:
+            raise WorkflowException(
+                'retrieve node data',
+                'Node %s has not yet been executed. No data to retrieve.' % node_to_retrieve.node_id
+            )
+
+        expression = Workflow.compile_row_query('retrieve node data', query)
+
+        try:
+            rows, total = self.store.get_rows(self, node_to_retrieve.data, offset, limit)
+        except (OSError, KeyError) as e:
+            return {"error": "unable to load node data. try loading any inputs files and re-executing"}
+        except json.JSONDecodeError as e:
+            raise WorkflowException('retrieve node data', str(e))
+
+        return Workflow.row_page('retrieve node data', rows, total, offset, limit, expression)
+
+    def retrieve_node_rows_by_file(self, file, offset=0, limit=None, query=None):
+        """Retrieve a page of Node data, referenced by the file.
+
+        See `retrieve_node_rows()`; the rows are read from the file with
+        `read_rows()`, i.e. without loading the whole file.
+
+        Raises:
+            WorkflowException: No file, invalid `query`, or problem parsing
+                the file.
+        """
+        if file is None:
+            raise WorkflowException(
+                'retrieve node data by file',
+                'Retrieving data for Node %s has not yet been executed. No file to retrieve.' % file
+            )
+
+        expression = Workflow.compile_row_query('retrieve node data by file', query)
+
+        try:
+            rows, total = read_rows(self.path(file), offset, limit)
+        except OSError as e:
+            return {"error": "unable to load node data by file. try loading any inputs files and re-executing"}
+        except json.JSONDecodeError as e:
+            raise WorkflowException('retrieve node data by file', str(e))
+
+        return Workflow.row_page('retrieve node data by file', rows, total, offset, limit, expression)
+
+    @staticmethod
+    def compile_row_query(action, query):
+        if query is None:
+            return None
+
+        try:
+            return compile_expression(query)
+        except jmespath.exceptions.JMESPathError as e:
+            raise WorkflowException(action, 'Invalid query: %s' % str(e))
+
+    @staticmethod
+    def row_page(action, rows, total, offset, limit, expression=None):
+        if expression is not None:
+            try:
+                rows = [expression.search(row) for row in rows]
+            except jmespath.exceptions.JMESPathError as e:
+                raise WorkflowException(action, 'Invalid query: %s' % str(e))
+
+        return {
+            'offset': offset,
+            'limit': limit,
+            'total': total,
+            'rows': rows,
+        }
+
     @staticmethod
     def read_graph_json(json_data):
         """Deserialize JSON NetworkX graph
@@ -609,11 +929,12 @@ class Workflow:
         return f"{workflow.name}-{node_id}"
 
     @classmethod
-    def from_json(cls, json_data):
+    def from_json(cls, json_data, store=None):
         """Load Workflow from JSON data.
 
         Args:
             json_data: JSON-like data from session, or uploaded file
+            store: ResultStore for Node output; in-memory if not specified
 
         Returns:
             New Workflow object
@@ -628,7 +949,7 @@ class Workflow:
             graph = Workflow.read_graph_json(json_data['graph'])
             flow_vars = Workflow.read_graph_json(json_data['flow_vars'])
 
-            return cls(name=name, root_dir=root_dir, graph=graph, flow_vars=flow_vars)
+            return cls(name=name, root_dir=root_dir, graph=graph, flow_vars=flow_vars, store=store)
         except KeyError as e:
             raise WorkflowException('from_json', str(e))
         except nx.NetworkXError as e:
@@ -652,6 +973,333 @@ class Workflow:
             raise WorkflowException('to_session_dict', str(e))
 
 
+class PackagedNodes:
+    """Catalogue of the Nodes in a Workflow's `node_dir`.
+
+    Attributes:
+        mtimes: Modification times of the Node directories it was built from
+        nodes: OrderedDict() of Nodes, see `Workflow.get_packaged_nodes()`
+        etag: Hash of `nodes`, which changes whenever the catalogue does
+    """
+    def __init__(self, mtimes, nodes):
+        self.mtimes = mtimes
+        self.nodes = nodes
+        self.etag = hashlib.sha1(json.dumps(nodes, default=str).encode()).hexdigest()
+
+
+class WorkflowPlan:
+    """Workflow compiled for repeated execution.
+
+    Running a flow once per incoming message would otherwise re-parse the
+    workflow, re-sort the graph and re-create every Node through the
+    `node_factory` each time. The plan does this once and keeps:
+
+        - the topological execution order
+        - a Node object per graph node
+        - the data predecessors and FlowNode bindings of each Node
+        - execution options, resolved on first use
+
+    Options are only cached for Nodes whose flow variables cannot change
+    during a run (i.e. are not fed by other Nodes, as with Dynamic Input).
+
+    Attributes:
+        workflow: The Workflow the plan was compiled from
+        execution_order: list of node ids, topologically sorted
+        nodes: dict of Node objects, indexed by node id
+        max_concurrency: Maximum number of Nodes run at once by
+            `execute_async()`
+    """
+
+    max_concurrency = 4
+
+    def __init__(self, workflow, max_concurrency=None):
+        self.workflow = workflow
+        self.execution_order = workflow.execution_order()
+        self.nodes = dict()
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self._predecessors = dict()
+        self._flow_nodes = dict()
+        self._dynamic = set()
+        self._execution_options = dict()
+        self._run_lock = None
+
+        for node_id in self.execution_order:
+            node = workflow.get_node(node_id)
+
+            if node is None:
+                raise WorkflowException('compile', 'Unable to create node %s' % node_id)
+
+            self.nodes[node_id] = node
+
+        for node_id, node in self.nodes.items():
+            self._predecessors[node_id] = [
+                predecessor_id for predecessor_id in workflow.get_node_predecessors(node_id)
+                if self.nodes[predecessor_id].node_type != 'flow_control'
+            ]
+            self._flow_nodes[node_id] = self._bind_flow_nodes(node)
+
+    def _bind_flow_nodes(self, node):
+        """Resolve a Node's flow variables to the FlowNode objects of the plan.
+
+        Local FlowNodes are shared with `self.nodes`, so values written by
+        executing a Dynamic Input node are seen by the Nodes that use it.
+        """
+        flow_nodes = dict()
+
+        for key, flow_node in self.workflow.load_flow_nodes(node.option_replace).items():
+            flow_node_id = flow_node.node_id
+
+            if not flow_node.is_global and flow_node_id in self.nodes:
+                flow_node = self.nodes[flow_node_id]
+
+                if self.workflow.get_node_predecessors(flow_node_id):
+                    self._dynamic.add(node.node_id)
+
+            flow_nodes[key] = flow_node
+
+        return flow_nodes
+
+    def get_node(self, node_id):
+        return self.nodes.get(node_id)
+
+    def set_option(self, node_id, key, value):
+        """Change a Node option, discarding its cached execution options."""
+        self.nodes[node_id].option_values[key] = value
+        self._execution_options.pop(node_id, None)
+
+    def execution_options(self, node_id):
+        if node_id in self._execution_options:
+            return self._execution_options[node_id]
+
+        node = self.nodes[node_id]
+        execution_options = node.get_execution_options(self.workflow, self._flow_nodes[node_id])
+
+        if node_id not in self._dynamic:
+            self._execution_options[node_id] = execution_options
+
+        return execution_options
+
+    def load_input_data(self, node_id):
+        """Construct list of predecessor data for a Node.
+
+        Like `Workflow.load_input_data()`, but using the plan's Node objects.
+        """
+        input_data = list()
+
+        for predecessor_id in self._predecessors[node_id]:
+            try:
+                input_data.append(self.workflow.retrieve_node_data(self.nodes[predecessor_id]))
+            except WorkflowException:
+                continue
+
+        return input_data
+
+    def execute(self, node_id, payload=None):
+        """Execute a single Node of the plan.
+
+        Args:
+            node_id: The Node to execute
+            payload: Decoded message to inject. Only passed on to source
+                Nodes that accept payloads; ignored for all other Nodes.
+
+        Returns:
+            Executed Node object
+        """
+        return self.workflow.execute_node(*self._prepare(node_id, payload))
+
+    def _prepare(self, node_id, payload):
+        """Arguments to `Workflow.execute_node()` for a Node of the plan."""
+        node_to_execute = self.nodes.get(node_id)
+
+        if node_to_execute is None:
+            raise WorkflowException('execute', 'The workflow does not contain node %s' % node_id)
+
+        if not getattr(node_to_execute, 'accepts_payload', False):
+            payload = None
+
+        preceding_data = self.load_input_data(node_id)
+
+        # Resolve options up-front only when there is data to execute with
+        execution_options = None
+        if not self.workflow.find_rejected_proceding_data(preceding_data):
+            execution_options = self.execution_options(node_id)
+
+        return node_to_execute, preceding_data, self._flow_nodes[node_id], execution_options, payload
+
+    async def execute_async(self, payload=None, max_concurrency=None, executor=None):
+        """Execute every Node of the plan, running independent branches concurrently.
+
+        A Node starts as soon as all of its predecessors have executed, with
+        at most `max_concurrency` Nodes running at once. Nodes that make
+        blocking calls (marked with a `blocking` attribute, e.g. the cloud
+        writers) run in a thread pool; all other Nodes run directly on the
+        event loop.
+
+        Runs of the same plan do not overlap, as Node output is stored per
+        Node: a second call waits until the first has finished.
+
+        Args:
+            payload: Decoded message to inject, see `execute()`
+            max_concurrency: Overrides the plan's `max_concurrency`
+            executor: concurrent.futures.Executor for blocking Nodes;
+                the event loop's default executor if not given
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._get_run_lock():
+            await self._schedule(loop, payload, max_concurrency or self.max_concurrency, executor)
+
+    async def execute_batch_async(self, payloads, executor=None):
+        """`execute_batch()` run in a thread pool, off the event loop.
+
+        A batch runs its Nodes one after the other, cloud writers included,
+        so the whole batch is handed to `executor`; connections, timers and
+        other flows keep being served meanwhile. Like `execute_async()`, it
+        waits for any other run of this plan to finish first.
+
+        Args:
+            payloads: list of decoded messages, see `execute_batch()`
+            executor: concurrent.futures.Executor to run the batch in; the
+                event loop's default executor if not given
+
+        Returns:
+            dict of output lists, see `execute_batch()`
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._get_run_lock():
+            return await loop.run_in_executor(executor, self.execute_batch, payloads)
+
+    def _get_run_lock(self):
+        loop = asyncio.get_running_loop()
+
+        if self._run_lock is None or self._run_lock[0] is not loop:
+            self._run_lock = (loop, asyncio.Lock())
+
+        return self._run_lock[1]
+
+    def timed_nodes(self):
+        """Ids of the Nodes which use timers, see `Node.next_timer()`."""
+        return [node_id for node_id in self.execution_order if getattr(self.nodes[node_id], 'timed', False)]
+
+    def next_timer(self, node_id, now):
+        """Time at which a timed Node next wants to run, or None."""
+        return self.nodes[node_id].next_timer(self.execution_options(node_id), now)
+
+    async def execute_timer(self, node_id, now, max_concurrency=None, executor=None):
+        """Run a timed Node's timer, then the Nodes that depend on it.
+
+        Nodes downstream of `node_id` execute as in `execute_async()`, on the
+        output of the timer; all other Nodes keep their previous output.
+        Waits for any run of the plan in progress to finish first.
+
+        Args:
+            node_id: Node whose timer fired
+            now: Current time, passed to `Node.on_timer()`
+            max_concurrency: Overrides the plan's `max_concurrency`
+            executor: concurrent.futures.Executor for blocking Nodes
+        """
+        loop = asyncio.get_running_loop()
+
+        async with self._get_run_lock():
+            node_to_execute = self.nodes[node_id]
+            arguments = (node_to_execute, list(), self._flow_nodes[node_id], self.execution_options(node_id), None, now)
+
+            if getattr(node_to_execute, 'blocking', False):
+                await loop.run_in_executor(executor, self.workflow.execute_node, *arguments)
+            else:
+                self.workflow.execute_node(*arguments)
+
+            descendants = nx.descendants(self.workflow.graph, node_id)
+            await self._schedule(loop, None, max_concurrency or self.max_concurrency, executor, descendants)
+
+    async def _schedule(self, loop, payload, max_concurrency, executor, node_ids=None):
+        """Run the Nodes of the plan, or only `node_ids`, as their inputs are ready."""
+        running = asyncio.Semaphore(max_concurrency)
+
+        if node_ids is None:
+            node_ids = set(self.execution_order)
+
+        waiting_for = {
+            node_id: len([
+                predecessor_id for predecessor_id in self.workflow.get_node_predecessors(node_id)
+                if predecessor_id in node_ids
+            ])
+            for node_id in self.execution_order if node_id in node_ids
+        }
+
+        async def run(node_id, tasks):
+            async with running:
+                # Inputs and options are resolved on the event loop thread
+                arguments = self._prepare(node_id, payload)
+
+                if getattr(self.nodes[node_id], 'blocking', False):
+                    await loop.run_in_executor(executor, self.workflow.execute_node, *arguments)
+                else:
+                    self.workflow.execute_node(*arguments)
+
+            for successor_id in self.workflow.get_node_successors(node_id):
+                if successor_id not in waiting_for:
+                    continue
+                waiting_for[successor_id] -= 1
+                if waiting_for[successor_id] == 0:
+                    tasks.create_task(run(successor_id, tasks))
+
+        try:
+            async with asyncio.TaskGroup() as tasks:
+                for node_id, count in list(waiting_for.items()):
+                    if count == 0:
+                        tasks.create_task(run(node_id, tasks))
+        except ExceptionGroup as e:
+            # The first failure cancels the other Nodes; report it as-is
+            raise e.exceptions[0]
+
+    def execute_batch(self, payloads):
+        """Run the whole flow over a list of messages in one pass.
+
+        Each Node is executed once for all messages (see
+        `Workflow.execute_node_batch()`), instead of running the flow once per
+        message. Flows with Dynamic Input nodes, whose values may change from
+        one message to the next, are run message by message instead.
+
+        Args:
+            payloads: list of decoded messages to inject into source Nodes
+
+        Returns:
+            dict of output lists (one output per message), indexed by node id
+        """
+        if self._dynamic:
+            outputs = {node_id: list() for node_id in self.execution_order}
+            for payload in payloads:
+                for node_id in self.execution_order:
+                    node = self.execute(node_id, payload)
+                    outputs[node_id].append(self.workflow.retrieve_node_data(node))
+            return outputs
+
+        outputs = dict()
+
+        for node_id in self.execution_order:
+            node_to_execute = self.nodes[node_id]
+
+            batch = [
+                [outputs[predecessor_id][index] for predecessor_id in self._predecessors[node_id]]
+                for index in range(len(payloads))
+            ]
+
+            node_payloads = payloads if getattr(node_to_execute, 'accepts_payload', False) else None
+
+            # Resolve options up-front only when there is data to execute with
+            execution_options = None
+            if any(not self.workflow.find_rejected_proceding_data(preceding_data) for preceding_data in batch):
+                execution_options = self.execution_options(node_id)
+
+            outputs[node_id] = self.workflow.execute_node_batch(node_to_execute, batch, self._flow_nodes[node_id],
+                                                                execution_options, node_payloads)
+
+        return outputs
+
+
 class WorkflowUtils:
     @staticmethod
     def get_display_name(file):
@@ -660,6 +1308,21 @@ class WorkflowUtils:
         else:
             return file.replace('_', ' ').title()
 
+    @staticmethod
+    def get_dir_mtimes(dir_path):
+        """Modification times of `dir_path` and its sub-directories.
+
+        Raises:
+            OSError: `dir_path` cannot be read
+        """
+        mtimes = [('', os.stat(dir_path).st_mtime_ns)]
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    mtimes.append((entry.name, entry.stat().st_mtime_ns))
+
+        return tuple(sorted(mtimes))
+
     @staticmethod
     def set_dir(dir_path, custom_nodes=False):
         """Makes directories to ensure path is valid.
@@ -737,7 +1400,8 @@ class WorkflowUtils:
 
         # Parse module for Node Class information
         for name, klass in inspect.getmembers(module):
-            if inspect.isclass(klass) and klass.__module__.startswith('matterflow.nodes.' + node_type):
+            if (inspect.isclass(klass) and issubclass(klass, Node)
+                    and klass.__module__.startswith('matterflow.nodes.' + node_type)):
                 try:
                     color = klass.color
                 except AttributeError:
@@ -6,4 +6,5 @@ setup(name='matterflow',
       author='',
       license='MIT',
       packages=['matterflow'],
+      package_data={'matterflow': ['nodes/manipulation/clusters.json']},
       zip_safe=False)
\ No newline at end of file
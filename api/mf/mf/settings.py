@@ -98,6 +98,9 @@ DATABASES = {
 # MEDIA_ROOT is either '/data' or '/tmp'
 MEDIA_ROOT = DIR_PATH
 
+# Workflows are parsed in memory; larger workflow files are rejected
+MAX_WORKFLOW_SIZE = int(os.getenv('MAX_WORKFLOW_SIZE') or 50 * 1024 * 1024)
+
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
 
@@ -0,0 +1,185 @@
+from matterflow import Workflow, WorkflowException, NodeException
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import threading
+import uuid
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class Job:
+    """Execution of a Node, run by the JobManager's worker pool.
+
+    The Node is executed on a copy of the session's Workflow, so requests
+    can keep using (and changing) the Workflow while the job runs. The
+    result is applied to the session's Workflow by `apply()`, at the
+    latest on the session's next request (see `JobManager.apply_finished`).
+
+    Attributes:
+        job_id: Unique id of the job
+        session_key: Session which submitted the job
+        node_id: The Node to execute
+        status: One of PENDING, RUNNING, DONE or FAILED
+        data_file: Key of the Node output in the result store, once DONE
+        option_values: Options the execution changed, e.g. the value of a
+            Dynamic Input, once DONE
+        error: dict of action -> reason, once FAILED
+        version: Incremented on every change of `status`
+    """
+    def __init__(self, session_key, workflow, node_id):
+        self.job_id = uuid.uuid4().hex
+        self.session_key = session_key
+        self.node_id = node_id
+        self.status = PENDING
+        self.data_file = None
+        self.option_values = dict()
+        self.error = None
+        self.version = 0
+        self.applied = False
+
+        # Snapshot of the Workflow, sharing its result store
+        self._workflow = Workflow.from_json(workflow.to_session_dict(), store=workflow.store)
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def run(self):
+        self._set_status(RUNNING)
+
+        try:
+            node = self._workflow.get_node(self.node_id)
+            original_options = dict(node.option_values) if node is not None else dict()
+
+            executed_node = self._workflow.execute(self.node_id)
+            self.data_file = executed_node.data
+            self.option_values = {
+                key: value for key, value in executed_node.option_values.items()
+                if original_options.get(key) != value
+            }
+            self._set_status(DONE)
+        except (NodeException, WorkflowException) as e:
+            self.error = {e.action: e.reason}
+            self._set_status(FAILED)
+        except Exception as e:
+            self.error = {'execute node': str(e)}
+            self._set_status(FAILED)
+
+    def _set_status(self, status):
+        with self._changed:
+            self.status = status
+            self.version += 1
+            self._changed.notify_all()
+
+    def wait(self, version, timeout=None):
+        """Wait until the job changed since `version`, or `timeout`.
+
+        Returns:
+            The current version of the job.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def apply(self, workflow):
+        """Store the output of a finished job in the Workflow's Node.
+
+        Only the Node's 'data' and the options the execution changed are
+        updated, keeping other changes made to the Node while the job ran.
+        Each job is applied once.
+        """
+        if self.status != DONE or self.applied:
+            return
+
+        node = workflow.get_node(self.node_id)
+        if node is not None:
+            node.data = self.data_file
+            node.option_values.update(self.option_values)
+            workflow.update_or_add_node(node)
+
+        self.applied = True
+
+    def to_json(self):
+        return {
+            'job_id': self.job_id,
+            'node_id': self.node_id,
+            'status': self.status,
+            'data_file': self.data_file,
+            'error': self.error,
+        }
+
+
+class JobManager:
+    """Runs Jobs in a pool of worker threads and keeps track of them.
+
+    Finished jobs are kept until `history_size` newer jobs were submitted,
+    so clients can still retrieve the result. Jobs still pending or running,
+    and results not yet applied to the session's Workflow, are always kept.
+    """
+    # Number of Nodes executed at once
+    max_workers = 4
+
+    # Maximum number of jobs kept
+    history_size = 256
+
+    def __init__(self):
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def submit(self, session_key, workflow, node_id):
+        job = Job(session_key, workflow, node_id)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='matterflow-job')
+
+            self._jobs[job.job_id] = job
+            self._evict()
+
+        self._executor.submit(job.run)
+        return job
+
+    def _evict(self):
+        """Drop the oldest failed or applied jobs over `history_size`."""
+        excess = len(self._jobs) - self.history_size
+        if excess <= 0:
+            return
+
+        evicted = [job.job_id for job in self._jobs.values() if job.status == FAILED or job.applied]
+        for job_id in evicted[:excess]:
+            del self._jobs[job_id]
+
+    def apply_finished(self, session_key, workflow):
+        """Apply the results of the session's finished jobs to `workflow`.
+
+        Called for every request of the session, so results reach the
+        Workflow (and are saved) even if the client only followed the
+        `job_events` stream.
+        """
+        with self._lock:
+            finished = [
+                job for job in self._jobs.values()
+                if job.session_key == session_key and job.status == DONE and not job.applied
+            ]
+
+        for job in finished:
+            job.apply(workflow)
+
+    def get(self, session_key, job_id):
+        """Job `job_id` of the session, or None if unknown."""
+        job = self._jobs.get(job_id)
+        if job is None or job.session_key != session_key:
+            return None
+
+        return job
+
+
+# Jobs of this process
+jobs = JobManager()
@@ -1,3 +1,44 @@
-from django.test import TestCase
+import networkx as nx
+from django.test import SimpleTestCase
+from matterflow import Workflow
 
-# Create your tests here.
+from .jobs import Job, JobManager, PENDING, RUNNING, DONE, FAILED
+
+
+class JobManagerTests(SimpleTestCase):
+    def setUp(self):
+        self.workflow = Workflow(name='test-flow', root_dir='/tmp', graph=nx.DiGraph())
+        self.manager = JobManager()
+        self.manager.history_size = 2
+
+    def tearDown(self):
+        if self.manager._executor is not None:
+            self.manager._executor.shutdown()
+
+    def add_job(self, status, applied=False):
+        job = Job('session', self.workflow, '1')
+        job.status = status
+        job.applied = applied
+        self.manager._jobs[job.job_id] = job
+        return job
+
+    def test_evict_only_failed_or_applied_jobs(self):
+        pending = self.add_job(PENDING)
+        applied = self.add_job(DONE, applied=True)
+        running = self.add_job(RUNNING)
+        failed = self.add_job(FAILED)
+        done = self.add_job(DONE)
+
+        submitted = self.manager.submit('session', self.workflow, '1')
+
+        for job in (pending, running, done, submitted):
+            self.assertIs(self.manager.get('session', job.job_id), job)
+        for job in (applied, failed):
+            self.assertIsNone(self.manager.get('session', job.job_id))
+
+    def test_evict_oldest_jobs(self):
+        failed = [self.add_job(FAILED) for _ in range(3)]
+
+        submitted = self.manager.submit('session', self.workflow, '1')
+
+        self.assertEqual(list(self.manager._jobs), [failed[2].job_id, submitted.job_id])
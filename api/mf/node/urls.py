@@ -3,9 +3,12 @@ from . import views
 
 urlpatterns = [
     path('', views.node, name='node'),
+    path('jobs/<str:job_id>', views.job_status, name='job status'),
+    path('jobs/<str:job_id>/events', views.job_events, name='job events'),
     path('<str:node_id>', views.handle_node, name='handle node'),
     path('global/<str:node_id>', views.handle_node, name='handle node'),
     path('<str:node_id>/execute', views.execute_node, name='execute node'),
+    path('<str:node_id>/jobs', views.submit_job, name='submit job'),
     path('<str:node_id>/retrieve_data', views.retrieve_data, name='retrieve data'),
     path('<str:node_id>/retrieve_data_by_file/<str:file>', views.retrieve_data_by_file, name='retrieve data by file'),
     path('edge/<str:node_from_id>/<str:node_to_id>', views.handle_edge, name='handle edge')
@@ -1,10 +1,27 @@
 import json
 
-from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
 from matterflow import Workflow, WorkflowException, Node, NodeException, node_factory, ParameterValidationError
 from rest_framework.decorators import api_view
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from .jobs import jobs, DONE, FAILED
+
+# Query parameters selecting a page of rows of Node data
+ROW_PAGE_PARAMETERS = [
+    openapi.Parameter('offset', openapi.IN_QUERY, description='Number of rows to skip', type=openapi.TYPE_INTEGER),
+    openapi.Parameter('limit', openapi.IN_QUERY, description='Maximum number of rows', type=openapi.TYPE_INTEGER),
+    openapi.Parameter('query', openapi.IN_QUERY, description='JMESPath expression applied to each row',
+                      type=openapi.TYPE_STRING),
+]
+
+# Seconds between keep-alive comments of job event streams
+JOB_EVENTS_KEEPALIVE = 15
+
 
 @swagger_auto_schema(method='post',
                      operation_summary='Add a node to the graph',
@@ -243,32 +260,182 @@ def execute_node(request, node_id):
         return JsonResponse({e.action: e.reason}, status=500)
 
 
+@swagger_auto_schema(method='post',
+                     operation_summary='Start executing a node in the graph.',
+                     operation_description='Submits a job executing a node in the graph, and returns its id.',
+                     responses={
+                         202: 'Execution job submitted',
+                         404: 'Workflow not created yet/Workflow does not contain specified node'
+                     })
+@api_view(['POST'])
+def submit_job(request, node_id):
+    """Execute the specified node in the background
+
+    Returns at once with the job, which a worker executes like
+    `execute_node`. Clients follow the job through `job_status`, or the
+    `job_events` stream. The output of a finished job is saved to the
+    Workflow by the session's next request.
+    """
+    if request.matterflow.get_node(node_id) is None:
+        return JsonResponse({'message': 'The workflow does not contain node %s' % node_id}, status=404)
+
+    if request.session.session_key is None:
+        request.session.save()
+
+    try:
+        job = jobs.submit(request.session.session_key, request.matterflow, node_id)
+    except WorkflowException as e:
+        return JsonResponse({e.action: e.reason}, status=500)
+
+    return JsonResponse(job.to_json(), status=202)
+
+
+@swagger_auto_schema(method='get',
+                     operation_summary='Gets the status of a node execution job.',
+                     operation_description='Retrieves the status, and once finished the result, of a job.',
+                     responses={
+                         200: 'Job status',
+                         404: 'Job not found'
+                     })
+@api_view(['GET'])
+def job_status(request, job_id):
+    job = jobs.get(request.session.session_key, job_id)
+    if job is None:
+        return JsonResponse({'message': 'Job %s not found' % job_id}, status=404)
+
+    # Save the executed Node's data to the Workflow, as execute_node does
+    job.apply(request.matterflow)
+
+    return JsonResponse(job.to_json(), safe=False)
+
+
+@require_GET
+def job_events(request, job_id):
+    """Server-sent events with the status of a node execution job.
+
+    An event named after the status is sent on every change, with the
+    job's JSON as data, until the job finished. Not an `api_view`, as
+    EventSource clients only accept 'text/event-stream'.
+    """
+    job = jobs.get(request.session.session_key, job_id)
+    if job is None:
+        return JsonResponse({'message': 'Job %s not found' % job_id}, status=404)
+
+    # Each server type only streams its own kind of iterator
+    if isinstance(request, ASGIRequest):
+        stream = async_job_events(job)
+    else:
+        stream = sync_job_events(job)
+
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def next_job_event(job, version):
+    """Wait for the next event of `job`, after `version`.
+
+    Returns:
+        tuple of (version, event, True if it is the last event)
+    """
+    current = job.wait(version, JOB_EVENTS_KEEPALIVE)
+    if current == version:
+        return version, ': keepalive\n\n', False
+
+    data = job.to_json()
+    event = 'event: %s\ndata: %s\n\n' % (data['status'], json.dumps(data))
+    return current, event, data['status'] in (DONE, FAILED)
+
+
+def sync_job_events(job):
+    version, last = None, False
+    while not last:
+        version, event, last = next_job_event(job, version)
+        yield event
+
+
+async def async_job_events(job):
+    version, last = None, False
+    while not last:
+        version, event, last = await sync_to_async(next_job_event, thread_sensitive=False)(job, version)
+        yield event
+
+
+def get_row_page(request):
+    """Paging parameters of a request for Node data.
+
+    Returns:
+        dict of 'offset', 'limit' and 'query' to pass to the Workflow, or
+        None if the request asks for all the data.
+
+    Raises:
+        ValueError: 'offset' or 'limit' is not a non-negative integer
+    """
+    params = request.GET
+    if not any(param in params for param in ('offset', 'limit', 'query')):
+        return None
+
+    try:
+        offset = int(params.get('offset', 0))
+        limit = int(params['limit']) if 'limit' in params else None
+    except ValueError:
+        raise ValueError('offset and limit must be integers')
+
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError('offset and limit must not be negative')
+
+    return {'offset': offset, 'limit': limit, 'query': params.get('query')}
+
+
 @swagger_auto_schema(method='get',
                      operation_summary='Gets the data frame at the executed node.',
-                     operation_description='Retrieves the state of data at that point in the graph.',
+                     operation_description='Retrieves the state of data at that point in the graph. '
+                                           'With offset, limit or query, retrieves a page of its rows.',
+                     manual_parameters=ROW_PAGE_PARAMETERS,
                      responses={
-                         200: 'Data successfully retrieved'
+                         200: 'Data successfully retrieved',
+                         400: 'Invalid offset or limit'
                      })
 @api_view(['GET'])
 def retrieve_data(request, node_id):
+    try:
+        page = get_row_page(request)
+    except ValueError as e:
+        return JsonResponse({'retrieve data': str(e)}, status=400)
+
     try:
         node_to_retrieve = request.matterflow.get_node(node_id)
-        data = request.matterflow.retrieve_node_data(node_to_retrieve)
+        if page is None:
+            data = request.matterflow.retrieve_node_data(node_to_retrieve)
+        else:
+            data = request.matterflow.retrieve_node_rows(node_to_retrieve, **page)
         return JsonResponse(data, safe=False, status=200)
     except WorkflowException as e:
         return JsonResponse({e.action: e.reason}, status=500)
 
 @swagger_auto_schema(method='get',
                      operation_summary='Gets the data frame by file name.',
-                     operation_description='Retrieves the data by file.',
+                     operation_description='Retrieves the data by file. '
+                                           'With offset, limit or query, retrieves a page of its rows.',
+                     manual_parameters=ROW_PAGE_PARAMETERS,
                      responses={
-                         200: 'Data successfully retrieved'
+                         200: 'Data successfully retrieved',
+                         400: 'Invalid offset or limit'
                      })
 @api_view(['GET'])
 def retrieve_data_by_file(request, node_id, file):
+    try:
+        page = get_row_page(request)
+    except ValueError as e:
+        return JsonResponse({'retrieve data by file': str(e)}, status=400)
+
     try:
         print(node_id)
-        data = request.matterflow.retrieve_node_data_by_file(node_id, file)
+        if page is None:
+            data = request.matterflow.retrieve_node_data_by_file(node_id, file)
+        else:
+            data = request.matterflow.retrieve_node_rows_by_file(file, **page)
         return JsonResponse(data, safe=False, status=200)
     except WorkflowException as e:
         return JsonResponse({e.action: e.reason}, status=500)
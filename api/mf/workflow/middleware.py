@@ -1,16 +1,49 @@
-from matterflow import Workflow, WorkflowException
+from matterflow import Workflow, WorkflowException, FileResultStore
 from django.http import JsonResponse
+from node.jobs import jobs
+from collections import OrderedDict
+import threading
+import uuid
+
+# Session key of the revision of the Workflow stored in the session
+REVISION_KEY = 'workflow_revision'
+
+
+class CachedWorkflow:
+    """Workflow of a session, kept in-process between requests.
+
+    Attributes:
+        revision: Revision of the session data the Workflow matches
+        workflow: The Workflow, shared by requests of the session
+        lock: Held while a request uses `workflow`
+    """
+    def __init__(self, revision, workflow):
+        self.revision = revision
+        self.workflow = workflow
+        self.lock = threading.RLock()
 
 
 class WorkflowMiddleware:
     """ Custom middleware
 
     https://docs.djangoproject.com/en/3.0/topics/http/middleware/
+
+    Workflows are cached by session, so requests do not rebuild the graphs
+    from the session. Each save to the session stores a new revision; a
+    cached Workflow is only used while the session holds its revision,
+    i.e. was not changed by another process. The open/new/activate views
+    replace the Workflow in the session, so the next request re-parses it.
+    The session is only saved when a view modified the Workflow.
     """
+    # Maximum number of sessions whose Workflow is cached
+    cache_size = 64
+
     def __init__(self, get_response):
         self.get_response = get_response
 
         # One-time configuration and initialization.
+        self._workflows = OrderedDict()
+        self._lock = threading.Lock()
 
     def __call__(self, request):
         # Code executed each request before view (and later middleware) called
@@ -19,30 +52,104 @@ class WorkflowMiddleware:
 
         if not path.startswith('/workflow/') and not path.startswith('/node/'):
             # Workflow needed only for /workflow and /node routes
-            pass
+            return self.get_response(request)
         elif path == '/workflow/open' or path == '/workflow/new' or path == '/workflow/activate':
             # 'open' loads from file upload, 'new' inits new Workflow
-            pass               
-        else:
-            # All other cases, load workflow from session
-            try:
-                request.matterflow = Workflow.from_json(request.session)
+            response = self.get_response(request)
+
+            # The views store the new Workflow in the session; the next
+            # request loads it from there, instead of the cached one
+            self.forget_workflow(request.session)
+
+            return response
 
-                # Check if a graph is present
-                if request.matterflow.graph is None:
-                    return JsonResponse({
-                        'message': 'A workflow has not been created yet.'
-                    }, status=404)
+        # All other cases, load workflow from session. Node output is
+        # kept on disk so it can be retrieved by later requests.
+        cached = self.get_cached_workflow(request.session)
+
+        if cached is None:
+            try:
+                request.matterflow = Workflow.from_json(request.session, store=FileResultStore())
             except WorkflowException as e:
                 return JsonResponse({e.action: e.reason}, status=500)
 
+            return self.process_workflow(request, request.matterflow, cached=False)
+
+        # Requests of the same session take turns using the cached Workflow
+        with cached.lock:
+            request.matterflow = cached.workflow
+            return self.process_workflow(request, cached.workflow, cached=True)
+
+    def process_workflow(self, request, workflow, cached):
+        # Check if a graph is present
+        if workflow.graph is None:
+            return JsonResponse({
+                'message': 'A workflow has not been created yet.'
+            }, status=404)
+
+        # Results of background jobs (see node.jobs) finished since the
+        # last request; applying them marks the Workflow as modified
+        if request.session.session_key is not None:
+            jobs.apply_finished(request.session.session_key, workflow)
+
         response = self.get_response(request)
 
         # Code executed for each request/response after the view is called
 
-        # Request should have 'matterflow' attribute, but do not crash if not
-        if hasattr(request, 'matterflow'):
-            # Save Workflow back to session
-            request.session.update(request.matterflow.to_session_dict())
+        # Save Workflow back to session, unless the view only read it
+        current = getattr(request, 'matterflow', None)
+        if current is not workflow or workflow.modified or REVISION_KEY not in request.session:
+            if current is not None:
+                self.save_workflow(request.session, current)
+        elif not cached:
+            self.cache_workflow(request.session, workflow)
 
         return response
+
+    def get_cached_workflow(self, session):
+        """CachedWorkflow matching the session's revision, if any."""
+        revision = session.get(REVISION_KEY)
+        if revision is None or session.session_key is None:
+            return None
+
+        with self._lock:
+            cached = self._workflows.get(session.session_key)
+            if cached is None or cached.revision != revision:
+                return None
+
+            self._workflows.move_to_end(session.session_key)
+            return cached
+
+    def cache_workflow(self, session, workflow):
+        revision = session.get(REVISION_KEY)
+        if revision is None or session.session_key is None:
+            return
+
+        with self._lock:
+            cached = self._workflows.get(session.session_key)
+            if cached is not None and cached.workflow is workflow:
+                # Keep the lock other requests may be waiting on
+                cached.revision = revision
+            else:
+                self._workflows[session.session_key] = CachedWorkflow(revision, workflow)
+
+            self._workflows.move_to_end(session.session_key)
+            while len(self._workflows) > self.cache_size:
+                self._workflows.popitem(last=False)
+
+    def forget_workflow(self, session):
+        """Drop the session's revision, and its cached Workflow."""
+        session.pop(REVISION_KEY, None)
+        if session.session_key is None:
+            return
+
+        with self._lock:
+            self._workflows.pop(session.session_key, None)
+
+    def save_workflow(self, session, workflow):
+        """Store the Workflow in the session under a new revision."""
+        session.update(workflow.to_session_dict())
+        session[REVISION_KEY] = uuid.uuid4().hex
+        workflow.modified = False
+
+        self.cache_workflow(session, workflow)
@@ -1,3 +1,102 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
 
-# Create your tests here.
+import networkx as nx
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from matterflow import Workflow, node_factory
+
+TABLE_NODE = {
+    "name": "Table Creator",
+    "node_id": "1",
+    "node_type": "io",
+    "node_key": "TableCreatorNode",
+    "is_global": False,
+    "options": {
+        "input": "a,b\n1,2\n3,4\n",
+    },
+}
+
+TABLE_DATA = {'a': {'0': 1, '1': 3}, 'b': {'0': 2, '1': 4}}
+
+
+class WorkflowMiddlewareTests(TestCase):
+    def setUp(self):
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root_dir.cleanup)
+
+        settings = override_settings(MEDIA_ROOT=self.root_dir.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        # Start a session with a cached Workflow, replaced by the tests
+        response = self.client.post('/workflow/new', {'id': 'start'}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get('/workflow/globals')
+        self.assertEqual(response.status_code, 200)
+
+    def test_new_execute_retrieve_data(self):
+        response = self.client.post('/workflow/new', {'id': 'test-flow'}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post('/node/', TABLE_NODE, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assert_execute_retrieve_data('1')
+
+    def test_open_execute_retrieve_data(self):
+        upload = SimpleUploadedFile('test-flow.json', self.workflow_json().encode())
+
+        response = self.client.post('/workflow/open', {'file': upload})
+        self.assertEqual(response.status_code, 200)
+
+        self.assert_execute_retrieve_data('1')
+
+    def test_activate_execute_retrieve_data(self):
+        response = self.client.post('/workflow/activate', {'data': {'json_data': self.workflow_json()}},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assert_execute_retrieve_data('1')
+
+    def test_workflow_too_large(self):
+        workflow_json = self.workflow_json()
+
+        with self.settings(MAX_WORKFLOW_SIZE=len(workflow_json) - 1):
+            upload = SimpleUploadedFile('test-flow.json', workflow_json.encode())
+            response = self.client.post('/workflow/open', {'file': upload})
+            self.assertEqual(response.status_code, 413)
+
+            response = self.client.post('/workflow/activate', {'data': {'json_data': workflow_json}},
+                                        content_type='application/json')
+            self.assertEqual(response.status_code, 413)
+
+        # The Workflow of the session is unchanged
+        response = self.client.get('/node/1/execute')
+        self.assertEqual(response.status_code, 500)
+
+    def workflow_json(self):
+        workflow = Workflow(name='test-flow', root_dir=self.root_dir.name, graph=nx.DiGraph())
+        workflow.update_or_add_node(node_factory(TABLE_NODE))
+
+        return json.dumps({
+            'react': {},
+            'matterflow': workflow.to_session_dict(),
+        })
+
+    def assert_execute_retrieve_data(self, node_id):
+        response = self.client.get('/node/%s/execute' % node_id)
+        self.assertEqual(response.status_code, 200)
+        data_file = response.json()['data_file']
+
+        # Output of the Workflow built by the view is written to disk
+        self.assertTrue(os.path.exists(os.path.join(self.root_dir.name, data_file)))
+
+        response = self.client.get('/node/%s/retrieve_data' % node_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), TABLE_DATA)
+
+        response = self.client.get('/node/%s/retrieve_data_by_file/%s' % (node_id, data_file))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), TABLE_DATA)
@@ -2,10 +2,12 @@ import os
 import json
 import sys
 
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, FileResponse
 from django.conf import settings
+from django.views.decorators.http import condition
 from rest_framework.decorators import api_view
-from matterflow import Workflow, WorkflowException
+from matterflow import Workflow, WorkflowException, FileResultStore
+from matterflow.node_factory import get_custom_node_class
 from drf_yasg.utils import swagger_auto_schema
 
 from modulefinder import ModuleFinder
@@ -30,20 +32,41 @@ def new_workflow(request):
         workflow_id = json.loads(request.body)
 
         # Create new Workflow
-        request.matterflow = Workflow(name=workflow_id['id'], root_dir=settings.MEDIA_ROOT)
+        request.matterflow = Workflow(name=workflow_id['id'], root_dir=settings.MEDIA_ROOT, store=FileResultStore())
         request.session.update(request.matterflow.to_session_dict())
 
         return JsonResponse(Workflow.to_graph_json(request.matterflow.graph))
     except (json.JSONDecodeError, KeyError) as e:
         return JsonResponse({'No React model ID provided': str(e)}, status=500)
 
+
+def load_workflow_json(f, size=None):
+    """Parse the JSON document read from file-like `f`.
+
+    Workflows are parsed in memory, so at most MAX_WORKFLOW_SIZE bytes are
+    read; `size`, if known, rejects larger documents without reading them.
+
+    Returns:
+        The parsed JSON, or None if the document is too large.
+    """
+    if size is not None and size > settings.MAX_WORKFLOW_SIZE:
+        return None
+
+    data = f.read(settings.MAX_WORKFLOW_SIZE + 1)
+    if len(data) > settings.MAX_WORKFLOW_SIZE:
+        return None
+
+    return json.loads(data)
+
+
 @swagger_auto_schema(method='post',
                      operation_summary='Activates a workflow from db.',
                      operation_description='Loads a JSON file from db and translates into Workflow object and JSON object of front-end',
                      responses={
                          200: 'Workflow representation in JSON',
                          400: 'No file specified',
-                         404: 'File specified not found or not JSON graph'
+                         404: 'File specified not found or not JSON graph',
+                         413: 'Workflow larger than MAX_WORKFLOW_SIZE'
                      })
 @api_view(['POST'])
 def activate_workflow(request):
@@ -73,17 +96,18 @@ def activate_workflow(request):
         200 - JSON response with data.
         400 - No file specified
         404 - File specified not found, or not JSON graph
+        413 - Workflow larger than MAX_WORKFLOW_SIZE bytes
         500 - Missing JSON data or
     """
     
     try:
-        # TODO: file is parsed into JSON in memory;
-        #       may want to save to 'fs' for large files
-        #if we have a file upload
-        uploaded_json = request.body
-        flow_json_string = json.loads(uploaded_json)['data']['json_data']
+        request_json = load_workflow_json(request, int(request.META.get('CONTENT_LENGTH') or 0))
+        if request_json is None:
+            return JsonResponse({'activate_workflow': 'Workflow is too large'}, status=413)
+
+        flow_json_string = request_json['data']['json_data']
         combined_json = json.loads(flow_json_string)
-        request.matterflow = Workflow.from_json(combined_json['matterflow'])
+        request.matterflow = Workflow.from_json(combined_json['matterflow'], store=FileResultStore())
         request.session.update(request.matterflow.to_session_dict())
 
         # Send back front-end workflow
@@ -103,7 +127,8 @@ def activate_workflow(request):
                      responses={
                          200: 'Workflow representation in JSON',
                          400: 'No file specified',
-                         404: 'File specified not found or not JSON graph'
+                         404: 'File specified not found or not JSON graph',
+                         413: 'Workflow larger than MAX_WORKFLOW_SIZE'
                      })
 @api_view(['POST'])
 def open_workflow(request):
@@ -133,17 +158,18 @@ def open_workflow(request):
         200 - JSON response with data.
         400 - No file specified
         404 - File specified not found, or not JSON graph
+        413 - Workflow larger than MAX_WORKFLOW_SIZE bytes
         500 - Missing JSON data or
     """
     
     try:
-        # TODO: file is parsed into JSON in memory;
-        #       may want to save to 'fs' for large files
         #if we have a file upload
         uploaded_file = request.FILES.get('file')
-        combined_json = json.load(uploaded_file)
+        combined_json = load_workflow_json(uploaded_file, uploaded_file.size)
+        if combined_json is None:
+            return JsonResponse({'open_workflow': 'Workflow is too large'}, status=413)
 
-        request.matterflow = Workflow.from_json(combined_json['matterflow'])
+        request.matterflow = Workflow.from_json(combined_json['matterflow'], store=FileResultStore())
         request.session.update(request.matterflow.to_session_dict())
 
         # Send back front-end workflow
@@ -373,22 +399,39 @@ def upload_file(request):
     except WorkflowException as e:
         return JsonResponse({e.action: e.reason}, status=500)
 
+    if node_id is None:
+        # Import the new version of the custom node on next use
+        module_name, _ = os.path.splitext(f.name)
+        sys.modules.pop(f'matterflow.nodes.custom_nodes.{module_name}', None)
+        get_custom_node_class.cache_clear()
+        Workflow.clear_packaged_nodes(request.matterflow.node_dir)
+
     return JsonResponse({"filename": save_name}, status=201, safe=False)
 
 
+def packaged_nodes_etag(request):
+    packaged = request.matterflow.packaged_nodes()
+    return None if packaged is None else packaged.etag
+
+
 @swagger_auto_schema(method='get',
                      operation_summary='Retrieve a list of installed Nodes',
                      operation_description='Retrieves a list of installed Nodes, in JSON.',
                      responses={
                          200: 'List of installed Nodes, in JSON',
+                         304: 'List of installed Nodes not modified',
                      })
 @api_view(['GET'])
+@condition(etag_func=packaged_nodes_etag)
 def retrieve_nodes_for_user(request):
     """Assembles list of Nodes accessible to workflows.
 
     Retrieve a list of classes from the Node module in `matterflow`.
     List is split into 'types' (e.g., 'IO' and 'Manipulation') and
     'keys', or individual command Nodes (e.g., 'ReadCsv', 'Pivot').
+
+    The list is cached by the Workflow and sent with an ETag, so clients
+    sending it back in 'If-None-Match' get a 304 while it is unchanged.
     """
     data = request.matterflow.get_packaged_nodes()
     return JsonResponse(data, safe=False)
@@ -417,13 +460,9 @@ def download_file(request):
         else:
             content = "application/octet-stream"
 
-        # Construct response
-        response = HttpResponse(content_type=content)
+        # Stream the file; it is closed once the response is sent
+        response = FileResponse(f, content_type=content)
         response['Content-Disposition'] = os.path.basename(f.name)
-        response.write(f.read())
-
-        # File not opened with `with`; need to close
-        f.close()
         return response
     except OSError:
         return JsonResponse({"message": "Could not find or read file"},